@@ -0,0 +1,6 @@
+"""
+Benchmarks over the University Physics workloads.
+
+  python -m benchmarks run --output results.json
+  python -m benchmarks compare baseline.json results.json
+"""
@@ -0,0 +1,71 @@
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.cases import CASES  # noqa: E402
+from benchmarks.harness import DEFAULT_SOLVERS, SOLVERS, compare, load, run, save  # noqa: E402
+
+
+def _print_result(result):
+    if result["status"] == "ok":
+        correct = {True: "", False: "  WRONG", None: ""}[result.get("correct")]
+        print(
+            f"{result['case']:<28} {result['solver']:<12} "
+            f"{result['wall_median']:8.3f}s {result['peak_memory'] / 1e6:8.1f}MB"
+            f"  solve={result['calls'].get('solve', 0)}"
+            f" simplify={result['calls'].get('simplify', 0)}{correct}"
+        )
+    else:
+        print(f"{result['case']:<28} {result['solver']:<12}    error  {result['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmark cases")
+    run_parser.add_argument("--case", action="append", choices=sorted(CASES), help="case to run (default: all)")
+    run_parser.add_argument("--solver", action="append", choices=sorted(SOLVERS), help=f"solver to run (default: {' '.join(DEFAULT_SOLVERS)})")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--output", "-o", help="write JSON results here")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown to flag (default 0.25)")
+    compare_parser.add_argument("--min-delta", type=float, default=0.01, help="ignore slowdowns below this many seconds")
+
+    commands.add_parser("list", help="list benchmark cases")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, bench in CASES.items():
+            print(f"{name:<28} {bench.source}")
+        return 0
+
+    if args.command == "run":
+        results = run(
+            cases=args.case,
+            solvers=args.solver or DEFAULT_SOLVERS,
+            repeat=args.repeat,
+            progress=_print_result,
+        )
+        if args.output:
+            save(results, args.output)
+        return 0
+
+    regressions = compare(load(args.old), load(args.new), threshold=args.threshold, min_delta=args.min_delta)
+    for line in regressions:
+        print(line)
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+cases.py
+
+Benchmark cases built from the University Physics examples (examples/up)
+and the tests/test_up_example_* workloads.
+
+A case builds (equations, values, want) from scratch every time, so a run
+never sees symbols or caches left behind by another case. `expected` holds
+the numeric value of every solution branch, sorted, when it is known.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import sympy as sp
+
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs
+from combine_equations.kinematics_states import (
+    kinematics_fundamental,
+    magnitude_and_angle_equations,
+    make_states_model,
+)
+from combine_equations.misc import eq_flat
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    build: Callable
+    expected: tuple[float, ...] | None = None
+    source: str = ""
+
+
+CASES: dict[str, BenchmarkCase] = {}
+
+
+def case(name, expected=None, source=""):
+    def register(build):
+        CASES[name] = BenchmarkCase(
+            name=name,
+            build=build,
+            expected=tuple(expected) if expected is not None else None,
+            source=source,
+        )
+        return build
+    return register
+
+
+# ----------------------------------------------------------------------
+# Example 2.6: coin dropped from the Leaning Tower of Pisa
+# ----------------------------------------------------------------------
+
+def _coin():
+    c = make_states_model("c", 2)
+    c0, c1 = c.states
+    c01 = c.edges[0]
+
+    eqs = kinematics_fundamental(c, axes=("y",))
+    eqs += eq_flat(
+        c0.t, 0,
+        c0.vel.y, 0,
+        c0.pos.y, 0,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+
+    values = {c01.a.y: -9.8, c1.t: 3.0}
+    return eqs, values, c1
+
+@case("up-2.6-position", expected=[-44.1], source="examples/up/ch2/up-example-2.6")
+def _coin_position():
+    eqs, values, c1 = _coin()
+    return eqs, values, c1.pos.y
+
+
+# ----------------------------------------------------------------------
+# Example 3.6: motorcycle leaving a cliff
+# ----------------------------------------------------------------------
+
+def _motorcycle():
+    m = make_states_model("m", 2)
+    m0, m1 = m.states
+    m01 = m.edges[0]
+
+    eqs = kinematics_fundamental(m, axes=["x", "y"])
+
+    g = sp.symbols("g")
+    eqs += eq_flat(
+        m0.pos.x, 0,
+        m0.pos.y, 0,
+        m01.a.x, 0,
+        m01.a.y, -g,
+        m0.t, 0,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+
+    values = {
+        m0.vel.x: 9.0,
+        m0.vel.y: 0.0,
+        m1.vel.x: 9.0,
+        g: 9.8,
+        m1.t: 0.50,
+    }
+    return eqs, values, m1
+
+@case("up-3.6-position", expected=[-1.225], source="tests/test_up_example_3_6.py")
+def _motorcycle_position():
+    eqs, values, m1 = _motorcycle()
+    return eqs, values, m1.pos.y
+
+@case("up-3.6-distance", expected=[4.66375653309647], source="tests/test_up_example_3_6.py")
+def _motorcycle_distance():
+    eqs, values, m1 = _motorcycle()
+    dist = sp.symbols("dist")
+    eqs = eqs + eq_flat(dist, sp.sqrt(m1.pos.x**2 + m1.pos.y**2))
+    return eqs, values, dist
+
+@case("up-3.6-velocity-angle", expected=[-0.498567905638218], source="tests/test_up_example_3_6.py")
+def _motorcycle_velocity_angle():
+    eqs, values, m1 = _motorcycle()
+    vel_mag, vel_angle = sp.symbols("vel_mag vel_angle")
+    eqs = eqs + eq_flat(
+        vel_mag, sp.sqrt(m1.vel.x**2 + m1.vel.y**2),
+        vel_angle, sp.atan2(m1.vel.y, m1.vel.x),
+    )
+    return eqs, values, vel_angle
+
+
+# ----------------------------------------------------------------------
+# Example 3.7: projectile launched at 37 m/s, 53.1 degrees
+# ----------------------------------------------------------------------
+
+def _projectile():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+
+    g = sp.symbols("g")
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b0.pos.y, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+
+    b0_vel_mag, b0_vel_angle = sp.symbols("b0_vel_mag b0_vel_angle")
+    eqs += eq_flat(
+        b0.vel.x, b0_vel_mag * sp.cos(b0_vel_angle),
+        b0.vel.y, b0_vel_mag * sp.sin(b0_vel_angle),
+    )
+
+    values = {
+        g: 9.81,
+        b0_vel_mag: 37.0,
+        b0_vel_angle: math.radians(53.1),
+    }
+    return eqs, values, b1
+
+@case("up-3.7-position-at-t", expected=[39.5566647280447], source="tests/test_up_example_3_7.py")
+def _projectile_position_at_t():
+    eqs, values, b1 = _projectile()
+    values[b1.t] = 2.0
+    return eqs, values, b1.pos.y
+
+@case("up-3.7-highest-point", expected=[44.6212748258844], source="tests/test_up_example_3_7.py")
+def _projectile_highest_point():
+    eqs, values, b1 = _projectile()
+    eqs = eqs + eq_flat(b1.vel.y, 0)
+    return eqs, values, b1.pos.y
+
+@case("up-3.7-range", expected=[134.010403230554], source="tests/test_up_example_3_7.py")
+def _projectile_range():
+    eqs, values, b1 = _projectile()
+    eqs = eqs + eq_flat(b1.pos.y, 0)
+    return eqs, values, b1.pos.x
+
+
+@case("up-3.7-range-substituted", expected=[134.010403230554], source="tests/test_up_example_3_7.py")
+def _projectile_range_substituted():
+    # The float knowns substituted into the equations before solving, as
+    # the test does.
+    eqs, values, want = _projectile_range()
+    return [eq.subs(values) for eq in eqs], values, want
+
+
+# ----------------------------------------------------------------------
+# Example 3.9: ball thrown from a window
+# ----------------------------------------------------------------------
+
+@case("up-3.9-range", expected=[-15.7161745661753, 9.16380341748480], source="tests/test_up_example_3_9_v2.py")
+def _window_throw_range():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+
+    g = sp.symbols("g")
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+        b1.pos.y, 0,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+    eqs += magnitude_and_angle_equations(b0)
+
+    values = {
+        g: 9.81,
+        b0.pos.y: 8.0,
+        b0.vel.mag: 10.0,
+        b0.vel.angle: math.radians(-20.0),
+    }
+    return eqs, values, b1.pos.x
+
+@case("up-3.9-range-substituted", expected=[-15.7161745661753, 9.16380341748480], source="tests/test_up_example_3_9_v2.py")
+def _window_throw_range_substituted():
+    eqs, values, want = _window_throw_range()
+    return [eq.subs(values) for eq in eqs], values, want
+
+
+# ----------------------------------------------------------------------
+# Example 4.7: truck making an emergency stop
+# ----------------------------------------------------------------------
+
+@case("up-4.7-acceleration", expected=[-7.3274693877551], source="examples/up/ch4/up-example-4.7")
+def _truck_acceleration():
+    w, m, g, F_x, a_x = sp.symbols("w m g F_x a_x")
+    eqs = eq_flat(
+        w,   m * g,
+        F_x, m * a_x,
+    )
+    values = {w: 2.45e4, F_x: -1.83e4, g: 9.81}
+    return eqs, values, a_x
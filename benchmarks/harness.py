@@ -0,0 +1,216 @@
+"""
+harness.py
+
+Runs benchmark cases against the solver versions and compares result
+files.
+
+Each (case, solver) pair is timed `repeat` times with SymPy's cache and
+the isolation cache cleared before every run, so repeats measure the same
+work. Peak memory (tracemalloc) and the per-phase call counts
+(instrumentation events) come from one extra profiled run; both would
+distort the timings otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import sympy as sp
+from sympy.core.cache import clear_cache
+
+from combine_equations.instrumentation import EventRecorder, instrument
+from combine_equations.isolation import clear_isolation_cache
+from combine_equations.solve_and_display import _solve_version
+from combine_equations.solve_system import solve_with_elimination_attempts
+
+from benchmarks.cases import CASES
+
+
+def _version(version):
+    def solve(equations, values, want):
+        return _solve_version(equations, values, want, version)
+    return solve
+
+def _groebner(equations, values, want):
+    return solve_with_elimination_attempts(equations, values, want, backend="groebner")
+
+def _beam(equations, values, want):
+    return solve_with_elimination_attempts(equations, values, want, search="beam")
+
+def _rationalized(mode):
+    def solve(equations, values, want):
+        return solve_with_elimination_attempts(equations, values, want, rationalize=mode)
+    return solve
+
+SOLVERS = {
+    "v0": _version(0),
+    "v1": _version(1),
+    "v2": _version(2),
+    "blocks": _version(3),
+    # v2 with the Gröbner elimination backend; falls back to substitution
+    # (v2) for systems that aren't polynomial in the unknowns.
+    "groebner": _groebner,
+    "beam": _beam,
+    # v2 with float knowns made exact / kept as placeholders; compare
+    # against v2 on the *-substituted cases.
+    "v2-rational": _rationalized(True),
+    "v2-symbolic": _rationalized("symbolic"),
+}
+
+DEFAULT_SOLVERS = ("v0", "v1", "v2", "groebner")
+
+
+def _numeric(solutions, values):
+    out = []
+    for sol in solutions:
+        value = sp.N(sol.rhs.subs(values))
+        try:
+            value = complex(value)
+        except (TypeError, ValueError):
+            out.append(str(value))
+            continue
+        if abs(value.imag) > 1e-12 * max(1.0, abs(value.real)):
+            out.append(str(value))
+        else:
+            out.append(value.real)
+    return sorted(out, key=lambda v: (isinstance(v, str), v))
+
+def _matches(numeric, expected, rel=1e-6):
+    if expected is None:
+        return None
+    if len(numeric) != len(expected) or any(isinstance(v, str) for v in numeric):
+        return False
+    return all(
+        abs(a - b) <= rel * max(1.0, abs(b))
+        for a, b in zip(numeric, expected)
+    )
+
+def _clear_caches():
+    clear_cache()
+    clear_isolation_cache()
+
+def _attempt(solve, bench, timed=None):
+    # Building the case (eliminate_zero_eqs, ...) isn't part of the solve.
+    equations, values, want = bench.build()
+    _clear_caches()
+    start = time.perf_counter()
+    try:
+        solutions = solve(equations, values, want)
+    except Exception as err:
+        solutions, error = None, f"{type(err).__name__}: {err}"
+    else:
+        error = None
+    if timed is not None:
+        timed.append(time.perf_counter() - start)
+    return solutions, values, error
+
+
+def run_case(bench, solver, repeat=3):
+    solve = SOLVERS[solver]
+    result = {"case": bench.name, "solver": solver}
+
+    wall = []
+    solutions = values = error = None
+    for _ in range(repeat):
+        solutions, values, error = _attempt(solve, bench, timed=wall)
+        if error is not None:
+            break
+
+    equations, case_values, want = bench.build()
+    _clear_caches()
+    recorder = EventRecorder()
+    tracemalloc.start()
+    try:
+        with instrument(recorder):
+            try:
+                solve(equations, case_values, want)
+            except Exception:
+                pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    summary = recorder.summary()
+
+    result.update(
+        status="error" if error is not None else "ok",
+        error=error,
+        wall=wall,
+        wall_min=min(wall),
+        wall_median=statistics.median(wall),
+        peak_memory=peak,
+        calls={name: entry["calls"] for name, entry in sorted(summary["phases"].items())},
+    )
+    if error is None:
+        numeric = _numeric(solutions, values)
+        result["solutions"] = numeric
+        result["correct"] = _matches(numeric, bench.expected)
+    return result
+
+
+def run(cases=None, solvers=DEFAULT_SOLVERS, repeat=3, progress=None):
+    cases = list(cases) if cases else list(CASES)
+    results = []
+    for name in cases:
+        for solver in solvers:
+            result = run_case(CASES[name], solver, repeat=repeat)
+            if progress is not None:
+                progress(result)
+            results.append(result)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sympy": sp.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old, new, threshold=0.25, min_delta=0.01):
+    """
+    Regressions of `new` against `old` (both run() outputs):
+    - a case that solved (or solved correctly) before and doesn't now
+    - median wall time up by more than `threshold` (relative) and
+      `min_delta` seconds
+    - peak memory up by more than `threshold`
+    """
+    before = {(r["case"], r["solver"]): r for r in old["results"]}
+    regressions = []
+    for r in new["results"]:
+        key = (r["case"], r["solver"])
+        prev = before.get(key)
+        if prev is None:
+            continue
+        label = f"{r['case']} [{r['solver']}]"
+
+        if prev["status"] == "ok" and r["status"] != "ok":
+            regressions.append(f"{label}: now fails ({r['error']})")
+            continue
+        if prev.get("correct") and r.get("correct") is False:
+            regressions.append(f"{label}: wrong solutions {r['solutions']}")
+        if r["status"] != "ok" or prev["status"] != "ok":
+            continue
+
+        old_t, new_t = prev["wall_median"], r["wall_median"]
+        if new_t > old_t * (1 + threshold) and new_t - old_t > min_delta:
+            regressions.append(f"{label}: wall time {old_t:.3f}s -> {new_t:.3f}s")
+
+        old_m, new_m = prev["peak_memory"], r["peak_memory"]
+        if new_m > old_m * (1 + threshold):
+            regressions.append(f"{label}: peak memory {old_m / 1e6:.1f}MB -> {new_m / 1e6:.1f}MB")
+    return regressions
+
+
+def save(results, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+
+def load(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
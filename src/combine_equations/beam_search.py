@@ -0,0 +1,189 @@
+"""
+beam_search.py
+
+Cost-guided search over elimination orders.
+
+The greedy loop in solve_with_elimination_attempts commits to one fixed
+ordering and gives up when that order fails. Here each depth keeps the
+`beam_width` cheapest partial elimination states, where a state's cost is
+
+  total count_ops + UNKNOWN_WEIGHT * unknowns + DEGREE_WEIGHT * degree in want
+
+(degree: highest polynomial degree of `want` over the equations that
+contain it; NONPOLYNOMIAL_DEGREE when one isn't polynomial in `want`).
+
+The greedy walk runs first, so problems it already solves cost the same
+as before; the beam only starts where greedy gives up, and never retries
+an equation set whose solve already failed. Within the beam, states are
+tried cheapest first. Children are scored from a cheap preview (cheapest
+isolation, xreplace, no simplify); only the ones that make it into the
+beam are eliminated for real. States already reached through another
+order (a then b vs b then a) are skipped; a state is identified by its
+simplified equations and remaining unknowns, not by the preview.
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+
+from combine_equations.eliminate_variable_subst import eliminate_variable_subst
+from combine_equations.instrumentation import count, expression_size
+from combine_equations.isolation import isolate
+from combine_equations.solve_system import (
+    _elimination_candidates,
+    connected_unknowns,
+    solve_system_multiple_solutions,
+)
+
+
+UNKNOWN_WEIGHT = 10
+DEGREE_WEIGHT = 20
+NONPOLYNOMIAL_DEGREE = 5
+
+
+def _degree_in(eqs, want):
+    degree = 0
+    for eq in eqs:
+        if want not in getattr(eq, "free_symbols", set()):
+            continue
+        expr = eq.lhs - eq.rhs if isinstance(eq, sp.Equality) else eq
+        if not expr.is_polynomial(want):
+            return NONPOLYNOMIAL_DEGREE
+        degree = max(degree, sp.degree(expr, want))
+    return degree
+
+def state_cost(eqs, values, want):
+    unknowns = connected_unknowns(eqs, values, want)
+    return (
+        expression_size(eqs)
+        + UNKNOWN_WEIGHT * len(unknowns)
+        + DEGREE_WEIGHT * _degree_in(eqs, want)
+    )
+
+
+def _preview(eqs, sym):
+    """
+    Cheap look at eliminating `sym`: the cheapest isolation, substituted
+    with xreplace and not simplified. None when `sym` can't be isolated.
+    """
+    best = None
+    for eq in eqs:
+        if not isinstance(eq, sp.Equality) or sym not in eq.free_symbols:
+            continue
+        try:
+            sols = isolate(eq, sym)
+        except Exception:
+            continue
+        for sol in sols:
+            sol = sp.sympify(sol)
+            if sym in sol.free_symbols:
+                continue
+            ops = sp.count_ops(sol)
+            if best is None or ops < best[0]:
+                best = (ops, sol)
+    if best is None:
+        return None
+    return [eq.xreplace({sym: best[1]}) for eq in eqs]
+
+
+def _state_key(eqs, values, want):
+    return (
+        tuple(sorted(sp.srepr(eq) for eq in eqs)),
+        tuple(sorted(str(u) for u in connected_unknowns(eqs, values, want))),
+    )
+
+
+def _search(
+    equations, values, want, max_elims, width, scored, failed, check_knowns, method, max_growth, max_ops,
+):
+    beam = [(list(equations), [])]
+    visited = {_state_key(equations, values, want)}
+    last_err = None
+
+    for depth in range(max_elims + 1):
+        children = []
+        for eqs, path in beam:
+            key = frozenset(eqs)
+            if key not in failed:
+                try:
+                    solutions = solve_system_multiple_solutions(
+                        eqs, values, want, check_knowns=check_knowns, method=method,
+                    )
+                    return solutions, path, None
+                except Exception as err:
+                    failed.add(key)
+                    last_err = err
+
+            if depth == max_elims:
+                continue
+
+            for rank, sym in enumerate(_elimination_candidates(eqs, values, want)):
+                if not scored:
+                    children.append((0, rank, eqs, path, sym))
+                    continue
+                # Score from a cheap preview; only the children that make
+                # it into the beam pay for the real (simplifying)
+                # elimination.
+                preview = _preview(eqs, sym)
+                if preview is None:
+                    continue
+                children.append((state_cost(preview, values, want), rank, eqs, path, sym))
+
+        # On equal cost the greedy order wins.
+        children.sort(key=lambda child: child[:2])
+
+        beam = []
+        for _, _, eqs, path, sym in children:
+            if len(beam) == width:
+                break
+            new_eqs, replacement = eliminate_variable_subst(
+                eqs, sym, max_growth=max_growth, max_ops=max_ops,
+            )
+            if replacement is None:
+                continue
+            if any(sym in getattr(eq, "free_symbols", set()) for eq in new_eqs):
+                continue
+            state = _state_key(new_eqs, values, want)
+            if state in visited:
+                count("beam_revisits")
+                continue
+            visited.add(state)
+            beam.append((new_eqs, path + [(sym, replacement)]))
+
+        if not beam:
+            break
+
+    return None, None, last_err
+
+
+def solve_with_beam_search(
+    equations,
+    values,
+    want,
+    max_elims=10,
+    beam_width=3,
+    check_knowns=False,
+    method="full",
+    max_growth=None,
+    max_ops=None,
+):
+    """
+    Returns (solutions, eliminations) for the first state that solves.
+    max_growth / max_ops guard each elimination as in the greedy loop.
+    """
+    failed = set()
+    last_err = None
+    # The greedy walk first: problems it solves cost exactly what they
+    # did. Its failed solves are remembered and not retried by the beam.
+    for width, scored in ((1, False), (beam_width, True)):
+        solutions, path, err = _search(
+            equations, values, want, max_elims, width, scored, failed, check_knowns, method,
+            max_growth, max_ops,
+        )
+        if solutions is not None:
+            return solutions, path
+        last_err = err or last_err
+
+    if last_err is not None:
+        raise last_err
+    raise ValueError("No solutions found.")
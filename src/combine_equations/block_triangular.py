@@ -0,0 +1,298 @@
+"""
+block_triangular.py
+
+Block-triangular (Dulmage-Mendelsohn style) decomposition of an
+equation/unknown incidence structure.
+
+Only the structure is handled here: each equation is described by the
+unknowns it contains. A maximum bipartite matching pairs equations with
+unknowns, and Tarjan's SCC algorithm on the matched pairs splits the system
+into the smallest strongly-coupled blocks, ordered so that every block only
+depends on blocks that come before it.
+
+The solver that walks the blocks lives in solve_system.py.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Hashable, Sequence
+
+
+@dataclass(frozen=True)
+class Block:
+    """
+    One block of the decomposition.
+
+    kind:
+      "square" - as many equations as unknowns (the common 1x1 / 2x2 case)
+      "under"  - underdetermined remainder; solved jointly and last
+    """
+    equations: tuple[int, ...]
+    unknowns: tuple
+    depends_on: tuple[int, ...]
+    kind: str = "square"
+
+
+@dataclass(frozen=True)
+class Check:
+    """A redundant (unmatched) equation, used to filter solution branches."""
+    equation: int
+    unknowns: tuple
+    depends_on: tuple[int, ...]
+
+
+@dataclass
+class BlockDecomposition:
+    blocks: list[Block]
+    checks: list[Check]
+    block_of: dict = field(default_factory=dict)  # unknown -> block index
+
+    def needed_for(self, want) -> tuple[list[int], list[int]]:
+        """
+        Return (block indices, check indices) required to determine `want`,
+        in solve order.
+        """
+        if want not in self.block_of:
+            return [], []
+
+        needed: set[int] = set()
+
+        def close(start):
+            pending = [start]
+            while pending:
+                idx = pending.pop()
+                if idx in needed:
+                    continue
+                needed.add(idx)
+                pending.extend(self.blocks[idx].depends_on)
+
+        close(self.block_of[want])
+
+        # Checks can reject branches of the needed blocks, so pull in
+        # whatever they depend on as well.
+        checks: set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for idx, check in enumerate(self.checks):
+                if idx in checks:
+                    continue
+                if not any(self.block_of[u] in needed for u in check.unknowns):
+                    continue
+                checks.add(idx)
+                for dep in check.depends_on:
+                    if dep not in needed:
+                        close(dep)
+                        changed = True
+
+        return sorted(needed), sorted(checks)
+
+
+@dataclass
+class SolvedBlock:
+    """Record of how one block was solved (returned with return_blocks=True)."""
+    unknowns: tuple
+    equations: list
+    kind: str
+    branches: int
+    path: str = "solve"   # "solve", "linear-lu" or "linear-numeric"
+
+
+def maximum_matching(incidence: Sequence[Sequence[Hashable]]) -> dict[int, Hashable]:
+    """
+    Maximum bipartite matching between equations (by index) and unknowns.
+
+    Uses augmenting paths (Kuhn's algorithm) with an explicit stack so that
+    large systems don't hit the recursion limit.
+    """
+    match_eq: dict[int, Hashable] = {}
+    match_unknown: dict[Hashable, int] = {}
+
+    # Cheap greedy pass first; most kinematics equations match trivially.
+    for eq, unknowns in enumerate(incidence):
+        for u in unknowns:
+            if u not in match_unknown:
+                match_eq[eq] = u
+                match_unknown[u] = eq
+                break
+
+    for root in range(len(incidence)):
+        if root in match_eq:
+            continue
+
+        seen = set()
+        stack = [(root, iter(incidence[root]))]
+        via = []
+
+        while stack:
+            eq, it = stack[-1]
+            for u in it:
+                if u in seen:
+                    continue
+                seen.add(u)
+                other = match_unknown.get(u)
+                if other is None:
+                    chosen = u
+                    for k in range(len(stack) - 1, -1, -1):
+                        e = stack[k][0]
+                        match_eq[e] = chosen
+                        match_unknown[chosen] = e
+                        if k:
+                            chosen = via[k - 1]
+                    stack = []
+                    break
+                via.append(u)
+                stack.append((other, iter(incidence[other])))
+                break
+            else:
+                stack.pop()
+                if via:
+                    via.pop()
+
+    return match_eq
+
+
+def strongly_connected_components(nodes, successors) -> list[list]:
+    """
+    Tarjan's algorithm (iterative).
+
+    Components are returned so that every component comes after all the
+    components reachable from it, i.e. dependencies first when edges point
+    from a node to what it depends on.
+    """
+    index: dict = {}
+    low: dict = {}
+    on_stack: set = set()
+    stack: list = []
+    result: list[list] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+
+        while work:
+            node, it = work[-1]
+            for nxt in it:
+                if nxt not in index:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(successors[nxt])))
+                    break
+                if nxt in on_stack:
+                    low[node] = min(low[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.discard(w)
+                        component.append(w)
+                        if w == node:
+                            break
+                    result.append(sorted(component))
+
+    return result
+
+
+def block_triangular_decomposition(incidence: Sequence[Sequence[Hashable]]) -> BlockDecomposition:
+    """
+    Split a system into blocks.
+
+    `incidence[i]` lists the unknowns appearing in equation i. The order of
+    the lists is respected, so pass them in a deterministic order.
+    """
+    n = len(incidence)
+    match_eq = maximum_matching(incidence)
+    match_unknown = {u: e for e, u in match_eq.items()}
+
+    containing: dict[Hashable, list[int]] = {}
+    for eq, unknowns in enumerate(incidence):
+        for u in unknowns:
+            containing.setdefault(u, []).append(eq)
+
+    # Underdetermined part: everything reachable by alternating paths from
+    # an unmatched unknown.
+    under_eqs: set[int] = set()
+    under_unknowns: list = []
+    pending = [u for u in containing if u not in match_unknown]
+    seen = set(pending)
+    while pending:
+        u = pending.pop()
+        under_unknowns.append(u)
+        for eq in containing[u]:
+            if eq in under_eqs:
+                continue
+            under_eqs.add(eq)
+            matched = match_eq.get(eq)
+            if matched is not None and matched not in seen:
+                seen.add(matched)
+                pending.append(matched)
+
+    matched_eqs = [eq for eq in range(n) if eq in match_eq and eq not in under_eqs]
+
+    successors = {}
+    for eq in matched_eqs:
+        own = match_eq[eq]
+        successors[eq] = [
+            match_unknown[u] for u in incidence[eq]
+            if u != own and match_unknown.get(u) is not None
+        ]
+
+    components = strongly_connected_components(matched_eqs, successors)
+
+    block_of_eq: dict[int, int] = {}
+    for idx, component in enumerate(components):
+        for eq in component:
+            block_of_eq[eq] = idx
+
+    blocks: list[Block] = []
+    block_of: dict = {}
+    for idx, component in enumerate(components):
+        deps = sorted({block_of_eq[d] for eq in component for d in successors[eq]} - {idx})
+        unknowns = tuple(match_eq[eq] for eq in component)
+        blocks.append(Block(equations=tuple(component), unknowns=unknowns, depends_on=tuple(deps)))
+        for u in unknowns:
+            block_of[u] = idx
+
+    if under_eqs or under_unknowns:
+        idx = len(blocks)
+        ordered = []
+        for eq in sorted(under_eqs):
+            for u in incidence[eq]:
+                if u not in block_of and u not in ordered:
+                    ordered.append(u)
+        deps = sorted({
+            block_of[u] for eq in under_eqs for u in incidence[eq] if u in block_of
+        })
+        blocks.append(Block(
+            equations=tuple(sorted(under_eqs)),
+            unknowns=tuple(ordered),
+            depends_on=tuple(deps),
+            kind="under",
+        ))
+        for u in ordered:
+            block_of[u] = idx
+
+    checks = []
+    for eq in range(n):
+        if eq in match_eq or eq in under_eqs:
+            continue
+        unknowns = tuple(incidence[eq])
+        deps = sorted({block_of[u] for u in unknowns})
+        checks.append(Check(equation=eq, unknowns=unknowns, depends_on=tuple(deps)))
+
+    return BlockDecomposition(blocks=blocks, checks=checks, block_of=block_of)
@@ -0,0 +1,121 @@
+"""
+branching.py
+
+Elimination search that keeps every root.
+
+solve_with_elimination_attempts eliminates one candidate at a time and
+keeps the cheapest root of each isolation, so the other branch of e.g. a
+quadratic in time is silently lost. Here every elimination forks the
+system once per root (eliminate_variable_branches); each fork is carried
+forward as its own system and solved independently. Forks share the
+equations the elimination didn't touch.
+
+The frontier of open branches is expanded level by level; with
+workers > 1 each level is spread over a process pool.
+
+Every solution comes with its branch path: the (symbol, replacement)
+eliminations that led to it.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import sympy as sp
+
+from combine_equations.eliminate_variable_subst import eliminate_variable_branches
+from combine_equations.instrumentation import count, emit
+from combine_equations.solve_system import (
+    _elimination_candidates,
+    solve_system_multiple_solutions,
+)
+
+
+def _expand(eqs, values, want, check_knowns, method, path, deepen, max_growth=None, max_ops=None):
+    """
+    One step for one branch: solve it, or fork it on the first candidate
+    that can be eliminated. Returns ("solved", solutions, path),
+    ("forked", [(eqs, path), ...]) or ("dead", None, path).
+    """
+    try:
+        solutions = solve_system_multiple_solutions(
+            eqs, values, want, check_knowns=check_knowns, method=method,
+        )
+        return "solved", solutions, path
+    except Exception:
+        pass
+
+    if not deepen:
+        return "dead", None, path
+
+    for sym in _elimination_candidates(eqs, values, want):
+        forks = eliminate_variable_branches(eqs, sym, max_growth, max_ops)
+        forks = [
+            (new_eqs, path + ((sym, replacement),))
+            for new_eqs, replacement in forks
+            if not any(sym in getattr(eq, "free_symbols", set()) for eq in new_eqs)
+        ]
+        if forks:
+            return "forked", forks, path
+    return "dead", None, path
+
+def _expand_args(args):
+    return _expand(*args)
+
+
+def solve_with_branches(
+    equations,
+    values,
+    want,
+    max_elims=10,
+    check_knowns=False,
+    method="full",
+    workers=None,
+    max_branches=64,
+    max_growth=None,
+    max_ops=None,
+):
+    """
+    Returns (solutions, paths): every distinct Eq(want, expr) reachable on
+    some branch, and for each one the branch path that produced it.
+    max_growth / max_ops: swell guard for each fork (see
+    eliminate_variable_subst).
+    """
+    frontier = [(list(equations), ())]
+    found = {}
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers is not None and workers > 1 else None
+    try:
+        for depth in range(max_elims + 1):
+            if not frontier:
+                break
+            jobs = [
+                (eqs, values, want, check_knowns, method, path, depth < max_elims, max_growth, max_ops)
+                for eqs, path in frontier
+            ]
+            if pool is not None:
+                outcomes = list(pool.map(_expand_args, jobs))
+            else:
+                outcomes = [_expand_args(job) for job in jobs]
+
+            frontier = []
+            for status, payload, path in outcomes:
+                if status == "solved":
+                    for sol in payload:
+                        found.setdefault(sol, path)
+                elif status == "forked":
+                    count("branch_forks", n=len(payload) - 1)
+                    frontier.extend(payload)
+
+            if len(frontier) > max_branches:
+                emit("warning", message=f"Branch limit reached; dropping {len(frontier) - max_branches} branches.")
+                frontier = frontier[:max_branches]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if not found:
+        raise ValueError("No solutions found.")
+
+    solutions = sorted(found, key=sp.default_sort_key)
+    return solutions, [list(found[sol]) for sol in solutions]
@@ -0,0 +1,194 @@
+"""
+dimensions.py
+
+Dimension vectors: exponents over the seven SI base dimensions, e.g.
+velocity = (1, 0, -1, 0, 0, 0, 0) for length / time.
+
+`infer` works out the dimension of an expression from per-symbol
+dimensions without doing any algebra: products add vectors, integer and
+rational powers scale them, sums must agree, and function arguments
+(sin, exp, log, ...) must be dimensionless, except atan2, whose two
+arguments only have to agree. Symbols without an
+annotation are unknown (None) and don't constrain anything; numbers are
+dimensionless factors but don't force a sum to be dimensionless (0 and
+2*x are fine next to anything).
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+from sympy.physics.units import ampere, candela, kelvin, kilogram, meter, mole, second
+from sympy.physics.units.systems.si import SI, dimsys_SI
+
+
+BASE_DIMENSIONS = ("length", "mass", "time", "current", "temperature", "amount_of_substance", "luminous_intensity")
+BASE_UNITS = (meter, kilogram, second, ampere, kelvin, mole, candela)
+DIMENSIONLESS = (0,) * len(BASE_DIMENSIONS)
+
+LENGTH = (1, 0, 0, 0, 0, 0, 0)
+TIME = (0, 0, 1, 0, 0, 0, 0)
+VELOCITY = (1, 0, -1, 0, 0, 0, 0)
+ACCELERATION = (1, 0, -2, 0, 0, 0, 0)
+
+
+class DimensionError(ValueError):
+    pass
+
+
+def add(u, v):
+    return tuple(a + b for a, b in zip(u, v))
+
+def scale(u, k):
+    return tuple(a * k for a in u)
+
+def format_dimension(u):
+    if u == DIMENSIONLESS:
+        return "dimensionless"
+    return str(unit_for(u))
+
+
+def dimension_of(quantity):
+    """Dimension vector of a sympy.physics.units expression."""
+    deps = dimsys_SI.get_dimensional_dependencies(SI.get_dimensional_expr(quantity))
+    by_name = {dim.name: sp.Rational(power) for dim, power in deps.items()}
+    vector = []
+    for name in BASE_DIMENSIONS:
+        power = by_name.get(sp.Symbol(name), 0)
+        vector.append(int(power) if power.is_integer else power)
+    return tuple(vector)
+
+
+def unit_for(u):
+    """The SI base-unit expression for dimension vector u."""
+    return sp.Mul(*(unit**power for unit, power in zip(BASE_UNITS, u)))
+
+
+def infer(expr, dims):
+    """
+    Dimension vector of expr given {symbol: vector}; None if it depends on
+    unannotated symbols. Raises DimensionError on an inconsistent sum or
+    a dimensional function argument.
+    """
+    if isinstance(expr, sp.Symbol):
+        return dims.get(expr)
+    if expr.is_number:
+        return DIMENSIONLESS
+
+    if isinstance(expr, sp.Add):
+        known = None
+        for term in expr.args:
+            if term.is_number:
+                continue
+            u = infer(term, dims)
+            if u is None:
+                continue
+            if known is not None and u != known:
+                raise DimensionError(
+                    f"Adding {format_dimension(known)} and {format_dimension(u)} in {expr}"
+                )
+            known = u
+        return known
+
+    if isinstance(expr, sp.Mul):
+        total = DIMENSIONLESS
+        for factor in expr.args:
+            u = infer(factor, dims)
+            if u is None:
+                return None
+            total = add(total, u)
+        return total
+
+    if isinstance(expr, sp.Pow):
+        exponent = expr.exp
+        if not exponent.is_number:
+            _require_dimensionless(exponent, dims, expr)
+            _require_dimensionless(expr.base, dims, expr)
+            return DIMENSIONLESS
+        u = infer(expr.base, dims)
+        if u is None:
+            return None
+        return scale(u, sp.Rational(exponent) if exponent.is_rational else exponent)
+
+    if isinstance(expr, sp.Abs):
+        return infer(expr.args[0], dims)
+    if isinstance(expr, sp.sign):
+        return DIMENSIONLESS
+
+    if isinstance(expr, sp.atan2):
+        # atan2(y, x) is the angle of (x, y): any dimension, as long as
+        # both agree.
+        infer(sp.Add(*expr.args, evaluate=False), dims)
+        return DIMENSIONLESS
+
+    if isinstance(expr, (sp.Min, sp.Max)):
+        return infer(sp.Add(*expr.args, evaluate=False), dims)
+
+    if isinstance(expr, sp.Function):
+        for arg in expr.args:
+            _require_dimensionless(arg, dims, expr)
+        return DIMENSIONLESS
+
+    return None
+
+
+def _require_dimensionless(arg, dims, expr):
+    u = infer(arg, dims)
+    if u is not None and u != DIMENSIONLESS:
+        raise DimensionError(f"{format_dimension(u)} argument in {expr}")
+
+
+def check_equation(eq, dims):
+    """
+    Raises DimensionError if eq is dimensionally inconsistent under dims.
+    Returns the common dimension of both sides, or None if unknown.
+    """
+    if not isinstance(eq, sp.Equality):
+        return None
+    # A bare number (Eq(x, 0), Eq(n, 3)) says nothing about dimensions.
+    lhs = None if eq.lhs.is_number else infer(eq.lhs, dims)
+    rhs = None if eq.rhs.is_number else infer(eq.rhs, dims)
+    if lhs is not None and rhs is not None and lhs != rhs:
+        raise DimensionError(
+            f"{eq}: {format_dimension(lhs)} on the left, {format_dimension(rhs)} on the right"
+        )
+    return lhs if lhs is not None else rhs
+
+
+def check_dimensions(equations, dims):
+    """Raises DimensionError on the first inconsistent equation."""
+    for eq in equations:
+        check_equation(eq, dims)
+
+
+def consistent(equations, dims):
+    try:
+        for eq in equations:
+            check_equation(eq, dims)
+    except DimensionError:
+        return False
+    return True
+
+
+def derive_dimensions(equations, dims):
+    """
+    Extends dims through equations of the form Eq(sym, expr) (either way
+    round) whose other side has a known dimension. Returns a new dict.
+    """
+    dims = dict(dims)
+    pending = [eq for eq in equations if isinstance(eq, sp.Equality)]
+    changed = True
+    while changed:
+        changed = False
+        remaining = []
+        for eq in pending:
+            for side, other in ((eq.lhs, eq.rhs), (eq.rhs, eq.lhs)):
+                if isinstance(side, sp.Symbol) and side not in dims and not other.is_number:
+                    u = infer(other, dims)
+                    if u is not None:
+                        dims[side] = u
+                        changed = True
+                        break
+            else:
+                remaining.append(eq)
+        pending = remaining
+    return dims
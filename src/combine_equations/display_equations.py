@@ -35,4 +35,10 @@ def display_equations_(equations, values=None, want=None):
     for eq in equations:
         if eq == True:
             continue
-        display_equation_(eq, values, want)
\ No newline at end of file
+        display_equation_(eq, values, want)
+
+
+def display_trace_(trace, values=None, want=None):
+    for source, step in trace:
+        print(f'from {source.lhs} = {source.rhs}:')
+        display_equation_(step, values, want)
@@ -1,19 +1,24 @@
 import sympy as sp
 
+from combine_equations.zero_test import is_zero
+from combine_equations.instrumentation import count, emit, phase, expression_size
+from combine_equations.isolation import isolate
+
 
 def _safe_simplify(expr):
-    try:
-        return sp.simplify(expr)
-    except Exception:
-        return expr
+    with phase("simplify", ops=lambda: expression_size(expr)):
+        try:
+            return sp.simplify(expr)
+        except Exception:
+            return expr
 
 def _is_tautology(eq):
     # Covers Python bool, SymPy BooleanTrue, and Eq(x, x)
     if eq is True or eq == sp.S.true:
         return True
     if isinstance(eq, sp.Equality):
-        # If lhs-rhs simplifies to 0, it's tautological
-        return _safe_simplify(eq.lhs - eq.rhs) == 0
+        # If lhs-rhs is identically 0, it's tautological
+        return is_zero(eq.lhs - eq.rhs)
     return False
 
 def cleanup_equations(eqs):
@@ -89,9 +94,29 @@ def cleanup_equations(eqs):
 
 # s = sols[0]
 
-def eliminate_variable_subst(equations, var, max_passes=10):
+def _swell_exceeded(before, after, max_growth, max_ops):
+    if max_ops is not None and after > max_ops:
+        return True
+    if max_growth is not None and after > max_growth * max(before, 1):
+        return True
+    return False
+
+def eliminate_variable_subst(equations, var, max_passes=10, max_growth=None, max_ops=None):
+    """
+    max_growth / max_ops guard against expression swell: a substitution
+    that makes the equations more than `max_growth` times bigger (total
+    count_ops), or bigger than `max_ops`, is abandoned before simplifying
+    and the next candidate replacement is tried. Returns (eqs, None) when
+    every candidate is abandoned.
+    """
+    eqs, replacement, _ = _eliminate_variable_subst(equations, var, max_passes, max_growth, max_ops)
+    return eqs, replacement
+
+def _eliminate_variable_subst(equations, var, max_passes, max_growth, max_ops):
     eqs = list(equations)
     replacement = None
+    aborted = 0
+    guarded = max_growth is not None or max_ops is not None
 
     for _ in range(max_passes):
         candidates = []
@@ -101,11 +126,15 @@ def eliminate_variable_subst(equations, var, max_passes=10):
             if var not in eq.free_symbols:
                 continue
             try:
-                sols = sp.solve(eq, var)
+                sols = isolate(eq, var)
 
                 if len(sols) == 0:
-                    print("Warning: No solutions found when solving for variable.")
-                    print(f"Equation: {eq}, Variable: {var}")
+                    emit(
+                        "warning",
+                        message="No solutions found when solving for variable.",
+                        equation=str(eq),
+                        variable=str(var),
+                    )
             except Exception:
                 continue
             for s in sols:
@@ -118,25 +147,189 @@ def eliminate_variable_subst(equations, var, max_passes=10):
             break
 
         candidates.sort(key=sp.count_ops)
-        replacement = candidates[0]
 
+        before = expression_size(eqs) if guarded else 0
+        accepted = None
+        for candidate in candidates:
+            substituted = [e.subs({var: candidate}) for e in eqs]
+            if guarded:
+                after = expression_size(substituted)
+                if _swell_exceeded(before, after, max_growth, max_ops):
+                    aborted += 1
+                    count(
+                        "swell_aborts",
+                        variable=str(var),
+                        ops_before=before,
+                        ops_after=after,
+                        max_growth=max_growth,
+                        max_ops=max_ops,
+                    )
+                    continue
+            accepted = candidate
+            break
+
+        if accepted is None:
+            break
+        replacement = accepted
 
         # https://github.com/sympy/sympy/issues/28926
         # Once this is fixed, try regular sp.simplify again
         # instead of _safe_simplify
-        eqs = [_safe_simplify(e.subs({var: replacement})) for e in eqs]
+        eqs = [_safe_simplify(e) for e in substituted]
         eqs = cleanup_equations(eqs)
 
         if all((not isinstance(e, sp.Equality)) or (var not in e.free_symbols) for e in eqs):
             break
 
-    return eqs, replacement
+    return eqs, replacement, aborted
+
+
+def eliminate_variable_branches(equations, var, max_growth=None, max_ops=None):
+    """
+    Like eliminate_variable_subst, but keeps every root: returns one
+    (new_equations, replacement) fork per root of the isolation used.
+
+    The defining equation is the one whose roots are cheapest (count_ops
+    of the largest root, then the number of roots). Equations without `var` are shared between the
+    forks as-is. Returns [] when `var` can't be isolated. max_growth /
+    max_ops drop forks whose substitution swells, as in
+    eliminate_variable_subst.
+    """
+    eqs = list(equations)
+    guarded = max_growth is not None or max_ops is not None
+
+    best = None
+    for idx, eq in enumerate(eqs):
+        if not isinstance(eq, sp.Equality) or var not in eq.free_symbols:
+            continue
+        try:
+            sols = isolate(eq, var)
+        except Exception:
+            continue
+        roots = [sp.sympify(s) for s in sols]
+        roots = [r for r in roots if var not in r.free_symbols]
+        if not roots:
+            continue
+        key = (max(sp.count_ops(r) for r in roots), len(roots))
+        if best is None or key < best[0]:
+            best = (key, idx, roots)
+
+    if best is None:
+        return []
+
+    _, source, roots = best
+    before = expression_size(eqs) if guarded else 0
+    others = [eq for idx, eq in enumerate(eqs) if idx != source]
+    touched = [var in getattr(eq, "free_symbols", set()) for eq in others]
+    forks = []
+    for root in roots:
+        root = _safe_simplify(root)
+        substituted = [
+            eq.subs({var: root}) if hit else eq for eq, hit in zip(others, touched)
+        ]
+        if guarded:
+            after = expression_size(substituted)
+            if _swell_exceeded(before, after, max_growth, max_ops):
+                count(
+                    "swell_aborts",
+                    variable=str(var),
+                    ops_before=before,
+                    ops_after=after,
+                    max_growth=max_growth,
+                    max_ops=max_ops,
+                )
+                continue
+        new_eqs = [
+            _safe_simplify(eq) if hit else eq for eq, hit in zip(substituted, touched)
+        ]
+        forks.append((cleanup_equations(new_eqs), root))
+    return forks
+
+
+def _best_isolation(eqs, used, var, resolved):
+    best = None
+    for idx, eq in enumerate(eqs):
+        if idx in used or not isinstance(eq, sp.Equality):
+            continue
+        if var not in eq.free_symbols:
+            continue
+        eq_sub = eq.xreplace(resolved) if resolved else eq
+        if not isinstance(eq_sub, sp.Equality) or var not in eq_sub.free_symbols:
+            continue
+        try:
+            sols = isolate(eq_sub, var)
+        except Exception:
+            continue
+        for sol in sols:
+            sol = sp.sympify(sol)
+            if var in sol.free_symbols:
+                continue
+            cost = sp.count_ops(sol)
+            if best is None or cost < best[0]:
+                best = (cost, idx, sol)
+    return best
+
+def eliminate_variables(equations, variables):
+    """
+    Eliminate several variables in one go.
+
+    Each variable is isolated from an equation with the earlier
+    replacements already applied, so the replacements form a triangular
+    chain; every chosen replacement is pushed into the earlier ones with
+    xreplace. The surviving equations get the whole chain in a single
+    xreplace and are simplified once at the end, instead of once per
+    eliminated variable.
+
+    Variables are taken in order of fewest occurrences, each with its
+    cheapest isolation (count_ops). Returns (new_equations, replacements)
+    with replacements {var: expr} free of every eliminated variable;
+    variables that couldn't be isolated are left in the equations and
+    missing from replacements.
+    """
+    eqs = list(equations)
+    pending = list(dict.fromkeys(variables))
+
+    counts = {var: 0 for var in pending}
+    for eq in eqs:
+        for sym in getattr(eq, "free_symbols", set()):
+            if sym in counts:
+                counts[sym] += 1
+    pending.sort(key=lambda v: (counts[v], str(v)))
+
+    resolved = {}
+    used = set()
+    progress = True
+    while pending and progress:
+        progress = False
+        for var in pending:
+            best = _best_isolation(eqs, used, var, resolved)
+            if best is None:
+                continue
+            _, idx, expr = best
+            step = {var: expr}
+            resolved = {sym: value.xreplace(step) for sym, value in resolved.items()}
+            resolved[var] = expr
+            used.add(idx)
+            pending.remove(var)
+            progress = True
+            break
+
+    with phase("eliminate_variables", variables=len(resolved), ops=lambda: expression_size(eqs)):
+        out = []
+        for idx, eq in enumerate(eqs):
+            if idx in used:
+                continue
+            if resolved and hasattr(eq, "xreplace"):
+                eq = eq.xreplace(resolved)
+            out.append(_safe_simplify(eq))
+
+    return cleanup_equations(out), resolved
 
 
 def eliminate_zero_eqs(equations):
-    eqs_zero = [eq for eq in equations if eq.rhs == 0]
-    tmp = equations
-    for eq in eqs_zero:
-        var = eq.lhs
-        tmp, _ = eliminate_variable_subst(tmp, var)
-    return tmp
\ No newline at end of file
+    zero_symbols = [
+        eq.lhs for eq in equations
+        if isinstance(eq, sp.Equality) and eq.rhs == 0 and isinstance(eq.lhs, sp.Symbol)
+    ]
+    eqs, _ = eliminate_variables(equations, zero_symbols)
+    return eqs
\ No newline at end of file
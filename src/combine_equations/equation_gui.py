@@ -369,13 +369,14 @@ class EquationGUI:
     def _eliminate_using_equation(self, symbol, source_equation):
         """Eliminate a variable using a specific equation."""
         from combine_equations.eliminate_variable_subst import _safe_simplify, cleanup_equations
+        from combine_equations.isolation import isolate
         
         # Get current equations (from latest history)
         _, current_eqs, current_values, current_want = self.history[-1]
         
         try:
             # Solve the specific equation for the symbol
-            sols = sp.solve(source_equation, symbol)
+            sols = isolate(source_equation, symbol)
             
             if len(sols) == 0:
                 desc = f"Cannot solve equation for {symbol}"
@@ -0,0 +1,111 @@
+"""
+equation_system.py
+
+An indexed view of an equation system for structural bookkeeping.
+
+Each symbol is interned to an integer and each equation's symbol set is
+stored as an int bitmask, so intersections, unions, subset tests and
+membership are word operations instead of walks over SymPy trees.
+free_symbols is evaluated once per equation, when the system is built.
+
+For very large systems, `matrix()` gives the same incidence as a NumPy
+bool matrix (equations x symbols); counts over it are vectorised. NumPy
+is optional and only imported there.
+"""
+
+from __future__ import annotations
+
+NUMPY_THRESHOLD = 2000
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class EquationSystem:
+    def __init__(self, equations, symbols=()):
+        self.equations = list(equations)
+        self.symbols = []
+        self.index = {}
+        for sym in symbols:
+            self._intern(sym)
+        self.masks = [self.mask(getattr(eq, "free_symbols", ())) for eq in self.equations]
+        self._matrix = None
+
+    def _intern(self, sym):
+        bit = self.index.get(sym)
+        if bit is None:
+            bit = self.index[sym] = len(self.symbols)
+            self.symbols.append(sym)
+        return bit
+
+    def __len__(self):
+        return len(self.equations)
+
+    def mask(self, symbols):
+        """Bitmask for `symbols`, interning new ones."""
+        mask = 0
+        for sym in symbols:
+            mask |= 1 << self._intern(sym)
+        return mask
+
+    def symbols_of(self, mask):
+        return {self.symbols[bit] for bit in _bits(mask)}
+
+    def free_symbols(self, i):
+        return self.symbols_of(self.masks[i])
+
+    def common(self, i, j):
+        """Symbols shared by equations i and j."""
+        return self.symbols_of(self.masks[i] & self.masks[j])
+
+    def union(self, indices=None):
+        mask = 0
+        for i in range(len(self.masks)) if indices is None else indices:
+            mask |= self.masks[i]
+        return mask
+
+    def containing(self, mask):
+        """Indices of the equations that share a symbol with `mask`."""
+        return [i for i, m in enumerate(self.masks) if m & mask]
+
+    def counts(self, mask=None):
+        """Number of equations each symbol (restricted to `mask`) appears in."""
+        if len(self.masks) >= NUMPY_THRESHOLD:
+            np = _numpy()
+            if np is not None:
+                totals = self.matrix().sum(axis=0)
+                bits = range(len(self.symbols)) if mask is None else _bits(mask)
+                return {self.symbols[b]: int(totals[b]) for b in bits}
+
+        totals = [0] * len(self.symbols)
+        for m in self.masks:
+            if mask is not None:
+                m &= mask
+            for bit in _bits(m):
+                totals[bit] += 1
+        bits = range(len(self.symbols)) if mask is None else _bits(mask)
+        return {self.symbols[b]: totals[b] for b in bits}
+
+    def matrix(self):
+        """Equations x symbols incidence as a NumPy bool matrix."""
+        np = _numpy()
+        if np is None:
+            raise ImportError("EquationSystem.matrix() needs numpy.")
+        if self._matrix is None or self._matrix.shape[1] != len(self.symbols):
+            matrix = np.zeros((len(self.masks), len(self.symbols)), dtype=bool)
+            for i, m in enumerate(self.masks):
+                matrix[i, list(_bits(m))] = True
+            self._matrix = matrix
+        return self._matrix
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
@@ -0,0 +1,99 @@
+"""
+groebner.py
+
+Gröbner-basis elimination backend for polynomial systems.
+
+When every equation is polynomial in the unknowns (after clearing
+denominators), a lex-ordered Gröbner basis with the variables to
+eliminate ordered first contains generators of the elimination ideal:
+the polynomials in `want` alone (with the knowns as coefficients). The
+roots of those are the candidate values of `want`.
+
+Clearing denominators admits roots where a denominator vanishes (dt = 0
+for the kinematics equations). Those are removed by saturation: every
+denominator d gets an extra equation 1 - z*d = 0 with a fresh z, which
+has no solution when d = 0. The z's come first in the elimination order.
+
+Systems that aren't polynomial in the unknowns (sqrt, atan2, ... of
+unknowns) raise NotPolynomialError; callers fall back to substitution,
+as they do on any other ValueError from solve_groebner.
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+
+from combine_equations.instrumentation import phase
+from combine_equations.solve_system import (
+    clear_zero_denominators,
+    connected_unknowns,
+    filter_equations_for_unknowns,
+)
+from combine_equations.zero_test import is_zero
+
+
+class NotPolynomialError(ValueError):
+    pass
+
+
+def _polynomial_system(equations, unknowns):
+    polys = []
+    denominators = []
+    for eq in equations:
+        expr = eq.lhs - eq.rhs if isinstance(eq, sp.Equality) else sp.sympify(eq)
+        num, den = sp.fraction(sp.together(expr))
+        if not num.is_polynomial(*unknowns):
+            raise NotPolynomialError(f"Not polynomial in the unknowns: {eq}")
+        polys.append(sp.expand(num))
+        if den.free_symbols & unknowns:
+            if not den.is_polynomial(*unknowns):
+                raise NotPolynomialError(f"Not polynomial in the unknowns: {eq}")
+            denominators.append(den)
+    return polys, list(dict.fromkeys(denominators))
+
+
+def elimination_ideal(equations, values, want, return_basis=False):
+    """
+    Generators of the elimination ideal for `want`: the polynomials of the
+    lex Gröbner basis free of every other unknown.
+    """
+    unknowns = connected_unknowns(equations, values, want)
+    equations = clear_zero_denominators(equations)
+    equations = filter_equations_for_unknowns(equations, unknowns)
+
+    polys, denominators = _polynomial_system(equations, unknowns)
+    saturation = [sp.Dummy(f"z{i}") for i in range(len(denominators))]
+    polys += [1 - z * den for z, den in zip(saturation, denominators)]
+
+    others = sorted(unknowns - {want}, key=sp.default_sort_key)
+    gens = saturation + others + [want]
+
+    with phase("groebner", polynomials=len(polys), gens=len(gens)):
+        basis = sp.groebner(polys, *gens, order="lex")
+
+    eliminated = set(gens) - {want}
+    eliminant = [p for p in basis.exprs if not (p.free_symbols & eliminated)]
+    if return_basis:
+        return eliminant, basis
+    return eliminant
+
+
+def solve_groebner(equations, values, want):
+    eliminant, basis = elimination_ideal(equations, values, want, return_basis=True)
+
+    if basis.exprs == [1]:
+        raise ValueError("Inconsistent system.")
+    candidates = [p for p in eliminant if want in p.free_symbols]
+    if not candidates:
+        raise ValueError("No solutions found.")
+
+    candidates.sort(key=lambda p: (sp.degree(p, want), sp.count_ops(p)))
+    with phase("solve", unknowns=1):
+        roots = sp.solve(candidates[0], want)
+    roots = [
+        root for root in roots
+        if all(is_zero(p.xreplace({want: root})) for p in candidates[1:])
+    ]
+    if not roots:
+        raise ValueError("No solutions found.")
+    return [sp.Eq(want, root) for root in roots]
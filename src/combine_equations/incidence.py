@@ -0,0 +1,188 @@
+"""
+incidence.py
+
+Sparse equation x symbol incidence matrix for connectivity questions on
+large systems.
+
+The matrix is stored once in CSR form (indptr / indices, backed by
+`array`) together with its transpose, so the symbols of an equation and
+the equations of a symbol are both contiguous slices. Reachability from
+`want`, connected_unknowns and the split into independent components are
+BFS walks over those slices; SymPy trees are only touched when the
+matrix is built (via EquationSystem).
+
+This is the one "what is connected to want" walk: the solvers
+(solve_system.connected_unknowns), preprocess and SolverSession all use
+it. Built with `values`, the knowns are substituted first, so a known
+that is 0 cuts the unknowns it multiplies out of the graph.
+
+The graph can be written as DOT or GraphML to see why a system didn't
+decompose: equations are boxes, symbols ellipses, knowns are grey and
+`want` is bold.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from xml.sax.saxutils import escape, quoteattr
+
+import sympy as sp
+
+from combine_equations.equation_system import EquationSystem, _bits
+
+
+def _csr(rows, n_cols):
+    indptr = array("l", [0])
+    indices = array("l")
+    for row in rows:
+        indices.extend(sorted(row))
+        indptr.append(len(indices))
+    # The transpose, counting-sort style.
+    counts = [0] * (n_cols + 1)
+    for col in indices:
+        counts[col + 1] += 1
+    for i in range(n_cols):
+        counts[i + 1] += counts[i]
+    t_indptr = array("l", counts)
+    t_indices = array("l", [0] * len(indices))
+    fill = list(counts[:-1])
+    for r in range(len(indptr) - 1):
+        for k in range(indptr[r], indptr[r + 1]):
+            col = indices[k]
+            t_indices[fill[col]] = r
+            fill[col] += 1
+    return indptr, indices, t_indptr, t_indices
+
+
+class IncidenceMatrix:
+    def __init__(self, system, values=None):
+        if not isinstance(system, EquationSystem):
+            if values:
+                system = [eq.subs(values) if isinstance(eq, sp.Basic) else eq for eq in system]
+            system = EquationSystem(system)
+        self.system = system
+        self.equations = system.equations
+        self.symbols = list(system.symbols)
+        self.indptr, self.indices, self.sym_indptr, self.sym_indices = _csr(
+            (_bits(m) for m in system.masks), len(self.symbols),
+        )
+
+    @property
+    def shape(self):
+        return (len(self.equations), len(self.symbols))
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def symbols_in(self, i):
+        """Column indices of equation i."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def equations_with(self, j):
+        """Row indices of the equations containing symbol column j."""
+        return self.sym_indices[self.sym_indptr[j]:self.sym_indptr[j + 1]]
+
+    def _known_columns(self, knowns):
+        index = self.system.index
+        return {index[sym] for sym in knowns if sym in index}
+
+    def _bfs(self, start, known):
+        # start: symbol columns. Returns (symbol columns, equation rows).
+        cols = set(start)
+        rows = set()
+        pending = deque(cols)
+        while pending:
+            j = pending.popleft()
+            for i in self.equations_with(j):
+                if i in rows:
+                    continue
+                rows.add(i)
+                for k in self.symbols_in(i):
+                    if k not in known and k not in cols:
+                        cols.add(k)
+                        pending.append(k)
+        return cols, rows
+
+    def reachable(self, want, knowns=()):
+        """
+        Returns (unknowns, equation indices) reachable from `want` through
+        shared unknowns.
+        """
+        j = self.system.index.get(want)
+        if j is None:
+            return {want}, []
+        known = self._known_columns(knowns)
+        cols, rows = self._bfs([j], known)
+        return {self.symbols[k] for k in cols} | {want}, sorted(rows)
+
+    def connected_unknowns(self, want, knowns=()):
+        return self.reachable(want, knowns)[0]
+
+    def components(self, knowns=()):
+        """
+        Splits the system into independent parts: a list of
+        (equation indices, unknowns), one per connected component.
+        Equations without unknowns are left out.
+        """
+        known = self._known_columns(knowns)
+        seen = set()
+        parts = []
+        for j in range(len(self.symbols)):
+            if j in known or j in seen:
+                continue
+            cols, rows = self._bfs([j], known)
+            seen |= cols
+            if rows:
+                parts.append((sorted(rows), {self.symbols[k] for k in cols}))
+        return parts
+
+    def to_dot(self, knowns=(), want=None):
+        known = self._known_columns(knowns)
+        lines = ["graph incidence {"]
+        for i, eq in enumerate(self.equations):
+            lines.append(f"  e{i} [shape=box, label={_dot_label(eq)}];")
+        for j, sym in enumerate(self.symbols):
+            attrs = [f"label={_dot_label(sym)}"]
+            if j in known:
+                attrs.append('style=filled, fillcolor="lightgrey"')
+            if sym == want:
+                attrs.append("penwidth=3")
+            lines.append(f"  s{j} [{', '.join(attrs)}];")
+        for i in range(len(self.equations)):
+            for j in self.symbols_in(i):
+                lines.append(f"  e{i} -- s{j};")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def to_graphml(self, knowns=(), want=None):
+        known = self._known_columns(knowns)
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">',
+            '  <key id="label" for="node" attr.name="label" attr.type="string"/>',
+            '  <key id="kind" for="node" attr.name="kind" attr.type="string"/>',
+            '  <graph id="incidence" edgedefault="undirected">',
+        ]
+        for i, eq in enumerate(self.equations):
+            lines.append(_graphml_node(f"e{i}", eq, "equation"))
+        for j, sym in enumerate(self.symbols):
+            kind = "want" if sym == want else "known" if j in known else "unknown"
+            lines.append(_graphml_node(f"s{j}", sym, kind))
+        for i in range(len(self.equations)):
+            for j in self.symbols_in(i):
+                lines.append(f'    <edge source="e{i}" target="s{j}"/>')
+        lines += ["  </graph>", "</graphml>"]
+        return "\n".join(lines) + "\n"
+
+
+def _dot_label(obj):
+    return '"' + str(obj).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def _graphml_node(node_id, obj, kind):
+    return (
+        f"    <node id={quoteattr(node_id)}>"
+        f'<data key="label">{escape(str(obj))}</data>'
+        f'<data key="kind">{kind}</data></node>'
+    )
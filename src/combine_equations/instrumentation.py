@@ -0,0 +1,138 @@
+"""
+instrumentation.py
+
+Structured events from the solver phases.
+
+Every phase (connected_unknowns, clear_zero_denominators, filtering, each
+sp.solve, each elimination candidate, simplify calls, ...) emits a dict
+such as
+
+  {"event": "phase", "name": "solve", "elapsed": 0.012, "ops": 41, ...}
+
+to the registered listeners. With no listener registered the hooks cost
+a function call, and expression sizes (count_ops) are never computed.
+
+Listeners are plain callables taking the event dict. Register them for
+the whole process with add_listener, or for a block of code with
+
+  with instrument(recorder):
+      solve_with_elimination_attempts(eqs, values, want)
+
+Printing is just another listener:
+
+  add_listener(print_events)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+import sympy as sp
+
+
+_global_listeners: tuple = ()
+_scoped_listeners = contextvars.ContextVar("combine_equations_listeners", default=())
+
+
+def add_listener(listener):
+    global _global_listeners
+    _global_listeners = _global_listeners + (listener,)
+
+def remove_listener(listener):
+    global _global_listeners
+    _global_listeners = tuple(l for l in _global_listeners if l is not listener)
+
+@contextmanager
+def instrument(*listeners):
+    token = _scoped_listeners.set(_scoped_listeners.get() + listeners)
+    try:
+        yield
+    finally:
+        _scoped_listeners.reset(token)
+
+def enabled():
+    return bool(_global_listeners or _scoped_listeners.get())
+
+
+def emit(event, **fields):
+    listeners = _global_listeners + _scoped_listeners.get()
+    if not listeners:
+        return
+    record = {"event": event}
+    for key, value in fields.items():
+        # Callables defer expensive fields (like count_ops) until someone
+        # is actually listening.
+        record[key] = value() if callable(value) else value
+    for listener in listeners:
+        listener(record)
+
+def count(name, n=1, **fields):
+    emit("count", name=name, n=n, **fields)
+
+@contextmanager
+def phase(name, **fields):
+    if not enabled():
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as err:
+        emit("phase", name=name, elapsed=time.perf_counter() - start, error=type(err).__name__, **fields)
+        raise
+    emit("phase", name=name, elapsed=time.perf_counter() - start, **fields)
+
+
+def expression_size(exprs):
+    """Total count_ops over one expression/equation or a list of them."""
+    if not isinstance(exprs, (list, tuple)):
+        exprs = [exprs]
+    total = 0
+    for expr in exprs:
+        if isinstance(expr, sp.Equality):
+            total += sp.count_ops(expr.lhs) + sp.count_ops(expr.rhs)
+        elif isinstance(expr, sp.Basic):
+            total += sp.count_ops(expr)
+    return total
+
+
+def _format_elapsed(seconds):
+    if seconds >= 60:
+        minutes = int(seconds // 60)
+        remainder = seconds - (minutes * 60)
+        return f"{minutes}m {remainder:05.2f}s"
+    return f"{seconds:.3f}s"
+
+def print_events(event):
+    """Listener reproducing the solver's human-readable progress output."""
+    kind = event["event"]
+    if kind == "unknowns":
+        print("Solving for unknowns:", "[" + ", ".join(event["unknowns"]) + "]")
+    elif kind == "warning":
+        print(f"Warning: {event['message']}")
+    elif kind == "phase" and event["name"] == "elimination_attempts":
+        print(f"Elimination attempts elapsed: {_format_elapsed(event['elapsed'])}")
+
+
+class EventRecorder:
+    """Listener that keeps every event, with a per-phase summary."""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def summary(self):
+        phases = {}
+        counts = {}
+        for event in self.events:
+            if event["event"] == "phase":
+                entry = phases.setdefault(event["name"], {"calls": 0, "elapsed": 0.0})
+                entry["calls"] += 1
+                entry["elapsed"] += event["elapsed"]
+            elif event["event"] == "count":
+                counts[event["name"]] = counts.get(event["name"], 0) + event["n"]
+        return {"phases": phases, "counts": counts}
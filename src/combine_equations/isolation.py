@@ -0,0 +1,82 @@
+"""
+isolation.py
+
+Process-wide memo of single-equation isolations, sp.solve(eq, var).
+
+The eliminator, the elimination-attempt loop, isolate_variable and the
+GUIs keep asking for the same (equation, symbol) isolations. The cache is
+keyed on lhs - rhs up to sign, so Eq(a, b), Eq(b, a) and Eq(a - b, 0)
+share an entry, and on SymPy's structural hash. It is a bounded LRU;
+failures (sp.solve raising NotImplementedError and friends) are cached
+as well, as their type and arguments, and re-raised as a fresh exception
+so no traceback is kept alive.
+
+  isolate(eq, var)          -> list of solutions, like sp.solve(eq, var)
+  isolation_cache_info()    -> {"hits", "misses", "maxsize", "currsize"}
+  clear_isolation_cache()
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import sympy as sp
+
+from combine_equations.instrumentation import phase, expression_size
+
+
+ISOLATION_CACHE_SIZE = 4096
+
+
+def _canonical(eq):
+    if isinstance(eq, sp.Equality):
+        expr = eq.lhs - eq.rhs
+    else:
+        expr = sp.sympify(eq)
+    if not isinstance(expr, sp.Expr):
+        return expr
+    # expr and -expr have the same roots.
+    return min(expr, -expr, key=sp.default_sort_key)
+
+
+@lru_cache(maxsize=ISOLATION_CACHE_SIZE)
+def _isolate_cached(expr, var):
+    with phase("solve", unknowns=1, ops=lambda: expression_size(expr)):
+        try:
+            return tuple(sp.solve(expr, var)), None
+        except Exception as err:
+            return None, (type(err), err.args)
+
+
+def isolate(eq, var):
+    """sp.solve(eq, var), memoized."""
+    try:
+        key = _canonical(eq)
+        hash(key)
+    except (TypeError, sp.SympifyError):
+        return sp.solve(eq, var)
+
+    sols, failure = _isolate_cached(key, var)
+    if failure is not None:
+        raise _rebuild(*failure)
+    return list(sols)
+
+
+def _rebuild(err_type, args):
+    try:
+        return err_type(*args)
+    except Exception:
+        return RuntimeError(f"{err_type.__name__}: {args}")
+
+
+def isolation_cache_info():
+    info = _isolate_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
+
+def clear_isolation_cache():
+    _isolate_cached.cache_clear()
@@ -42,24 +42,31 @@ class Point3:
         return getattr(self, axis)
 
     @staticmethod
-    def make(prefix: str) -> "Point3":
+    def make(prefix: str, *, assumptions: bool = False) -> "Point3":
+        real = _assume(assumptions, real=True)
         return Point3(
-            x=sp.Symbol(f"{prefix}_x"),
-            y=sp.Symbol(f"{prefix}_y"),
-            z=sp.Symbol(f"{prefix}_z"),
+            x=sp.Symbol(f"{prefix}_x", **real),
+            y=sp.Symbol(f"{prefix}_y", **real),
+            z=sp.Symbol(f"{prefix}_z", **real),
         )
 
-def make_point(prefix: str) -> Point3:
+def make_point(prefix: str, *, assumptions: bool = False) -> Point3:
+    real = _assume(assumptions, real=True)
     return Point3(
-        x = sp.symbols(f"{prefix}_x"),
-        y = sp.symbols(f"{prefix}_y"),
-        z = sp.symbols(f"{prefix}_z"),
+        x = sp.symbols(f"{prefix}_x", **real),
+        y = sp.symbols(f"{prefix}_y", **real),
+        z = sp.symbols(f"{prefix}_z", **real),
 
-        mag = sp.symbols(f"{prefix}_mag"),
-        angle=sp.symbols(f"{prefix}_angle")
+        mag = sp.symbols(f"{prefix}_mag", **_assume(assumptions, positive=True)),
+        angle=sp.symbols(f"{prefix}_angle", **real)
     )
 
 
+def _assume(enabled: bool, **assumptions) -> dict:
+    """Symbol assumptions, or none at all when not enabled."""
+    return assumptions if enabled else {}
+
+
 @dataclass(frozen=True)
 class State:
     """
@@ -112,6 +119,36 @@ class StatesModel:
             raise IndexError(f"interval index {i} out of range for n={self.n}")
         return IntervalView(i=i, s0=self.states[i], s1=self.states[i + 1], e=self.edges[i])
 
+    def dimensions(self) -> dict:
+        """
+        {symbol: dimension vector} for every symbol of the model: positions
+        are lengths, velocities (and v_av) velocities, t and dt times,
+        accelerations accelerations, angles dimensionless.
+        """
+        # Imported here: it pulls in sympy.physics.units.
+        from combine_equations.dimensions import ACCELERATION, DIMENSIONLESS, LENGTH, TIME, VELOCITY
+
+        dims = {}
+
+        def point(p: Point3 | None, dim) -> None:
+            if p is None:
+                return
+            for sym in (p.x, p.y, p.z, p.mag):
+                if sym is not None:
+                    dims[sym] = dim
+            if p.angle is not None:
+                dims[p.angle] = DIMENSIONLESS
+
+        for s in self.states:
+            point(s.pos, LENGTH)
+            point(s.vel, VELOCITY)
+            dims[s.t] = TIME
+        for e in self.edges:
+            dims[e.dt] = TIME
+            point(e.a, ACCELERATION)
+            point(e.v_av, VELOCITY)
+        return dims
+
 
 # ----------------------------
 # Constructors
@@ -122,6 +159,7 @@ def make_states_model(
     n_states: int,
     *,
     include_v_av: bool = True,
+    assumptions: bool = False,
 ) -> StatesModel:
     """
     Create a model with n_states = N, and N-1 edges.
@@ -134,6 +172,10 @@ def make_states_model(
         dt_m_0_1, a_x_m_0_1, ...
         v_av_x_m_0_1, ... (if include_v_av)
 
+    assumptions=True gives the symbols SymPy assumptions: components and
+    angles are real, magnitudes and dt positive, t nonnegative. sp.solve
+    and the block solver then drop branches that violate them. Symbols
+    with assumptions are distinct from bare ones with the same name.
     """
     if n_states < 2:
         raise ValueError("n_states must be >= 2")
@@ -141,35 +183,38 @@ def make_states_model(
     states: list[State] = []
     edges: list[EdgeVars] = []
 
+    real = _assume(assumptions, real=True)
+    positive = _assume(assumptions, positive=True)
+
     for i in range(n_states):
-        pos = Point3.make(f"{prefix}_{i}")
+        pos = Point3.make(f"{prefix}_{i}", assumptions=assumptions)
         # velocity components are conventionally named with v_*
         vel = Point3(
-            x=sp.Symbol(f"{prefix}_{i}_v_x"),
-            y=sp.Symbol(f"{prefix}_{i}_v_y"),
-            z=sp.Symbol(f"{prefix}_{i}_v_z"),
+            x=sp.Symbol(f"{prefix}_{i}_v_x", **real),
+            y=sp.Symbol(f"{prefix}_{i}_v_y", **real),
+            z=sp.Symbol(f"{prefix}_{i}_v_z", **real),
 
-            mag=sp.Symbol(f"{prefix}_{i}_v_mag"),
-            angle=sp.Symbol(f"{prefix}_{i}_v_angle"),
+            mag=sp.Symbol(f"{prefix}_{i}_v_mag", **positive),
+            angle=sp.Symbol(f"{prefix}_{i}_v_angle", **real),
         )
-        t = sp.Symbol(f"{prefix}_{i}_t")
+        t = sp.Symbol(f"{prefix}_{i}_t", **_assume(assumptions, nonnegative=True))
         states.append(State(pos=pos, vel=vel, t=t))
 
     for i in range(n_states - 1):
-        dt = sp.Symbol(f"dt_{prefix}_{i}_{i+1}")
+        dt = sp.Symbol(f"dt_{prefix}_{i}_{i+1}", **positive)
 
         a = Point3(
-            x=sp.Symbol(f"a_x_{prefix}_{i}_{i+1}"),
-            y=sp.Symbol(f"a_y_{prefix}_{i}_{i+1}"),
-            z=sp.Symbol(f"a_z_{prefix}_{i}_{i+1}"),
+            x=sp.Symbol(f"a_x_{prefix}_{i}_{i+1}", **real),
+            y=sp.Symbol(f"a_y_{prefix}_{i}_{i+1}", **real),
+            z=sp.Symbol(f"a_z_{prefix}_{i}_{i+1}", **real),
         )
 
         v_av = None
         if include_v_av:
             v_av = Point3(
-                x=sp.Symbol(f"v_av_x_{prefix}_{i}_{i+1}"),
-                y=sp.Symbol(f"v_av_y_{prefix}_{i}_{i+1}"),
-                z=sp.Symbol(f"v_av_z_{prefix}_{i}_{i+1}"),
+                x=sp.Symbol(f"v_av_x_{prefix}_{i}_{i+1}", **real),
+                y=sp.Symbol(f"v_av_y_{prefix}_{i}_{i+1}", **real),
+                z=sp.Symbol(f"v_av_z_{prefix}_{i}_{i+1}", **real),
             )
 
         edges.append(EdgeVars(dt=dt, a=a, v_av=v_av))
@@ -1,6 +1,8 @@
 
 import sympy as sp
 
+from combine_equations.isolation import isolate
+
 def display_equation(eq):
     # sp.pprint(eq)
     # print(f"{eq_2.lhs} = {eq_2.rhs}")
@@ -14,7 +16,7 @@ def symbols_in_common_sp(eq1, eq2):
 
 
 def isolate_variable(equation, variable):
-    solution = sp.solve(equation, variable)
+    solution = isolate(equation, variable)
     if solution:
         return sp.Eq(variable, solution[0])
     else:
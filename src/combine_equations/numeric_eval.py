@@ -0,0 +1,103 @@
+"""
+numeric_eval.py
+
+Compiled numeric evaluation of solution right-hand sides.
+
+sp.N(sol.subs(values)) walks the whole tree with arbitrary-precision
+arithmetic every time. Here each rhs is compiled once: common
+subexpressions are pulled out (lambdify(..., cse=True)) and the result is
+a plain float64 function over the `math` module or, with a precision, an
+mpmath one evaluated at that many digits. Compiled functions live in a
+process-wide LRU keyed on (expr, argument symbols, precision), so display,
+return values and later re-evaluations of the same solution reuse them.
+
+Anything the compiled path can't represent falls back to sp.N: units,
+values that aren't real numbers, symbols without values, complex or
+undefined results.
+
+  evaluate(expr, values, precision=None)          -> SymPy number
+  evaluate_solution(sol, values, precision=None)  -> Eq(lhs, number)
+  compiled_cache_info()  /  clear_compiled_cache()
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import sympy as sp
+from sympy.physics.units.quantities import Quantity
+
+
+COMPILED_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def _compile(expr, symbols, precision):
+    modules = "math" if precision is None else "mpmath"
+    return sp.lambdify(symbols, expr, modules=modules, cse=True)
+
+
+def _fallback(expr, values, precision):
+    if precision is None:
+        return sp.N(expr.subs(values))
+    return sp.N(expr.subs(values), precision)
+
+
+def evaluate(expr, values, precision=None):
+    """sp.N(expr.subs(values)) through a cached compiled function."""
+    expr = sp.sympify(expr)
+    symbols = tuple(sorted(expr.free_symbols, key=sp.default_sort_key))
+    if expr.atoms(Quantity) or any(sym not in values for sym in symbols):
+        return _fallback(expr, values, precision)
+
+    args = []
+    for sym in symbols:
+        value = sp.sympify(values[sym])
+        if not (value.is_number and value.is_extended_real):
+            return _fallback(expr, values, precision)
+        args.append(value)
+
+    try:
+        f = _compile(expr, symbols, precision)
+    except Exception:
+        return _fallback(expr, values, precision)
+
+    try:
+        if precision is None:
+            result = f(*(float(arg) for arg in args))
+        else:
+            import mpmath
+            with mpmath.workdps(precision):
+                result = f(*(mpmath.mpf(str(sp.N(arg, precision))) for arg in args))
+    except (ArithmeticError, ValueError, TypeError, NameError):
+        return _fallback(expr, values, precision)
+
+    if precision is None:
+        if isinstance(result, bool) or not isinstance(result, (int, float)) or not math.isfinite(result):
+            return _fallback(expr, values, precision)
+        return sp.Float(result)
+
+    import mpmath
+    if not isinstance(result, mpmath.mpf) or not mpmath.isfinite(result):
+        return _fallback(expr, values, precision)
+    return sp.Float(result, precision)
+
+
+def evaluate_solution(sol, values, precision=None):
+    """Like sp.N(sol.subs(values)) for a solution Eq(want, rhs)."""
+    return sp.Eq(sol.lhs, evaluate(sol.rhs, values, precision))
+
+
+def compiled_cache_info():
+    info = _compile.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
+
+
+def clear_compiled_cache():
+    _compile.cache_clear()
@@ -0,0 +1,186 @@
+"""
+numeric_solve.py
+
+Numeric fallback for systems the symbolic solvers give up on (typically
+the atan2/sqrt equations from magnitude_and_angle_equations).
+
+With every known given as a number, the connected subsystem is reduced
+to a residual vector F(u) = 0 over the unknowns u. The Jacobian is derived
+symbolically once, both are compiled with lambdify, and a damped
+(Levenberg-Marquardt style) Newton iteration is run from many seeds. The
+damping also handles over- and underdetermined systems, where a plain
+Newton step is not defined.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import sympy as sp
+
+from combine_equations.solve_system import (
+    connected_unknowns,
+    filter_equations_for_unknowns,
+)
+
+
+def _solve_dense(A, b):
+    """Gaussian elimination with partial pivoting on small dense lists."""
+    n = len(b)
+    M = [row[:] + [b[i]] for i, row in enumerate(A)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(M[r][col]))
+        if M[pivot][col] == 0:
+            raise ZeroDivisionError("singular matrix")
+        M[col], M[pivot] = M[pivot], M[col]
+        for r in range(col + 1, n):
+            factor = M[r][col] / M[col][col]
+            if factor:
+                for c in range(col, n + 1):
+                    M[r][c] -= factor * M[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        x[r] = (M[r][n] - sum(M[r][c] * x[c] for c in range(r + 1, n))) / M[r][r]
+    return x
+
+
+def _norm2(F):
+    return math.fsum(f * f for f in F)
+
+
+def _evaluate(f, point):
+    """Evaluate a compiled vector or matrix; None outside the real domain."""
+    try:
+        out = f(*point)
+        if out and isinstance(out[0], list):
+            return [[float(v) for v in row] for row in out]
+        return [float(v) for v in out]
+    except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+        # math.sqrt(-1) raises, (-1.0)**0.5 is complex and float() refuses it
+        return None
+
+
+def _damped_newton(F, J, start, tol, max_iter):
+    x = list(start)
+    Fx = _evaluate(F, x)
+    if Fx is None:
+        return None
+    cost = _norm2(Fx)
+    lam = 1e-3
+    n = len(x)
+
+    # Keep stepping until no step improves the residual, so converged roots
+    # are polished to full precision rather than stopping right at `tol`.
+    for _ in range(max_iter):
+        if cost == 0.0:
+            break
+
+        Jx = _evaluate(J, x)
+        if Jx is None:
+            break
+
+        # (J^T J + lam * diag) dx = -J^T F
+        JtJ = [[math.fsum(row[i] * row[j] for row in Jx) for j in range(n)] for i in range(n)]
+        JtF = [math.fsum(row[i] * f for row, f in zip(Jx, Fx)) for i in range(n)]
+
+        accepted = False
+        for _ in range(12):
+            A = [r[:] for r in JtJ]
+            for i in range(n):
+                A[i][i] += lam * (1.0 + JtJ[i][i])
+            try:
+                dx = _solve_dense(A, [-g for g in JtF])
+            except ZeroDivisionError:
+                lam *= 10
+                continue
+            candidate = [xi + di for xi, di in zip(x, dx)]
+            Fc = _evaluate(F, candidate)
+            if Fc is not None and all(math.isfinite(f) for f in Fc) and _norm2(Fc) < cost:
+                x, Fx, cost = candidate, Fc, _norm2(Fc)
+                lam = max(lam / 10, 1e-12)
+                accepted = True
+                break
+            lam *= 10
+
+        if not accepted:
+            break
+
+    if max(abs(f) for f in Fx) <= tol:
+        return x
+    return None
+
+
+def _run_starts(residuals, jacobian, unknowns, starts, tol, max_iter):
+    F = sp.lambdify(unknowns, residuals, modules="math")
+    J = sp.lambdify(unknowns, jacobian, modules="math")
+    roots = []
+    for start in starts:
+        root = _damped_newton(F, J, start, tol, max_iter)
+        if root is not None:
+            roots.append(root)
+    return roots
+
+
+def solve_numeric_multistart(
+    equations,
+    values,
+    want,
+    starts=16,
+    seed=0,
+    workers=None,
+    tol=1e-10,
+    max_iter=100,
+):
+    """
+    Find every distinct real value of `want` reachable from `starts`
+    random seeds. All knowns in `values` must be numbers.
+
+    workers > 1 spreads the seeds over a process pool.
+
+    Returns [Eq(want, Float), ...] sorted by value.
+    """
+    for sym, value in values.items():
+        if not sp.sympify(value).is_number:
+            raise ValueError(f"Numeric solve needs a number for {sym}; got {value}")
+
+    unknowns = sorted(connected_unknowns(equations, values, want), key=sp.default_sort_key)
+
+    eqs = [eq.subs(values) for eq in equations]
+    eqs = filter_equations_for_unknowns(eqs, set(unknowns))
+    if not eqs:
+        raise ValueError("No equations involve the unknowns.")
+
+    residuals = [eq.lhs - eq.rhs for eq in eqs]
+    jacobian = sp.Matrix(residuals).jacobian(unknowns).tolist()
+
+    scale = max([1.0] + [abs(complex(sp.N(v))) for v in values.values()])
+    tol = tol * scale
+    rng = random.Random(seed)
+    seeds = [[1.0] * len(unknowns)]
+    while len(seeds) < starts:
+        seeds.append([rng.uniform(-scale, scale) for _ in unknowns])
+
+    if workers is not None and workers > 1:
+        chunks = [seeds[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_starts, residuals, jacobian, unknowns, chunk, tol, max_iter)
+                for chunk in chunks if chunk
+            ]
+            roots = [root for future in futures for root in future.result()]
+    else:
+        roots = _run_starts(residuals, jacobian, unknowns, seeds, tol, max_iter)
+
+    index = unknowns.index(want)
+    distinct = []
+    for root in roots:
+        value = root[index]
+        if not any(abs(value - d) <= 1e-8 * max(1.0, abs(d)) for d in distinct):
+            distinct.append(value)
+
+    if not distinct:
+        raise ValueError("No real roots found.")
+
+    return [sp.Eq(want, sp.Float(value)) for value in sorted(distinct)]
@@ -0,0 +1,163 @@
+"""
+portfolio.py
+
+Run several solving strategies concurrently, each in its own process with
+a wall-clock budget, and return the first valid result.
+
+A single pathological sp.solve call can run for hours (see the sympy
+issue referenced in eliminate_variable_subst.py). Processes, unlike
+threads, can be killed, so every request gets bounded latency and the
+losing strategies stop using CPU as soon as a winner is found.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue as queue_module
+import time
+from contextlib import contextmanager
+
+import sympy as sp
+
+from combine_equations.solve_system import (
+    connected_unknowns,
+    solve_system_multiple_solutions,
+    solve_with_elimination_attempts,
+)
+from combine_equations.solve_for_target import solve_for_target
+
+
+def _direct(equations, values, want):
+    return solve_system_multiple_solutions(equations, values, want)
+
+def _elimination(equations, values, want):
+    return solve_with_elimination_attempts(equations, values, want)
+
+def _target(equations, values, want):
+    exclude = connected_unknowns(equations, values, want) - {want}
+    return [
+        sp.Eq(want, rhs)
+        for rhs in solve_for_target(equations, want, exclude=exclude, all_solutions=True)
+    ]
+
+
+STRATEGIES = {
+    "direct": _direct,
+    "elimination": _elimination,
+    "solve_for_target": _target,
+}
+
+
+def _is_valid(solutions, values, want):
+    # Every branch must be in terms of the knowns only.
+    if not solutions:
+        return False
+    for sol in solutions:
+        if not isinstance(sol, sp.Equality) or sol.lhs != want:
+            return False
+        if not sol.rhs.free_symbols <= set(values):
+            return False
+    return True
+
+
+def _worker(name, strategy, equations, values, want, results):
+    try:
+        solutions = strategy(equations, values, want)
+    except BaseException as err:
+        results.put((name, False, f"{type(err).__name__}: {err}"))
+        return
+    results.put((name, True, solutions))
+
+
+@contextmanager
+def _running(ctx, strategies, equations, values, want):
+    """
+    Starts one process per strategy; yields ({name: process}, results
+    queue). On exit every process is stopped and reaped and the queue's
+    feeder thread joined, so nothing outlives the call.
+    """
+    results = ctx.Queue()
+    processes = {}
+    try:
+        for name, strategy in strategies.items():
+            proc = ctx.Process(
+                target=_worker,
+                args=(name, strategy, equations, values, want, results),
+                daemon=True,
+            )
+            proc.start()
+            processes[name] = proc
+        yield processes, results
+    finally:
+        for proc in processes.values():
+            if proc.is_alive():
+                proc.terminate()
+        for proc in processes.values():
+            proc.join()
+            proc.close()
+        results.close()
+        results.join_thread()
+
+
+def solve_portfolio(
+    equations,
+    values,
+    want,
+    timeout=60.0,
+    strategies=None,
+    return_strategy=False,
+    poll_interval=0.05,
+):
+    """
+    Launch every strategy at once and return the first valid solution list.
+
+    timeout is either one budget in seconds shared by all strategies or a
+    dict {strategy name: seconds}. strategies defaults to STRATEGIES and
+    may be any dict of picklable top-level functions
+    f(equations, values, want) -> [Eq(want, expr), ...].
+
+    Raises TimeoutError if every strategy ran out of time, ValueError if
+    they all finished without a valid result.
+    """
+    if strategies is None:
+        strategies = STRATEGIES
+
+    if isinstance(timeout, dict):
+        budgets = {name: timeout.get(name, 60.0) for name in strategies}
+    else:
+        budgets = {name: timeout for name in strategies}
+
+    ctx = multiprocessing.get_context()
+    start = time.monotonic()
+    errors = {}
+    timed_out = set()
+
+    with _running(ctx, strategies, equations, values, want) as (processes, results):
+        while len(errors) + len(timed_out) < len(processes):
+            try:
+                name, ok, payload = results.get(timeout=poll_interval)
+            except queue_module.Empty:
+                elapsed = time.monotonic() - start
+                for name, proc in processes.items():
+                    if name in errors or name in timed_out:
+                        continue
+                    if elapsed > budgets[name]:
+                        proc.terminate()
+                        timed_out.add(name)
+                    elif not proc.is_alive() and proc.exitcode not in (0, None):
+                        errors[name] = f"process exited with code {proc.exitcode}"
+                continue
+
+            if ok and _is_valid(payload, values, want):
+                if return_strategy:
+                    return payload, name
+                return payload
+
+            errors[name] = payload if not ok else "no valid solution"
+
+    if errors:
+        details = "; ".join(f"{name}: {msg}" for name, msg in errors.items())
+        if timed_out:
+            details += f"; timed out: {', '.join(sorted(timed_out))}"
+        raise ValueError(f"No strategy found a solution ({details}).")
+    raise TimeoutError(f"All strategies exceeded their time budget: {', '.join(sorted(timed_out))}.")
@@ -0,0 +1,194 @@
+"""
+preprocess.py
+
+Structural preprocessing of an equation system in one pass over a
+symbol -> equations index:
+
+- tautologies (True, Eq(x, x)) and duplicates (Eq(a, b) / Eq(b, a) /
+  Eq(a - b, 0)) are dropped; a literal False raises
+- zero folding: Eq(u, 0) for an unknown u substitutes u = 0 into the
+  equations containing u (which may expose more zeros, tautologies and
+  duplicates)
+- singleton removal: an equation with an unknown that appears in no other
+  equation only determines that unknown, so it is dropped (never the
+  equations containing `want`); dropping it can make further unknowns
+  singletons
+- connectivity pruning: equations not reachable from `want` through
+  shared unknowns are dropped (IncidenceMatrix.reachable)
+
+Every step is driven by a worklist, so the work is linear in the total
+number of symbol occurrences (plus the substitutions zero folding does).
+What was removed, and why, is reported.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+import sympy as sp
+
+from combine_equations.incidence import IncidenceMatrix
+from combine_equations.instrumentation import phase
+from combine_equations.isolation import _canonical
+
+
+@dataclass(frozen=True)
+class Removal:
+    equation: object
+    reason: str  # "tautology", "duplicate", "zero", "singleton" or "disconnected"
+    symbol: object = None
+
+
+@dataclass
+class Preprocessed:
+    equations: list
+    unknowns: set
+    removed: list = field(default_factory=list)
+    zeros: list = field(default_factory=list)
+
+
+def _is_true(eq):
+    return eq is True or eq == sp.S.true
+
+def _is_false(eq):
+    return eq is False or eq == sp.S.false
+
+def _symbols(eq):
+    return getattr(eq, "free_symbols", set())
+
+
+def remove_singletons(equations_syms, knowns, want, active=None):
+    """
+    Worklist singleton removal. Returns [(equation index, symbol)] in
+    removal order. Only symbols outside `knowns` count.
+    """
+    if active is None:
+        active = set(range(len(equations_syms)))
+    else:
+        active = set(active)
+
+    index = {}
+    for i in active:
+        for sym in equations_syms[i]:
+            if sym not in knowns:
+                index.setdefault(sym, set()).add(i)
+
+    removed = []
+    pending = deque(sym for sym, ids in index.items() if len(ids) == 1)
+    while pending:
+        sym = pending.popleft()
+        ids = index.get(sym)
+        if not ids or len(ids) != 1:
+            continue
+        (i,) = ids
+        if i not in active or want in equations_syms[i]:
+            continue
+        active.discard(i)
+        removed.append((i, sym))
+        for other in equations_syms[i]:
+            other_ids = index.get(other)
+            if other_ids is None:
+                continue
+            other_ids.discard(i)
+            if len(other_ids) == 1:
+                pending.append(other)
+    return removed
+
+
+def preprocess_equations(equations, values, want, singletons=True, zeros=True, prune=True):
+    with phase("preprocess", equations=len(equations)):
+        return _preprocess_equations(equations, values, want, singletons, zeros, prune)
+
+def _preprocess_equations(equations, values, want, singletons, zeros, prune):
+    knowns = set(values)
+    eqs = list(equations)
+    removed = []
+    folded = []
+
+    active = set()
+    seen = {}
+
+    def admit(i):
+        # Tautology / duplicate check for equation i (possibly rewritten).
+        eq = eqs[i]
+        if _is_true(eq):
+            removed.append(Removal(eq, "tautology"))
+            return False
+        if _is_false(eq):
+            raise ValueError("Inconsistent equation: False.")
+        try:
+            key = _canonical(eq)
+            hash(key)
+        except (TypeError, sp.SympifyError):
+            key = ("id", i)
+        if key in seen and seen[key] != i and seen[key] in active:
+            removed.append(Removal(eq, "duplicate"))
+            return False
+        seen[key] = i
+        active.add(i)
+        return True
+
+    for i in range(len(eqs)):
+        admit(i)
+
+    if zeros:
+        index = {}
+        for i in active:
+            for sym in _symbols(eqs[i]):
+                index.setdefault(sym, set()).add(i)
+
+        def zero_of(eq):
+            if not isinstance(eq, sp.Equality):
+                return None
+            for side, other in ((eq.lhs, eq.rhs), (eq.rhs, eq.lhs)):
+                if isinstance(side, sp.Symbol) and other == 0 and side not in knowns and side != want:
+                    return side
+            return None
+
+        pending = deque(sorted(active))
+        while pending:
+            i = pending.popleft()
+            if i not in active:
+                continue
+            sym = zero_of(eqs[i])
+            if sym is None:
+                continue
+            active.discard(i)
+            removed.append(Removal(eqs[i], "zero", sym))
+            folded.append(sym)
+            for j in sorted(index.pop(sym, ())):
+                if j not in active:
+                    continue
+                before = _symbols(eqs[j])
+                eqs[j] = eqs[j].xreplace({sym: sp.S.Zero})
+                active.discard(j)
+                if admit(j):
+                    after = _symbols(eqs[j])
+                    for gone in before - after:
+                        index.get(gone, set()).discard(j)
+                    pending.append(j)
+
+    syms = [_symbols(eq) for eq in eqs]
+
+    if singletons:
+        order = sorted(active)
+        for i, sym in remove_singletons(syms, knowns, want, active=order):
+            active.discard(i)
+            removed.append(Removal(eqs[i], "singleton", sym))
+
+    kept = sorted(active)
+    unknowns, reached = IncidenceMatrix([eqs[i] for i in kept]).reachable(want, knowns)
+    if prune:
+        reached = set(reached)
+        for pos, i in enumerate(kept):
+            if pos not in reached:
+                active.discard(i)
+                removed.append(Removal(eqs[i], "disconnected"))
+
+    return Preprocessed(
+        equations=[eqs[i] for i in sorted(active)],
+        unknowns=unknowns,
+        removed=removed,
+        zeros=folded,
+    )
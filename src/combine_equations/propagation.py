@@ -0,0 +1,103 @@
+"""
+propagation.py
+
+Spreadsheet-style propagation of known values.
+
+Any equation with exactly one unknown left is solved for it (a cheap
+univariate solve), that unknown joins the known set, and only the
+equations containing it are re-examined, via a symbol -> equation index.
+Knowns stay symbolic, so propagated results read like formulas:
+  b_1_v_y = b0_vel_mag*sin(b0_vel_angle) - b_1_t*g
+
+Only the residual coupled core is left for the heavy solver.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import sympy as sp
+
+from combine_equations.isolation import isolate
+
+
+def _is_true(eq):
+    return eq is True or eq == sp.S.true
+
+def _is_false(eq):
+    return eq is False or eq == sp.S.false
+
+
+def propagate_knowns(equations, values):
+    """
+    Returns (residual, solved, trace):
+
+      residual - equations still containing unknowns, with every propagated
+                 symbol substituted
+      solved   - {symbol: expression in the knowns}
+      trace    - [(source equation, Eq(symbol, expression)), ...] in the
+                 order the symbols were determined
+
+    Equations whose single unknown has several roots (e.g. a quadratic in
+    time) are left in the residual rather than picking a branch.
+    """
+    knowns = set(values)
+    eqs = list(equations)
+
+    unknowns_in = []
+    index: dict = {}
+    for i, eq in enumerate(eqs):
+        syms = set(getattr(eq, "free_symbols", set())) - knowns
+        unknowns_in.append(syms)
+        for sym in syms:
+            index.setdefault(sym, []).append(i)
+
+    active = set(range(len(eqs)))
+    worklist = deque(i for i, syms in enumerate(unknowns_in) if len(syms) == 1)
+
+    solved = {}
+    trace = []
+
+    def substituted(i):
+        eq = eqs[i]
+        replacements = {s: solved[s] for s in eq.free_symbols if s in solved}
+        return eq.xreplace(replacements) if replacements else eq
+
+    while worklist:
+        i = worklist.popleft()
+        if i not in active or len(unknowns_in[i]) != 1:
+            continue
+
+        (sym,) = unknowns_in[i]
+        eq = substituted(i)
+        if _is_true(eq):
+            active.discard(i)
+            continue
+        if _is_false(eq):
+            raise ValueError(f"Inconsistent equation: {eqs[i]}")
+
+        try:
+            sols = isolate(eq, sym)
+        except Exception:
+            continue
+        if len(sols) != 1 or sym in sp.sympify(sols[0]).free_symbols:
+            continue
+
+        expr = sols[0]
+        solved[sym] = expr
+        trace.append((eqs[i], sp.Eq(sym, expr)))
+        active.discard(i)
+
+        for j in index.get(sym, ()):
+            unknowns_in[j].discard(sym)
+            if j in active and len(unknowns_in[j]) == 1:
+                worklist.append(j)
+
+    residual = []
+    for i in sorted(active):
+        eq = substituted(i)
+        if _is_true(eq):
+            continue
+        residual.append(eq)
+
+    return residual, solved, trace
@@ -0,0 +1,73 @@
+"""
+rationalize.py
+
+Keeping floats out of sp.solve.
+
+Known values like g = 9.81 or math.radians(53.1), once substituted into
+the equations, make sp.solve work in floating point: slower, and prone to
+missed cancellations and near-duplicate roots. The solve entry points
+take `rationalize=`:
+
+  False       - leave everything as it is
+  True        - replace floats (in the equations and in `values`) with
+                the exact rationals they stand for
+  "symbolic"  - replace each distinct float in the equations with a known
+                placeholder symbol
+
+Either way the system is solved exactly and the numbers only come back at
+the end: numeric results are evaluated with sp.N, placeholders are
+substituted back.
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+
+
+RATIONALIZE_MODES = (False, True, "symbolic")
+
+
+def _is_float(value):
+    return isinstance(value, (float, sp.Float))
+
+def _floats(equations):
+    found = set()
+    for eq in equations:
+        if isinstance(eq, sp.Basic):
+            found |= eq.atoms(sp.Float)
+    return sorted(found, key=float)
+
+
+def rationalize_system(equations, values, mode):
+    """
+    Returns (equations, values, restore), where restore(solutions) turns
+    the exact solutions back into the form the caller expects.
+    """
+    if mode not in RATIONALIZE_MODES:
+        raise ValueError(f"Unsupported rationalize: {mode!r}")
+
+    floats = _floats(equations)
+
+    if mode == "symbolic":
+        placeholders = {f: sp.Dummy(f"c{i}") for i, f in enumerate(floats)}
+        equations = [
+            eq.xreplace(placeholders) if isinstance(eq, sp.Basic) else eq for eq in equations
+        ]
+        values = dict(values)
+        values.update({c: f for f, c in placeholders.items()})
+        back = {c: f for f, c in placeholders.items()}
+    else:
+        exact = {f: sp.nsimplify(f, rational=True) for f in floats}
+        equations = [eq.xreplace(exact) if isinstance(eq, sp.Basic) else eq for eq in equations]
+        values = {
+            sym: sp.nsimplify(value, rational=True) if _is_float(value) else value
+            for sym, value in values.items()
+        }
+        back = {}
+
+    def restore(solutions):
+        if not floats:
+            return solutions
+        return [sp.Eq(sol.lhs, sp.N(sol.rhs.xreplace(back))) for sol in solutions]
+
+    return equations, values, restore
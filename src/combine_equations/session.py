@@ -0,0 +1,205 @@
+"""
+session.py
+
+Stateful solver for interactive use: equations and values are added and
+removed one at a time, and each re-solve only redoes the work the change
+actually affects.
+
+The session keeps
+- the preprocessed form of every equation (clear_zero_denominators runs
+  once per equation, at add time),
+- a symbol -> equation index, to find the blocks a change touches,
+- the local solution of every block from the block-triangular
+  decomposition, keyed on (equation ids, unknowns).
+
+A block's local solution is computed with everything outside the block
+kept symbolic, so it only depends on its key. Changing the numeric value
+of a known re-solves nothing; making a symbol known or unknown, or
+adding/removing an equation, only drops the blocks that touch it.
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+
+from combine_equations.block_triangular import block_triangular_decomposition
+from combine_equations.incidence import IncidenceMatrix
+from combine_equations.solve_system import (
+    clear_zero_denominators,
+    _apply_check,
+    _extend_branch,
+    _is_false_expr,
+    _is_true_expr,
+    _solve_linear_block,
+)
+
+
+class SolverSession:
+
+    def __init__(self, equations=(), values=None):
+        self._equations = {}
+        self._prepared = {}
+        self._index = {}
+        self._next_id = 0
+        self._blocks = {}
+        self._results = {}
+        self.values = {}
+        self.stats = {"block_solves": 0, "block_reuses": 0}
+
+        for eq in equations:
+            self.add_equation(eq)
+        for sym, value in (values or {}).items():
+            self.set_value(sym, value)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    @property
+    def equations(self):
+        return list(self._equations.values())
+
+    def add_equation(self, eq) -> int:
+        """Add an equation; returns its id for remove_equation."""
+        eq_id = self._next_id
+        self._next_id += 1
+
+        self._equations[eq_id] = eq
+        self._prepared[eq_id] = clear_zero_denominators([eq])[0]
+        for sym in getattr(eq, "free_symbols", set()):
+            self._index.setdefault(sym, set()).add(eq_id)
+
+        self._results.clear()
+        return eq_id
+
+    def remove_equation(self, eq_id):
+        eq = self._equations.pop(eq_id)
+        del self._prepared[eq_id]
+        for sym in getattr(eq, "free_symbols", set()):
+            ids = self._index.get(sym)
+            if ids is not None:
+                ids.discard(eq_id)
+                if not ids:
+                    del self._index[sym]
+
+        self._blocks = {
+            key: sols for key, sols in self._blocks.items() if eq_id not in key[0]
+        }
+        self._results.clear()
+
+    def set_value(self, sym, value):
+        if sym not in self.values:
+            self._invalidate_symbol(sym)
+        self.values[sym] = value
+        # Redundant equations are checked numerically when branches are
+        # combined, so composed results depend on the values; block
+        # solutions don't.
+        self._results.clear()
+
+    def remove_value(self, sym):
+        del self.values[sym]
+        self._invalidate_symbol(sym)
+
+    def update_values(self, values):
+        for sym, value in values.items():
+            self.set_value(sym, value)
+
+    def _invalidate_symbol(self, sym):
+        # Only the known set matters structurally; blocks containing `sym`
+        # would now be keyed differently.
+        touching = self._index.get(sym, set())
+        self._blocks = {
+            key: sols for key, sols in self._blocks.items()
+            if not touching.intersection(key[0])
+        }
+        self._results.clear()
+
+    # ------------------------------------------------------------------
+    # Solving
+    # ------------------------------------------------------------------
+
+    def _connected(self, want):
+        ids = sorted(self._equations)
+        matrix = IncidenceMatrix([self._equations[i] for i in ids], self.values)
+        needed, rows = matrix.reachable(want, self.values)
+        return needed, [ids[row] for row in rows]
+
+    def _solve_block(self, key, eqs):
+        cached = self._blocks.get(key)
+        if cached is not None:
+            self.stats["block_reuses"] += 1
+            return cached
+
+        self.stats["block_solves"] += 1
+        unknowns = list(key[1])
+        linear = _solve_linear_block(eqs, unknowns)
+        if linear is not None:
+            sols = [linear[0]]
+        else:
+            sols = sp.solve(eqs, unknowns, dict=True)
+        self._blocks[key] = sols
+        return sols
+
+    def solve(self, want):
+        """Return [Eq(want, expr), ...] with the knowns kept symbolic."""
+        if want in self.values:
+            return [sp.Eq(want, want)]
+        if want in self._results:
+            return list(self._results[want])
+
+        unknowns, eq_ids = self._connected(want)
+        order = sorted(unknowns, key=sp.default_sort_key)
+
+        prepared = []
+        ids = []
+        for eq_id in eq_ids:
+            eq = self._prepared[eq_id]
+            if _is_true_expr(eq):
+                continue
+            if _is_false_expr(eq):
+                raise ValueError("Inconsistent equation: False.")
+            prepared.append(eq)
+            ids.append(eq_id)
+
+        incidence = [
+            [u for u in order if u in eq.free_symbols] for eq in prepared
+        ]
+        decomposition = block_triangular_decomposition(incidence)
+        block_ids, check_ids = decomposition.needed_for(want)
+        if not block_ids:
+            raise ValueError("No solutions found.")
+
+        pending_checks = [decomposition.checks[i] for i in check_ids]
+        done = set()
+        branches = [{}]
+
+        for idx in block_ids:
+            block = decomposition.blocks[idx]
+            key = (tuple(ids[i] for i in block.equations), block.unknowns)
+            local = self._solve_block(key, [prepared[i] for i in block.equations])
+
+            branches = [
+                _extend_branch(branch, {u: expr.xreplace(branch) for u, expr in sol.items()})
+                for branch in branches
+                for sol in local
+            ]
+            done.add(idx)
+
+            ready = [c for c in pending_checks if done.issuperset(c.depends_on)]
+            for check in ready:
+                pending_checks.remove(check)
+                branches = _apply_check(branches, prepared[check.equation], check.unknowns, self.values)
+
+            if not branches:
+                break
+
+        results = [sp.Eq(want, branch[want]) for branch in branches if want in branch]
+        if not results:
+            raise ValueError("No solutions found.")
+
+        self._results[want] = results
+        return list(results)
+
+    def evaluate(self, want):
+        """Numeric value of every solution branch for the current values."""
+        return [sp.N(sol.rhs.subs(self.values)) for sol in self.solve(want)]
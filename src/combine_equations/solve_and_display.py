@@ -2,33 +2,97 @@
 import sympy as sp
 from combine_equations.solve_system import *
 from combine_equations.display_equations import display_equation_
+from combine_equations.portfolio import solve_portfolio
+from combine_equations.numeric_eval import evaluate_solution
 
-def solve_and_display_(equations, values, want, version=1, return_solutions=False):
-    
+def _solve_version(equations, values, want, version):
     if version == 1:
-        tmp = solve_system_multiple_solutions(equations, values, want)
+        return solve_system_multiple_solutions(equations, values, want)
     elif version == 0:
-        tmp = solve_system_multiple_solutions_000(equations, values, want)
+        return solve_system_multiple_solutions_000(equations, values, want)
     elif version == 2:
-        tmp = solve_with_elimination_attempts(equations, values, want)
-    else:
-        raise ValueError(f"Unsupported version: {version}")
+        return solve_with_elimination_attempts(equations, values, want)
+    elif version == 3:
+        return solve_system_blocks(equations, values, want)
+    elif version == 4:
+        return solve_portfolio(equations, values, want)
+    raise ValueError(f"Unsupported version: {version}")
+
+def solve_and_display_(equations, values, want, version=1, return_solutions=False, precision=None):
+    
+    tmp = _solve_version(equations, values, want, version)
+
+    # Evaluated once; display and return_solutions share the results.
+    numeric = [evaluate_solution(sol, values, precision) for sol in tmp]
     
     for index, sol in enumerate(tmp):
         if len(tmp) > 1:
             print(f"Solution {index+1}:")
         display_equation_(sol, values, want=want)
         # display_equation_(sol.subs(values), values, want=want)
-        display_equation_(sp.N(sol.subs(values)), values, want=want)
+        display_equation_(numeric[index], values, want=want)
         
     if return_solutions:
 
         solutions = []
 
-        for sol in tmp:
-            symbolic = sol
-            numeric = sp.N(sol.subs(values))
-            solutions.append([symbolic, numeric])
+        for sol, value in zip(tmp, numeric):
+            solutions.append([sol, value])
 
         return solutions
 
+
+
+def _batch_columns(values_batch):
+    if isinstance(values_batch, dict):
+        return dict(values_batch)
+    rows = list(values_batch)
+    if not rows:
+        raise ValueError("values_batch is empty.")
+    return {sym: [row[sym] for row in rows] for sym in rows[0]}
+
+def solve_many(equations, values_batch, want, version=1):
+    """
+    Solve once symbolically, then evaluate every solution branch over a
+    whole batch of known values in one vectorized NumPy call per branch.
+
+    values_batch is either {symbol: sequence of values} or a list of
+    values dicts (all with the same keys).
+
+    Returns (solutions, arrays): the symbolic Eq(want, expr) branches and
+    one float array per branch. Rows where a branch is complex or
+    undefined are NaN. Needs NumPy (the `numpy` extra).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("solve_many needs numpy: pip install 'combine-equations[numpy]'") from None
+
+    columns = _batch_columns(values_batch)
+    knowns = list(columns)
+
+    solutions = _solve_version(equations, {sym: sym for sym in knowns}, want, version)
+
+    args = [np.asarray(columns[sym], dtype=float) for sym in knowns]
+    n_rows = np.broadcast(*args).size if args else 1
+
+    arrays = []
+    for sol in solutions:
+        missing = sol.rhs.free_symbols - set(knowns)
+        if missing:
+            raise ValueError(f"Solution depends on symbols without values: {sorted(map(str, missing))}")
+
+        f = sp.lambdify(knowns, sol.rhs, modules="numpy")
+        with np.errstate(all="ignore"):
+            out = np.asarray(f(*args))
+
+        if np.iscomplexobj(out):
+            real = out.real.copy()
+            real[np.abs(out.imag) > 1e-12 * np.maximum(1.0, np.abs(out.real))] = np.nan
+            out = real
+
+        out = np.array(np.broadcast_to(out, (n_rows,)), dtype=float)
+        out[~np.isfinite(out)] = np.nan
+        arrays.append(out)
+
+    return solutions, arrays
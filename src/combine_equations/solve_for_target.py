@@ -149,6 +149,7 @@ def solve_for_target(
     target,
     known=None,
     exclude=None,
+    all_solutions=False,
 ):
     known = known or {}
     exclude = set(exclude or [])
@@ -182,4 +183,6 @@ def solve_for_target(
 
     candidates = [sp.simplify(sp.cancel(sp.together(c))) for c in candidates]
     candidates.sort(key=sp.count_ops)
+    if all_solutions:
+        return candidates
     return candidates[0]
@@ -1,7 +1,17 @@
 
 from combine_equations.misc import combine_equations_sp
 from combine_equations.misc import isolate_variable
-from combine_equations.eliminate_variable_subst import eliminate_variable_subst
+from combine_equations.eliminate_variable_subst import eliminate_variable_subst, _eliminate_variable_subst
+from combine_equations.block_triangular import block_triangular_decomposition, SolvedBlock
+from combine_equations.template_cache import resolve_cache, symbolic_values
+from combine_equations.propagation import propagate_knowns
+from combine_equations.zero_test import is_zero
+from combine_equations.instrumentation import emit, count, phase, expression_size
+from combine_equations.dimensions import DimensionError, check_dimensions, derive_dimensions, infer
+from combine_equations.equation_system import EquationSystem
+from combine_equations.incidence import IncidenceMatrix
+from combine_equations.preprocess import preprocess_equations, remove_singletons
+from combine_equations.rationalize import rationalize_system
 
 # def solve_system(equations, values, want):
 #     knowns = list(values.keys())
@@ -51,12 +61,14 @@ from combine_equations.eliminate_variable_subst import eliminate_variable_subst
 import time
 
 import sympy as sp
+from sympy.solvers.solveset import NonlinearError
 
 def _safe_simplify(expr):
-    try:
-        return sp.simplify(expr)
-    except Exception:
-        return expr
+    with phase("simplify", ops=lambda: expression_size(expr)):
+        try:
+            return sp.simplify(expr)
+        except Exception:
+            return expr
 
 def _is_false_expr(expr):
     return expr is False or expr == sp.S.false
@@ -64,38 +76,21 @@ def _is_false_expr(expr):
 def _is_true_expr(expr):
     return expr is True or expr == sp.S.true
 
-def _format_elapsed(seconds):
-    if seconds >= 60:
-        minutes = int(seconds // 60)
-        remainder = seconds - (minutes * 60)
-        return f"{minutes}m {remainder:05.2f}s"
-    return f"{seconds:.3f}s"
-
 def eliminate_singleton_equations(equations, want):
+    # Every symbol counts here (not just unknowns); see preprocess for the
+    # values-aware version.
     eqs = list(equations)
-    removed = []
-
-    changed = True
-    while changed:
-        changed = False
-        counts = {}
-        for eq in eqs:
-            for sym in getattr(eq, "free_symbols", set()):
-                counts[sym] = counts.get(sym, 0) + 1
-
-        for idx, eq in enumerate(eqs):
-            symset = getattr(eq, "free_symbols", set())
-            if not symset or want in symset:
-                continue
-            if any(counts.get(sym, 0) == 1 for sym in symset):
-                removed.append(eq)
-                eqs.pop(idx)
-                changed = True
-                break
-
-    return eqs, removed
+    syms = [getattr(eq, "free_symbols", set()) for eq in eqs]
+    dropped = remove_singletons(syms, set(), want)
+    gone = {i for i, _ in dropped}
+    removed = [eqs[i] for i, _ in dropped]
+    return [eq for i, eq in enumerate(eqs) if i not in gone], removed
 
 def filter_equations_for_unknowns(equations, unknowns, equations_sub=None):
+    with phase("filter_equations", equations=len(equations)):
+        return _filter_equations_for_unknowns(equations, unknowns, equations_sub)
+
+def _filter_equations_for_unknowns(equations, unknowns, equations_sub):
     if equations_sub is None:
         equations_sub = equations
     if len(equations_sub) != len(equations):
@@ -114,10 +109,11 @@ def filter_equations_for_unknowns(equations, unknowns, equations_sub=None):
             continue
 
         if isinstance(eq_sub, sp.Equality):
-            diff = _safe_simplify(eq_sub.lhs - eq_sub.rhs)
+            diff = eq_sub.lhs - eq_sub.rhs
+            # Only symbols of knowns left: nothing to check here.
             if getattr(diff, "free_symbols", set()):
                 continue
-            if _safe_simplify(diff) == 0:
+            if is_zero(diff):
                 continue
             raise ValueError("Inconsistent equation with no unknowns.")
 
@@ -133,23 +129,12 @@ def filter_equations_for_unknowns(equations, unknowns, equations_sub=None):
     return filtered
 
 def connected_unknowns(equations, values, want):
-    knowns = set(values.keys())
-    eqs = [eq.subs(values) for eq in equations]
-
-    needed = {want}
-    changed = True
-
-    while changed:
-        changed = False
-        for eq in eqs:
-            unknowns_in_eq = eq.free_symbols - knowns
-            if unknowns_in_eq & needed:
-                new_needed = needed | unknowns_in_eq
-                if new_needed != needed:
-                    needed = new_needed
-                    changed = True
+    with phase("connected_unknowns", equations=len(equations)):
+        return _connected_unknowns(equations, values, want)
 
-    return needed  # includes want
+def _connected_unknowns(equations, values, want):
+    matrix = IncidenceMatrix(equations, values)
+    return matrix.connected_unknowns(want, values)  # includes want
 
 
 # def solve_system_2(equations, values, want):
@@ -193,6 +178,10 @@ def connected_unknowns(equations, values, want):
 
 
 def clear_zero_denominators(eqs):
+    with phase("clear_zero_denominators", equations=len(eqs)):
+        return _clear_zero_denominators(eqs)
+
+def _clear_zero_denominators(eqs):
     out = []
     for eq in eqs:
         if not isinstance(eq, sp.Equality):
@@ -201,11 +190,11 @@ def clear_zero_denominators(eqs):
 
         # Only do this for Eq(expr, 0) or Eq(0, expr)
         lhs, rhs = eq.lhs, eq.rhs
-        if sp.simplify(rhs) == 0:
+        if is_zero(rhs):
             expr = sp.together(lhs)
             num, den = sp.fraction(expr)
             out.append(sp.Eq(sp.simplify(num), 0))
-        elif sp.simplify(lhs) == 0:
+        elif is_zero(lhs):
             expr = sp.together(rhs)
             num, den = sp.fraction(expr)
             out.append(sp.Eq(sp.simplify(num), 0))
@@ -216,13 +205,80 @@ def clear_zero_denominators(eqs):
 
 
 
-def solve_system_multiple_solutions(equations, values, want, check_knowns=False):
+def solve_system_multiple_solutions(
+    equations,
+    values,
+    want,
+    check_knowns=False,
+    method="full",
+    cache=None,
+    propagate=False,
+    return_trace=False,
+    rationalize=False,
+):
+
+    if rationalize:
+        equations, values, restore = rationalize_system(equations, values, rationalize)
+        result = solve_system_multiple_solutions(
+            equations, values, want, check_knowns=check_knowns, method=method,
+            cache=cache, propagate=propagate, return_trace=return_trace,
+        )
+        if return_trace:
+            return restore(result[0]), result[1]
+        return restore(result)
+
+    # Results only depend on which symbols are known, so a solved template
+    # can be reused for any values. check_knowns looks at the values
+    # themselves, so it always solves from scratch.
+    cache = resolve_cache(cache)
+    if cache is not None and not check_knowns:
+        key = cache.key(equations, values, want, solver="multiple", method=method, propagate=propagate)
+        cached = cache.get(key)
+        if cached is None:
+            cached = solve_system_multiple_solutions(
+                equations, symbolic_values(values), want,
+                method=method, propagate=propagate, return_trace=True,
+            )
+            cache.put(key, cached)
+        solutions, trace = cached
+        solutions = _drop_violating_solutions(solutions, want, values)
+        if return_trace:
+            return list(solutions), list(trace)
+        return list(solutions)
+
+    if propagate:
+        unknowns = connected_unknowns(equations, values, want)
+        related = [
+            eq for eq in equations
+            if getattr(eq, "free_symbols", set()) & unknowns
+        ]
+        residual, solved, trace = propagate_knowns(related, values)
+        if want in solved:
+            solutions = [sp.Eq(want, solved[want])]
+        else:
+            solutions = solve_system_multiple_solutions(
+                residual, values, want, check_knowns=check_knowns, method=method,
+            )
+        if return_trace:
+            return solutions, trace
+        return solutions
+
+    if return_trace:
+        solutions = solve_system_multiple_solutions(
+            equations, values, want, check_knowns=check_knowns, method=method,
+        )
+        return solutions, []
+
+    if method == "blocks":
+        return solve_system_blocks(equations, values, want, check_knowns=check_knowns)
+    if method != "full":
+        raise ValueError(f"Unsupported method: {method}")
 
     unknowns = connected_unknowns(equations, values, want)
 
     unknowns = list(unknowns)
 
-    print("Solving for unknowns:", unknowns)
+    emit("unknowns", unknowns=[str(u) for u in unknowns])
 
     equations = clear_zero_denominators(equations)
     equations_sub = None
@@ -230,13 +286,18 @@ def solve_system_multiple_solutions(equations, values, want, check_knowns=False)
         equations_sub = [eq.subs(values) for eq in equations]
     equations = filter_equations_for_unknowns(equations, set(unknowns), equations_sub)
 
-    solutions = sp.solve(equations, unknowns, dict=True)
+    with phase("solve", unknowns=len(unknowns), ops=lambda: expression_size(equations)):
+        solutions = sp.solve(equations, unknowns, dict=True)
 
     if len(solutions) == 0:
         raise ValueError("No solutions found.")
    
     # print("Raw solutions:", solutions)
 
+    solutions = _drop_assumption_violations(solutions, unknowns, values)
+    if len(solutions) == 0:
+        raise ValueError("No solutions satisfy the symbols' assumptions.")
+
     results = []
     
     for item in solutions:
@@ -245,6 +306,251 @@ def solve_system_multiple_solutions(equations, values, want, check_knowns=False)
     return results
 
 
+def _branch_consistent(residual_eq, values, tol=1e-9):
+    lhs = sp.N(residual_eq.lhs.subs(values))
+    rhs = sp.N(residual_eq.rhs.subs(values))
+    if not (lhs.is_number and rhs.is_number):
+        return True
+    try:
+        lhs, rhs = complex(lhs), complex(rhs)
+    except (TypeError, ValueError):
+        return True
+    return abs(lhs - rhs) <= tol * max(1.0, abs(lhs), abs(rhs))
+
+# Assumption -> test on the numeric value, for the ones the model
+# constructors attach (kinematics_states, assumptions=True).
+_ASSUMPTION_CHECKS = (
+    ("positive", lambda c: c.real > 0),
+    ("nonnegative", lambda c: c.real >= 0),
+    ("real", lambda c: True),
+)
+
+def _violates_assumptions(sym, expr, values, tol=1e-9):
+    names = [name for name, _ in _ASSUMPTION_CHECKS if sym.assumptions0.get(name)]
+    if not names:
+        return False
+    if any(getattr(expr, f"is_{name}") is False for name in names):
+        return True
+    value = sp.N(expr.subs(values))
+    if not value.is_number:
+        return False
+    try:
+        c = complex(value)
+    except (TypeError, ValueError):
+        return False
+    if abs(c.imag) > tol * max(1.0, abs(c.real)):
+        return True
+    tests = dict(_ASSUMPTION_CHECKS)
+    return not all(tests[name](c) for name in names)
+
+def _drop_assumption_violations(branches, unknowns, values):
+    kept = []
+    for branch in branches:
+        bad = next(
+            (u for u in unknowns if u in branch and _violates_assumptions(u, branch[u], values)),
+            None,
+        )
+        if bad is not None:
+            count("assumption_prunes", variable=str(bad))
+            continue
+        kept.append(branch)
+    return kept
+
+def _drop_violating_solutions(solutions, want, values):
+    # Cached templates are solved with every known left symbolic, so the
+    # assumption checks can only be settled against the caller's values.
+    kept = [
+        sol for sol in solutions
+        if _drop_assumption_violations([{want: sol.rhs}], [want], values)
+    ]
+    if solutions and not kept:
+        raise ValueError("No solutions satisfy the symbols' assumptions.")
+    return kept
+
+def _extend_branch(branch, sol):
+    extended = {sym: expr.xreplace(sol) for sym, expr in branch.items()}
+    extended.update(sol)
+    return extended
+
+def _solve_linear_block(eqs, unknowns):
+    """
+    Solve a square block that is linear in its unknowns with matrix
+    methods. Returns (solution dict, path) or None when the block isn't
+    linear, isn't square or is singular.
+    """
+    if len(eqs) != len(unknowns):
+        return None
+    try:
+        A, b = sp.linear_eq_to_matrix([eq.lhs - eq.rhs for eq in eqs], unknowns)
+    except NonlinearError:
+        return None
+
+    entries = list(A) + list(b)
+    # Exact blocks stay exact; NumPy only for blocks already in floats.
+    if all(entry.is_number for entry in entries) and any(entry.has(sp.Float) for entry in entries):
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            try:
+                x = np.linalg.solve(
+                    np.array(A.tolist(), dtype=float),
+                    np.array(b.tolist(), dtype=float).ravel(),
+                )
+            except (TypeError, np.linalg.LinAlgError):
+                return None
+            return {u: sp.Float(v) for u, v in zip(unknowns, x)}, "linear-numeric"
+
+    # Fraction-free LU: P*A = L*D**-1*U, so U*x = D*L**-1*P*b.
+    try:
+        P, L, D, U = A.LUdecompositionFF()
+    except ValueError:
+        return None
+    if any(sp.cancel(U[i, i]) == 0 for i in range(U.rows)):
+        return None
+    y = L.lower_triangular_solve(P * b)
+    x = U.upper_triangular_solve(D * y)
+    return {u: sp.cancel(v) for u, v in zip(unknowns, x)}, "linear-lu"
+
+def _apply_check(branches, equation, unknowns, values):
+    kept = []
+    for branch in branches:
+        residual = equation.xreplace(branch)
+        if _is_false_expr(residual):
+            continue
+        if _is_true_expr(residual):
+            kept.append(branch)
+            continue
+        # A structurally square block can still be rank deficient
+        # (e.g. the same relation written twice), leaving some of
+        # its unknowns free. Redundant equations then determine them.
+        free = [u for u in unknowns if u in residual.free_symbols]
+        if free:
+            with phase("solve", unknowns=len(free), ops=lambda: expression_size(residual)):
+                sols = sp.solve(residual, free, dict=True)
+            for sol in sols:
+                kept.append(_extend_branch(branch, sol))
+        elif _branch_consistent(residual, values):
+            kept.append(branch)
+    return kept
+
+def solve_system_blocks(equations, values, want, check_knowns=False, return_blocks=False, linear=True, rationalize=False):
+
+    if rationalize:
+        equations, values, restore = rationalize_system(equations, values, rationalize)
+        result = solve_system_blocks(
+            equations, values, want, check_knowns=check_knowns, return_blocks=return_blocks, linear=linear,
+        )
+        if return_blocks:
+            return restore(result[0]), result[1]
+        return restore(result)
+
+    unknowns = connected_unknowns(equations, values, want)
+
+    emit("unknowns", unknowns=[str(u) for u in unknowns])
+
+    equations = clear_zero_denominators(equations)
+    equations_sub = None
+    if check_knowns:
+        equations_sub = [eq.subs(values) for eq in equations]
+    equations = filter_equations_for_unknowns(equations, unknowns, equations_sub)
+
+    order = sorted(unknowns, key=sp.default_sort_key)
+    incidence = []
+    for eq in equations:
+        symset = getattr(eq, "free_symbols", set())
+        incidence.append([u for u in order if u in symset])
+
+    decomposition = block_triangular_decomposition(incidence)
+    block_ids, check_ids = decomposition.needed_for(want)
+    if not block_ids:
+        raise ValueError("No solutions found.")
+
+    pending_checks = [decomposition.checks[i] for i in check_ids]
+    done = set()
+    branches = [{}]
+    solved_blocks = []
+
+    for idx in block_ids:
+        block = decomposition.blocks[idx]
+        block_eqs = [equations[i] for i in block.equations]
+
+        new_branches = []
+        paths = set()
+        for branch in branches:
+            eqs = []
+            rejected = False
+            for eq in block_eqs:
+                eq = eq.xreplace(branch) if branch else eq
+                if _is_true_expr(eq):
+                    continue
+                if _is_false_expr(eq):
+                    rejected = True
+                    break
+                eqs.append(eq)
+            if rejected:
+                continue
+            if not eqs:
+                new_branches.append(branch)
+                continue
+            if linear and block.kind == "square":
+                linear_sol = _solve_linear_block(eqs, list(block.unknowns))
+                if linear_sol is not None:
+                    sol, path = linear_sol
+                    paths.add(path)
+                    new_branches.append(_extend_branch(branch, sol))
+                    continue
+            paths.add("solve")
+            with phase("solve", unknowns=len(block.unknowns), ops=lambda: expression_size(eqs)):
+                sols = sp.solve(eqs, list(block.unknowns), dict=True)
+            for sol in sols:
+                new_branches.append(_extend_branch(branch, sol))
+
+        # Branches a symbol's assumptions rule out (negative magnitudes,
+        # complex components) go before the next block builds on them.
+        branches = _drop_assumption_violations(new_branches, block.unknowns, values)
+        done.add(idx)
+        solved_blocks.append(SolvedBlock(
+            unknowns=block.unknowns,
+            equations=block_eqs,
+            kind=block.kind,
+            branches=len(branches),
+            path=",".join(sorted(paths)),
+        ))
+
+        ready = [c for c in pending_checks if done.issuperset(c.depends_on)]
+        for check in ready:
+            pending_checks.remove(check)
+            branches = _apply_check(branches, equations[check.equation], check.unknowns, values)
+
+        if not branches:
+            break
+
+    results = [sp.Eq(want, branch[want]) for branch in branches if want in branch]
+
+    if len(results) == 0:
+        raise ValueError("No solutions found.")
+
+    if return_blocks:
+        return results, solved_blocks
+    return results
+
+
+def _elimination_candidates(eqs, values, want):
+    unknowns = connected_unknowns(eqs, values, want)
+    candidates = [
+        sym for sym in unknowns if sym != want and sym not in values
+    ]
+
+    system = EquationSystem(eqs, symbols=[want])
+    counts = system.counts(system.mask(candidates))
+    want_related = system.symbols_of(system.union(system.containing(system.mask([want]))))
+
+    candidates.sort(key=lambda s: (s in want_related, counts[s], str(s)))
+    return candidates
+
+
 def solve_with_elimination_attempts(
     equations,
     values,
@@ -252,11 +558,151 @@ def solve_with_elimination_attempts(
     max_elims=10,
     check_knowns=False,
     return_eliminations=False,
+    method="full",
+    cache=None,
+    numeric_fallback=False,
+    backend="substitution",
+    search="greedy",
+    workers=None,
+    beam_width=3,
+    max_growth=None,
+    max_ops=None,
+    preprocess=False,
+    dimensions=None,
+    rationalize=False,
 ):
+    if backend not in ("substitution", "groebner"):
+        raise ValueError(f"Unsupported backend: {backend}")
+    if search not in ("greedy", "branches", "beam"):
+        raise ValueError(f"Unsupported search: {search}")
+
+    if rationalize:
+        equations, values, restore = rationalize_system(equations, values, rationalize)
+        result = solve_with_elimination_attempts(
+            equations, values, want,
+            max_elims=max_elims, check_knowns=check_knowns, return_eliminations=return_eliminations,
+            method=method, cache=cache, numeric_fallback=numeric_fallback, backend=backend,
+            search=search, workers=workers, beam_width=beam_width, max_growth=max_growth,
+            max_ops=max_ops, preprocess=preprocess, dimensions=dimensions,
+        )
+        if return_eliminations:
+            return restore(result[0]), result[1]
+        return restore(result)
+
+    if preprocess:
+        # check_knowns wants every equation without unknowns checked, so
+        # those aren't pruned away.
+        pre = preprocess_equations(equations, values, want, prune=not check_knowns)
+        emit("preprocess", equations=len(equations), kept=len(pre.equations), removed=pre.removed)
+        equations = pre.equations
+
+    if dimensions is not None:
+        # Inconsistent input is rejected here, before any algebra.
+        dimensions = derive_dimensions(equations, dimensions)
+        check_dimensions(equations, dimensions)
+
+    cache = resolve_cache(cache)
+    if cache is not None and not check_knowns:
+        key = cache.key(
+            equations, values, want,
+            solver="elimination_attempts", method=method, max_elims=max_elims,
+            backend=backend, search=search, beam_width=beam_width,
+            max_growth=max_growth, max_ops=max_ops,
+            dimensions=None if dimensions is None else sorted((str(k), v) for k, v in dimensions.items()),
+        )
+        cached = cache.get(key)
+        if cached is None:
+            try:
+                cached = solve_with_elimination_attempts(
+                    equations,
+                    symbolic_values(values),
+                    want,
+                    max_elims=max_elims,
+                    return_eliminations=True,
+                    method=method,
+                    backend=backend,
+                    search=search,
+                    workers=workers,
+                    beam_width=beam_width,
+                    max_growth=max_growth,
+                    max_ops=max_ops,
+                    dimensions=dimensions,
+                )
+            except Exception:
+                # Numeric roots are specific to these values; not cached.
+                if not numeric_fallback:
+                    raise
+                return _numeric_fallback(equations, values, want, return_eliminations, workers)
+            cache.put(key, cached)
+        solutions, eliminations = cached
+        solutions = _drop_violating_solutions(solutions, want, values)
+        if return_eliminations:
+            return list(solutions), list(eliminations)
+        return list(solutions)
+
+    if backend == "groebner":
+        # Imported here: groebner builds on this module.
+        from combine_equations.groebner import NotPolynomialError, solve_groebner
+        try:
+            solutions = solve_groebner(equations, values, want)
+        except NotPolynomialError as err:
+            emit("warning", message=f"Groebner backend not applicable, using substitution. {err}")
+        except ValueError as err:
+            # Substitution (and numeric_fallback) still get their turn.
+            emit("warning", message=f"Groebner backend failed, using substitution. {err}")
+        else:
+            if dimensions is not None:
+                solutions = _dimension_filter(solutions, dimensions, want)
+            if return_eliminations:
+                return solutions, []
+            return solutions
+
+    if search == "branches":
+        # Imported here: branching builds on this module.
+        from combine_equations.branching import solve_with_branches
+        try:
+            solutions, paths = solve_with_branches(
+                equations, values, want,
+                max_elims=max_elims, check_knowns=check_knowns, method=method, workers=workers,
+                max_growth=max_growth, max_ops=max_ops,
+            )
+        except ValueError:
+            if not numeric_fallback:
+                raise
+            return _numeric_fallback(equations, values, want, return_eliminations, workers)
+        if dimensions is not None:
+            kept = _dimension_filter(solutions, dimensions, want)
+            paths = [path for sol, path in zip(solutions, paths) if sol in kept]
+            solutions = kept
+        # One elimination path per solution.
+        if return_eliminations:
+            return solutions, paths
+        return solutions
+
+    if search == "beam":
+        # Imported here: beam_search builds on this module.
+        from combine_equations.beam_search import solve_with_beam_search
+        try:
+            solutions, eliminations = solve_with_beam_search(
+                equations, values, want,
+                max_elims=max_elims, beam_width=beam_width, check_knowns=check_knowns, method=method,
+                max_growth=max_growth, max_ops=max_ops,
+            )
+        except Exception:
+            if not numeric_fallback:
+                raise
+            return _numeric_fallback(equations, values, want, return_eliminations, workers)
+        if dimensions is not None:
+            solutions = _dimension_filter(solutions, dimensions, want)
+        if return_eliminations:
+            return solutions, eliminations
+        return solutions
+
     start_time = time.monotonic()
     eqs = list(equations)
     eliminations = []
     last_err = None
+    swell_aborts = 0
 
     for _ in range(max_elims + 1):
         try:
@@ -265,39 +711,32 @@ def solve_with_elimination_attempts(
                 values,
                 want,
                 check_knowns=check_knowns,
+                method=method,
             )
-            elapsed = time.monotonic() - start_time
-            print(f"Elimination attempts elapsed: {_format_elapsed(elapsed)}")
+            if dimensions is not None:
+                solutions = _dimension_filter(solutions, dimensions, want)
+            emit("phase", name="elimination_attempts", elapsed=time.monotonic() - start_time,
+                 eliminations=len(eliminations), solved=True,
+                 max_growth=max_growth, max_ops=max_ops, swell_aborts=swell_aborts)
             if return_eliminations:
                 return solutions, eliminations
             return solutions
         except Exception as err:
             last_err = err
 
-        unknowns = connected_unknowns(eqs, values, want)
-        candidates = [
-            sym for sym in unknowns if sym != want and sym not in values
-        ]
+        candidates = _elimination_candidates(eqs, values, want)
         if not candidates:
             break
 
-        counts = {sym: 0 for sym in candidates}
-        for eq in eqs:
-            for sym in getattr(eq, "free_symbols", set()):
-                if sym in counts:
-                    counts[sym] += 1
-
-        want_related = set()
-        for eq in eqs:
-            symset = getattr(eq, "free_symbols", set())
-            if want in symset:
-                want_related |= symset
-
-        candidates.sort(key=lambda s: (s in want_related, counts[s], str(s)))
-
         eliminated = False
         for sym in candidates:
-            new_eqs, replacement = eliminate_variable_subst(eqs, sym)
+            with phase("elimination_candidate", symbol=str(sym), ops=lambda: expression_size(eqs)):
+                # A swollen substitution is abandoned and the next
+                # candidate is tried.
+                new_eqs, replacement, aborted = _eliminate_variable_subst(
+                    eqs, sym, 10, max_growth, max_ops,
+                )
+            swell_aborts += aborted
             if replacement is None:
                 continue
             still_present = any(
@@ -314,12 +753,47 @@ def solve_with_elimination_attempts(
         if not eliminated:
             break
 
-    elapsed = time.monotonic() - start_time
-    print(f"Elimination attempts elapsed: {_format_elapsed(elapsed)}")
+    emit("phase", name="elimination_attempts", elapsed=time.monotonic() - start_time,
+         eliminations=len(eliminations), solved=False,
+         max_growth=max_growth, max_ops=max_ops, swell_aborts=swell_aborts)
+    if numeric_fallback:
+        return _numeric_fallback(equations, values, want, return_eliminations, workers)
     if last_err is not None:
         raise last_err
     raise ValueError("No solutions found.")
 
+def _dimension_filter(solutions, dims, want):
+    # Branches whose dimension can't be want's are dropped; unknown ones
+    # are kept. Every search mode raises when nothing is left.
+    kept = []
+    for sol in solutions:
+        if sol.rhs.is_number:
+            kept.append(sol)
+            continue
+        try:
+            dim = infer(sol.rhs, dims)
+        except DimensionError:
+            count("dimension_prunes", variable=str(want))
+            continue
+        if dim is not None and dims.get(want) is not None and dim != dims[want]:
+            count("dimension_prunes", variable=str(want))
+            continue
+        kept.append(sol)
+    if solutions and not kept:
+        raise ValueError("No dimensionally consistent solutions.")
+    return kept
+
+def _numeric_fallback(equations, values, want, return_eliminations, workers=None):
+    # Imported here: numeric_solve builds on this module.
+    from combine_equations.numeric_solve import solve_numeric_multistart
+
+    # Start from the original equations; the eliminations above keep only
+    # one branch per substitution and could hide roots.
+    solutions = solve_numeric_multistart(equations, values, want, workers=workers)
+    if return_eliminations:
+        return solutions, []
+    return solutions
+
 # original version
 
 def solve_system_multiple_solutions_000(equations, values, want):
@@ -328,11 +802,12 @@ def solve_system_multiple_solutions_000(equations, values, want):
 
     unknowns = list(unknowns)
 
-    print("Solving for unknowns:", unknowns)
+    emit("unknowns", unknowns=[str(u) for u in unknowns])
 
     equations = clear_zero_denominators(equations)
 
-    solutions = sp.solve(equations, unknowns, dict=True)
+    with phase("solve", unknowns=len(unknowns), ops=lambda: expression_size(equations)):
+        solutions = sp.solve(equations, unknowns, dict=True)
 
     if len(solutions) == 0:
         raise ValueError("No solutions found.")
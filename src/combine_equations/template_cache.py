@@ -0,0 +1,135 @@
+"""
+template_cache.py
+
+Cache of solved "templates": the symbolic solutions for a given problem
+shape. The shape is the set of equations, the set of known symbols and
+the wanted symbol; the numeric values of the knowns don't matter, since
+the solvers return `Eq(want, expr)` with the knowns left as symbols.
+The one exception is a known that is 0: it can disconnect unknowns and
+settle zero tests, so which knowns are 0 is part of the shape too.
+
+Entries live in an in-memory LRU and, optionally, in a directory of pickle
+files so that a fresh process starts warm.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import sympy as sp
+
+
+class TemplateCache:
+
+    def __init__(self, maxsize=256, directory=None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(equations, values, want, **options) -> str:
+        """
+        Canonical structural key. Equation order doesn't matter; of
+        `values`, only the keys and which of them are 0 are used.
+        """
+        parts = sorted(sp.srepr(eq) for eq in equations)
+        parts.append("known:" + ",".join(sorted(sp.srepr(sym) for sym in values)))
+        parts.append("zero:" + ",".join(sorted(sp.srepr(sym) for sym in _zero_knowns(values))))
+        parts.append("want:" + sp.srepr(want))
+        for name in sorted(options):
+            parts.append(f"{name}:{options[name]!r}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        entry = self._load(key)
+        if entry is not None:
+            self._store(key, entry)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key, entry):
+        self._store(key, entry)
+        if self.directory is not None:
+            self._save(key, entry)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return self.directory / f"{key}.pickle"
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Stale or truncated file; treat as a miss.
+            return None
+
+    def _save(self, key, entry):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+default_template_cache = TemplateCache()
+
+
+def resolve_cache(cache):
+    """`cache=True` selects the shared process-wide cache."""
+    if cache is True:
+        return default_template_cache
+    return cache
+
+
+def _zero_knowns(values):
+    return [sym for sym, value in values.items() if value is not None and value == 0]
+
+
+def symbolic_values(values):
+    """
+    Stand-in for `values` that keeps every known as a symbol, except the
+    ones that are 0 (see TemplateCache.key).
+    """
+    zeros = set(_zero_knowns(values))
+    return {sym: sp.S.Zero if sym in zeros else sym for sym in values}
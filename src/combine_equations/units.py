@@ -0,0 +1,87 @@
+"""
+units.py
+
+Solving with sympy.physics.units quantities in `values`.
+
+Units dragged through subs, simplify and sp.solve bloat every
+expression. Here the known values are converted up front to SI
+magnitudes (45.0*m/s -> 45.0, 88*km/h -> 220/9, 30*degree -> pi/6) plus
+a dimension vector each; the equations are checked for dimensional
+consistency before any solving, the solver runs on plain numbers, and
+the SI unit of `want` is worked out from the solution expression and
+attached to the numeric result.
+
+  strip_units(values)                      -> (magnitudes, dims)
+  solve_with_units(equations, values, want) -> [Eq(want, magnitude * unit)]
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+from sympy.physics.units import radian
+from sympy.physics.units.quantities import Quantity
+from sympy.physics.units.util import convert_to
+
+from combine_equations.dimensions import (
+    BASE_UNITS,
+    DIMENSIONLESS,
+    DimensionError,
+    check_dimensions,
+    dimension_of,
+    infer,
+    unit_for,
+)
+from combine_equations.instrumentation import emit
+from combine_equations.numeric_eval import evaluate
+
+
+def has_units(value):
+    return isinstance(value, sp.Basic) and bool(value.atoms(Quantity))
+
+
+def strip_units(values):
+    """
+    Returns (magnitudes, dims): every value as a plain SI magnitude, and
+    the dimension vector of the values that carried units. Plain numbers
+    get no dimension (0 fits any).
+    """
+    magnitudes = {}
+    dims = {}
+    for sym, value in values.items():
+        if not has_units(value):
+            magnitudes[sym] = value
+            continue
+        si = convert_to(value, list(BASE_UNITS) + [radian])
+        magnitudes[sym] = si.xreplace({q: sp.S.One for q in si.atoms(Quantity)})
+        dims[sym] = dimension_of(value)
+    return magnitudes, dims
+
+
+def solve_with_units(equations, values, want, solver=None, **kwargs):
+    """
+    Solves on SI magnitudes and returns [Eq(want, magnitude * unit)], one
+    per solution. The unit is left off when the solution's dimension
+    can't be worked out from the annotated values.
+    """
+    if solver is None:
+        # Imported here: solve_system is heavy and units is optional.
+        from combine_equations.solve_system import solve_with_elimination_attempts as solver
+
+    magnitudes, dims = strip_units(values)
+    check_dimensions(equations, dims)
+
+    solutions = solver(equations, magnitudes, want, **kwargs)
+
+    results = []
+    for sol in solutions:
+        try:
+            dim = infer(sol.rhs, dims)
+        except DimensionError as err:
+            emit("warning", message=f"Dropping dimensionally inconsistent solution. {err}")
+            continue
+        value = evaluate(sol.rhs, magnitudes)
+        if dim is None or dim == DIMENSIONLESS:
+            results.append(sp.Eq(want, value))
+        else:
+            results.append(sp.Eq(want, value * unit_for(dim)))
+    return results
@@ -0,0 +1,108 @@
+"""
+zero_test.py
+
+Cheap "is this expression zero?" test, used instead of
+`sp.simplify(expr) == 0` in the tautology and consistency checks.
+
+Tiers, cheapest first:
+1. structural: literal zero, or SymPy's assumptions already know
+2. expand / cancel
+3. evaluation at a few random points with high precision; any clearly
+   nonzero value settles it, all-zero values mean zero (with probability
+   indistinguishable from 1 for the expressions we build)
+4. sp.simplify, only when evaluation was inconclusive (undefined points,
+   unevaluated functions, ...)
+"""
+
+from __future__ import annotations
+
+import random
+
+import sympy as sp
+
+
+def _sample(sym, rng):
+    """Random point respecting the symbol's assumptions, away from 0."""
+    if sym.is_integer:
+        lo = 1 if sym.is_positive or sym.is_nonnegative else -10
+        hi = -1 if sym.is_negative or sym.is_nonpositive else 10
+        value = 0
+        while value == 0:
+            value = rng.randint(lo, hi)
+        return sp.Integer(value)
+    # Wide enough to leave the principal branch of periodic functions,
+    # e.g. atan2(sin(x), cos(x)) - x.
+    magnitude = rng.uniform(0.1, 10.0)
+    if sym.is_positive or sym.is_nonnegative:
+        return magnitude
+    if sym.is_negative or sym.is_nonpositive:
+        return -magnitude
+    return magnitude if rng.random() < 0.5 else -magnitude
+
+
+def _numeric_is_zero(expr, samples, digits, seed):
+    """True / False, or None if the evaluation was inconclusive."""
+    if expr.has(sp.Float):
+        # Floats only carry ~15 digits; don't mistake their rounding for
+        # a nonzero value.
+        eps = 1e-12
+    else:
+        eps = 10.0 ** -(digits * 2 // 3)
+
+    symbols = sorted(expr.free_symbols, key=sp.default_sort_key)
+    rng = random.Random(seed)
+    for _ in range(samples if symbols else 1):
+        point = {sym: _sample(sym, rng) for sym in symbols}
+        value = expr.evalf(digits, subs=point)
+        if not value.is_number or value.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+            return None
+        try:
+            magnitude = abs(complex(value))
+        except (TypeError, ValueError):
+            return None
+        if magnitude == 0:
+            continue
+
+        # Purely relative: compare against the size of the terms, so that
+        # cancelling terms may leave a rounding residue while a small
+        # constant (6.626e-34*f) is still nonzero.
+        scale = 0.0
+        for term in sp.Add.make_args(expr):
+            term_value = term.evalf(digits, subs=point)
+            try:
+                scale = max(scale, abs(complex(term_value)))
+            except (TypeError, ValueError):
+                return None
+        if magnitude > scale * eps:
+            return False
+    return True
+
+
+def is_zero(expr, samples=6, digits=50, seed=0):
+    """Decide whether `expr` is identically zero."""
+    if expr is True or expr is False:
+        return False
+    expr = sp.sympify(expr)
+
+    if expr == 0:
+        return True
+    known = expr.is_zero
+    if known is not None:
+        return known
+
+    if sp.expand(expr) == 0:
+        return True
+    try:
+        if sp.cancel(expr) == 0:
+            return True
+    except Exception:
+        pass
+
+    numeric = _numeric_is_zero(expr, samples, digits, seed)
+    if numeric is not None:
+        return numeric
+
+    try:
+        return sp.simplify(expr) == 0
+    except Exception:
+        return False
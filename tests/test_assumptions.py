@@ -0,0 +1,71 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.kinematics_states import (  # noqa: E402
+    Point3,
+    kinematics_fundamental,
+    make_point,
+    make_states_model,
+)
+from combine_equations.solve_system import (  # noqa: E402
+    solve_system_blocks,
+    solve_system_multiple_solutions,
+    solve_with_elimination_attempts,
+)
+from combine_equations.template_cache import TemplateCache  # noqa: E402
+
+
+def _thrown_up(assumptions):
+    # Thrown up at 5 m/s from 10 m: the landing time has one positive
+    # root and one negative one.
+    b = make_states_model("b", 2, assumptions=assumptions)
+    b0, b1 = b.states
+    eqs = kinematics_fundamental(b, axes=["y"])
+    values = {b0.t: 0, b0.pos.y: 10, b1.pos.y: 0, b0.vel.y: 5, b.edges[0].a.y: -9.8}
+    return eqs, values, b1.t
+
+
+class TestAssumptions(unittest.TestCase):
+    def test_off_by_default(self):
+        self.assertEqual(make_point("p").mag, sp.Symbol("p_mag"))
+        self.assertEqual(Point3.make("p").x, sp.Symbol("p_x"))
+        self.assertEqual(make_states_model("b", 2).edges[0].dt, sp.Symbol("dt_b_0_1"))
+
+    def test_constructors(self):
+        p = make_point("p", assumptions=True)
+        self.assertTrue(p.x.is_real)
+        self.assertTrue(p.mag.is_positive)
+        self.assertTrue(Point3.make("q", assumptions=True).z.is_real)
+
+        b = make_states_model("b", 2, assumptions=True)
+        self.assertTrue(b.states[0].t.is_nonnegative)
+        self.assertTrue(b.states[0].vel.mag.is_positive)
+        self.assertTrue(b.edges[0].dt.is_positive)
+        self.assertTrue(b.edges[0].a.x.is_real)
+
+    def test_negative_time_branch_is_dropped(self):
+        for solve in (solve_system_blocks, solve_with_elimination_attempts):
+            eqs, values, want = _thrown_up(False)
+            self.assertEqual(len(solve(eqs, values, want)), 2)
+
+            eqs, values, want = _thrown_up(True)
+            [solution] = solve(eqs, values, want)
+            self.assertGreater(float(solution.rhs.subs(values)), 0)
+
+    def test_cached_templates_respect_assumptions(self):
+        for solve in (solve_system_multiple_solutions, solve_with_elimination_attempts):
+            cache = TemplateCache()
+            for _ in range(2):
+                eqs, values, want = _thrown_up(True)
+                [solution] = solve(eqs, values, want, cache=cache)
+                self.assertGreater(float(solution.rhs.subs(values)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
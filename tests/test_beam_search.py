@@ -0,0 +1,65 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.beam_search import _preview, _state_key, state_cost  # noqa: E402
+from combine_equations.eliminate_variable_subst import eliminate_variable_subst  # noqa: E402
+from combine_equations.solve_system import solve_with_elimination_attempts  # noqa: E402
+
+
+x, y, z, a = sp.symbols("x y z a")
+
+
+class TestBeamSearch(unittest.TestCase):
+    def test_succeeds_where_greedy_fails(self):
+        # Greedy eliminates z first, which leaves Abs(x) for sp.solve;
+        # eliminating x first works.
+        eqs = [sp.Eq(y, sp.Abs(x) + z), sp.Eq(x**2, a), sp.Eq(z, x * sp.Abs(x))]
+
+        with self.assertRaises(Exception):
+            solve_with_elimination_attempts(eqs, {a: 4}, y, max_elims=1)
+
+        solutions, eliminations = solve_with_elimination_attempts(
+            eqs, {a: 4}, y, max_elims=1, search="beam", return_eliminations=True,
+        )
+        self.assertEqual([sym for sym, _ in eliminations], [x])
+        self.assertAlmostEqual(float(solutions[0].rhs.subs(a, 4)), 6.0)
+
+    def test_easy_problem_solves_directly(self):
+        eqs = [sp.Eq(x + y, a), sp.Eq(x - y, 1)]
+        solutions, eliminations = solve_with_elimination_attempts(
+            eqs, {a: 3}, x, search="beam", return_eliminations=True,
+        )
+        self.assertEqual(solutions, [sp.Eq(x, a / 2 + sp.Rational(1, 2))])
+        self.assertEqual(eliminations, [])
+
+    def test_cost_prefers_lower_degree(self):
+        low = [sp.Eq(y, x + 1)]
+        high = [sp.Eq(y**2, x + 1)]
+        self.assertLess(state_cost(low, {x: 1}, y), state_cost(high, {x: 1}, y))
+
+    def test_states_are_keyed_after_simplifying(self):
+        p, q, s = sp.symbols("p q s")
+        eqs = [
+            sp.Eq(y, sp.Abs(p + q + s * y)),
+            sp.Eq(p * sp.cos(a), sp.sin(2 * a)),
+            sp.Eq(q * sp.sin(a), sp.sin(2 * a)),
+        ]
+        after_p, _ = eliminate_variable_subst(eqs, p)
+        after_q, _ = eliminate_variable_subst(eqs, q)
+        pq, _ = eliminate_variable_subst(after_p, q)
+        qp, _ = eliminate_variable_subst(after_q, p)
+
+        # p then q and q then p are the same state.
+        self.assertEqual(_state_key(pq, {a: 1}, y), _state_key(list(reversed(qp)), {a: 1}, y))
+        # The unsimplified preview of that state is not.
+        self.assertNotEqual(_state_key(_preview(after_p, q), {a: 1}, y), _state_key(pq, {a: 1}, y))
+
+
+if __name__ == "__main__":
+    unittest.main()
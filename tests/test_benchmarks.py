@@ -0,0 +1,44 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.cases import CASES  # noqa: E402
+from benchmarks.harness import compare, run  # noqa: E402
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_run_records_metrics(self):
+        results = run(cases=["up-4.7-acceleration"], solvers=["v1", "v2"], repeat=2)
+        self.assertEqual(len(results["results"]), 2)
+        for result in results["results"]:
+            self.assertEqual(result["status"], "ok")
+            self.assertTrue(result["correct"])
+            self.assertEqual(len(result["wall"]), 2)
+            self.assertGreater(result["peak_memory"], 0)
+            self.assertEqual(result["calls"]["solve"], 1)
+
+    def test_compare_flags_regressions(self):
+        def result(wall, status="ok", correct=True):
+            return {
+                "case": "up-4.7-acceleration", "solver": "v1", "status": status,
+                "error": None if status == "ok" else "ValueError", "wall_median": wall,
+                "peak_memory": 1000, "correct": correct, "solutions": [],
+            }
+
+        old = {"results": [result(1.0)]}
+        self.assertEqual(compare(old, {"results": [result(1.1)]}), [])
+        self.assertEqual(len(compare(old, {"results": [result(2.0)]})), 1)
+        self.assertEqual(len(compare(old, {"results": [result(1.0, status="error")]})), 1)
+        self.assertEqual(len(compare(old, {"results": [result(1.0, correct=False)]})), 1)
+
+    def test_cases_registered(self):
+        for name in ("up-3.6-position", "up-3.7-range", "up-3.9-range", "up-4.7-acceleration"):
+            self.assertIn(name, CASES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.block_triangular import block_triangular_decomposition
+from combine_equations.kinematics_states import make_states_model, kinematics_fundamental
+from combine_equations.solve_system import solve_system_blocks
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs
+from combine_equations.misc import eq_flat
+
+
+class TestDecomposition(unittest.TestCase):
+    def test_triangular_chain(self):
+        # eq0: x          -> x first
+        # eq1: x, y       -> then y
+        # eq2: y, z, w    \
+        # eq3: z, w       / 2x2 block last
+        incidence = [["x"], ["x", "y"], ["y", "z", "w"], ["z", "w"]]
+        decomposition = block_triangular_decomposition(incidence)
+
+        self.assertEqual(
+            [sorted(b.unknowns) for b in decomposition.blocks],
+            [["x"], ["y"], ["w", "z"]],
+        )
+        self.assertEqual(decomposition.blocks[2].depends_on, (1,))
+        self.assertEqual(decomposition.checks, [])
+
+    def test_redundant_and_underdetermined(self):
+        # eq2 is redundant (x already fixed by eq0), eq1 has two unknowns.
+        incidence = [["x"], ["y", "z"], ["x"]]
+        decomposition = block_triangular_decomposition(incidence)
+
+        kinds = [b.kind for b in decomposition.blocks]
+        self.assertEqual(kinds, ["square", "under"])
+        self.assertEqual([c.equation for c in decomposition.checks], [2])
+
+        blocks, checks = decomposition.needed_for("x")
+        self.assertEqual(blocks, [0])
+        self.assertEqual(checks, [0])
+
+
+class TestSolveSystemBlocks(unittest.TestCase):
+    def test_window_throw_both_roots(self):
+        b = make_states_model("b", 2)
+        b0, b1 = b.states
+        b01 = b.edges[0]
+
+        g = sp.symbols("g")
+
+        eqs = kinematics_fundamental(b, axes=["x", "y"])
+        eqs += eq_flat(
+            b0.pos.x, 0,
+            b01.a.x, 0,
+            b01.a.y, -g,
+            b0.t, 0,
+            b0.vel.x, b1.vel.x,
+            b1.pos.y, 0,
+        )
+        eqs = eliminate_zero_eqs(eqs)
+        eqs += eq_flat(
+            b0.vel.x, b0.vel.mag * sp.cos(b0.vel.angle),
+            b0.vel.y, b0.vel.mag * sp.sin(b0.vel.angle),
+        )
+
+        values = {
+            g: 9.81,
+            b0.pos.y: 8.0,
+            b0.vel.mag: 10.0,
+            b0.vel.angle: math.radians(-20.0),
+        }
+
+        solutions, blocks = solve_system_blocks(eqs, values, b1.pos.x, return_blocks=True)
+        numeric = sorted(float(sp.N(s.rhs.subs(values))) for s in solutions)
+
+        self.assertEqual(len(numeric), 2)
+        self.assertAlmostEqual(numeric[0], -15.7161745661753, places=9)
+        self.assertAlmostEqual(numeric[1], 9.16380341748480, places=9)
+        self.assertLessEqual(max(len(block.unknowns) for block in blocks), 3)
+
+    def test_linear_fast_path(self):
+        x, y, a, b = sp.symbols("x y a b")
+        eqs = eq_flat(
+            x + y, a,
+            x - y, b,
+        )
+        values = {a: 3, b: 1}
+
+        solutions, blocks = solve_system_blocks(eqs, values, x, return_blocks=True)
+        self.assertEqual(solutions, [sp.Eq(x, (a + b) / 2)])
+        self.assertEqual([block.path for block in blocks], ["linear-lu"])
+
+        solutions, blocks = solve_system_blocks(eqs, values, x, return_blocks=True, linear=False)
+        self.assertEqual(solutions, [sp.Eq(x, (a + b) / 2)])
+        self.assertEqual([block.path for block in blocks], ["solve"])
+
+        eqs_sub = [eq.subs(values) for eq in eqs]
+        solutions, blocks = solve_system_blocks(eqs_sub, values, x, return_blocks=True)
+        self.assertEqual(solutions, [sp.Eq(x, 2)])
+        self.assertEqual([block.path for block in blocks], ["linear-lu"])
+
+        try:
+            import numpy
+        except ImportError:
+            return
+        eqs_float = [eq.subs({a: 3.0, b: 1.0}) for eq in eqs]
+        solutions, blocks = solve_system_blocks(eqs_float, values, x, return_blocks=True)
+        self.assertAlmostEqual(float(solutions[0].rhs), 2.0)
+        self.assertEqual([block.path for block in blocks], ["linear-numeric"])
+
+
+if __name__ == "__main__":
+    unittest.main()
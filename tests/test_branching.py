@@ -0,0 +1,52 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.eliminate_variable_subst import eliminate_variable_branches  # noqa: E402
+from combine_equations.solve_system import solve_with_elimination_attempts  # noqa: E402
+
+
+x, y, z, a = sp.symbols("x y z a")
+
+# sp.solve can't handle Abs of a complex unknown, so x has to be
+# eliminated first, and x**2 = a has two roots.
+EQUATIONS = [sp.Eq(x**2, a), sp.Eq(y, sp.Abs(x) + x)]
+
+
+class TestBranching(unittest.TestCase):
+    def test_forks_share_untouched_equations(self):
+        other = sp.Eq(z, a + 1)
+        forks = eliminate_variable_branches(EQUATIONS + [other], x)
+
+        self.assertEqual({r for _, r in forks}, {sp.sqrt(a), -sp.sqrt(a)})
+        for new_eqs, _ in forks:
+            self.assertTrue(any(eq is other for eq in new_eqs))
+
+    def test_every_branch_is_kept(self):
+        greedy = solve_with_elimination_attempts(EQUATIONS, {a: 4}, y)
+        self.assertEqual(len(greedy), 1)
+
+        solutions, paths = solve_with_elimination_attempts(
+            EQUATIONS, {a: 4}, y, search="branches", return_eliminations=True,
+        )
+        values = sorted(float(sol.rhs.subs(a, 4)) for sol in solutions)
+        self.assertEqual(values, [0.0, 4.0])
+        self.assertEqual(
+            {path[0][1] for path in paths},
+            {sp.sqrt(a), -sp.sqrt(a)},
+        )
+
+    def test_worker_pool(self):
+        solutions = solve_with_elimination_attempts(
+            EQUATIONS, {a: 4}, y, search="branches", workers=2,
+        )
+        self.assertEqual(len(solutions), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.dimensions import (  # noqa: E402
+    ACCELERATION,
+    LENGTH,
+    TIME,
+    VELOCITY,
+    DimensionError,
+    consistent,
+    derive_dimensions,
+)
+from combine_equations.kinematics_states import (  # noqa: E402
+    kinematics_fundamental,
+    magnitude_and_angle_equations,
+    make_states_model,
+)
+from combine_equations.solve_system import _dimension_filter, solve_with_elimination_attempts  # noqa: E402
+
+
+class TestDimensionPruning(unittest.TestCase):
+    def setUp(self):
+        self.model = make_states_model("b", 2)
+        self.b0, self.b1 = self.model.states
+        self.edge = self.model.edges[0]
+        self.eqs = kinematics_fundamental(self.model, axes=["x"])
+
+    def test_states_model_annotations(self):
+        dims = self.model.dimensions()
+        self.assertEqual(dims[self.b0.pos.x], LENGTH)
+        self.assertEqual(dims[self.b1.vel.mag], VELOCITY)
+        self.assertEqual(dims[self.edge.dt], TIME)
+        self.assertEqual(dims[self.edge.a.x], ACCELERATION)
+        self.assertTrue(consistent(self.eqs, dims))
+
+    def test_magnitude_and_angle_equations(self):
+        dims = self.model.dimensions()
+        eqs = magnitude_and_angle_equations(self.b0)
+        self.assertTrue(consistent(eqs, dims))
+        self.assertFalse(consistent([sp.Eq(self.b0.vel.angle, sp.atan2(self.b0.vel.y, self.b0.pos.x))], dims))
+
+    def test_derived_annotations(self):
+        h = sp.Symbol("h")
+        dims = derive_dimensions([sp.Eq(h, self.b1.pos.x - self.b0.pos.x)], self.model.dimensions())
+        self.assertEqual(dims[h], LENGTH)
+
+    def test_solve_with_dimensions(self):
+        values = {self.b0.pos.x: 0, self.b1.pos.x: 1.5, self.b0.vel.x: 0, self.b1.vel.x: 45.0, self.b0.t: 0}
+        want = self.edge.a.x
+        plain = solve_with_elimination_attempts(self.eqs, values, want)
+        pruned = solve_with_elimination_attempts(
+            self.eqs, values, want, dimensions=self.model.dimensions(),
+        )
+        self.assertEqual(pruned, plain)
+
+        bad = self.eqs + [sp.Eq(self.b1.pos.x, self.b1.vel.x)]
+        with self.assertRaises(DimensionError):
+            solve_with_elimination_attempts(bad, values, want, dimensions=self.model.dimensions())
+
+    def test_groebner_backend_with_dimensions(self):
+        values = {self.b0.pos.x: 0, self.b1.pos.x: 1.5, self.b0.vel.x: 0, self.b1.vel.x: 45.0, self.b0.t: 0}
+        want = self.edge.a.x
+        plain = solve_with_elimination_attempts(self.eqs, values, want, backend="groebner")
+        pruned = solve_with_elimination_attempts(
+            self.eqs, values, want, backend="groebner", dimensions=self.model.dimensions(),
+        )
+        self.assertEqual(pruned, plain)
+
+    def test_branches_with_wrong_dimension_are_dropped(self):
+        dims = self.model.dimensions()
+        x0, v0, t1 = self.b0.pos.x, self.b0.vel.x, self.b1.t
+        solutions = [
+            sp.Eq(self.b1.pos.x, x0 + v0 * t1),
+            sp.Eq(self.b1.pos.x, x0 + v0),
+            sp.Eq(self.b1.pos.x, v0),
+            sp.Eq(self.b1.pos.x, 0),
+        ]
+        kept = _dimension_filter(solutions, dims, self.b1.pos.x)
+        self.assertEqual(kept, [solutions[0], solutions[3]])
+
+        # Same error whichever search mode filtered the branches.
+        with self.assertRaisesRegex(ValueError, "No dimensionally consistent solutions"):
+            _dimension_filter(solutions[1:3], dims, self.b1.pos.x)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.eliminate_variable_subst import (  # noqa: E402
+    eliminate_variable_subst,
+    eliminate_variables,
+    eliminate_zero_eqs,
+)
+from combine_equations.kinematics_states import kinematics_fundamental, make_states_model  # noqa: E402
+from combine_equations.misc import eq_flat  # noqa: E402
+
+
+class TestEliminateVariables(unittest.TestCase):
+    def test_chain_is_resolved(self):
+        x, y, z, w = sp.symbols("x y z w")
+        eqs = [sp.Eq(x, y + 1), sp.Eq(y, 2 * z), sp.Eq(w, x * z)]
+        new_eqs, replacements = eliminate_variables(eqs, [x, y])
+
+        self.assertEqual(new_eqs, [sp.Eq(w, z * (2 * z + 1))])
+        self.assertEqual(replacements, {x: 2 * z + 1, y: 2 * z})
+
+    def test_uneliminable_variable_is_left(self):
+        x, y = sp.symbols("x y")
+        eqs = [sp.Eq(x, sp.cos(x) + y)]
+        new_eqs, replacements = eliminate_variables(eqs, [x])
+        self.assertEqual(replacements, {})
+        self.assertEqual(new_eqs, eqs)
+
+    def test_zero_eqs_match_one_at_a_time(self):
+        b = make_states_model("b", 2)
+        b0, b1 = b.states
+        b01 = b.edges[0]
+        g = sp.symbols("g")
+
+        eqs = kinematics_fundamental(b, axes=["x", "y"])
+        eqs += eq_flat(
+            b0.pos.x, 0,
+            b0.pos.y, 0,
+            b01.a.x, 0,
+            b01.a.y, -g,
+            b0.t, 0,
+        )
+
+        expected = eqs
+        for eq in [eq for eq in eqs if eq.rhs == 0]:
+            expected, _ = eliminate_variable_subst(expected, eq.lhs)
+
+        self.assertEqual(set(eliminate_zero_eqs(eqs)), set(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
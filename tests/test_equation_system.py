@@ -0,0 +1,41 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations import equation_system  # noqa: E402
+from combine_equations.equation_system import EquationSystem  # noqa: E402
+
+
+x, y, z, u, a = sp.symbols("x y z u a")
+EQUATIONS = [sp.Eq(y, x + a), sp.Eq(x, z * a), sp.Eq(u, 3)]
+
+
+class TestEquationSystem(unittest.TestCase):
+    def test_masks_round_trip(self):
+        system = EquationSystem(EQUATIONS)
+        self.assertEqual(system.free_symbols(0), {x, y, a})
+        self.assertEqual(system.common(0, 1), {x, a})
+        self.assertEqual(system.symbols_of(system.union()), {x, y, z, u, a})
+        self.assertEqual(system.containing(system.mask([x])), [0, 1])
+
+    def test_counts_match_with_numpy(self):
+        eqs = [sp.Eq(sp.Symbol(f"s{i}"), sp.Symbol(f"s{i + 1}") + a) for i in range(50)]
+        expected = EquationSystem(eqs).counts()
+
+        threshold = equation_system.NUMPY_THRESHOLD
+        equation_system.NUMPY_THRESHOLD = 10
+        try:
+            self.assertEqual(EquationSystem(eqs).counts(), expected)
+        finally:
+            equation_system.NUMPY_THRESHOLD = threshold
+        self.assertEqual(expected[a], 50)
+        self.assertEqual(expected[sp.Symbol("s0")], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations import groebner  # noqa: E402
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs  # noqa: E402
+from combine_equations.groebner import NotPolynomialError, solve_groebner  # noqa: E402
+from combine_equations.kinematics_states import kinematics_fundamental, make_states_model  # noqa: E402
+from combine_equations.misc import eq_flat  # noqa: E402
+from combine_equations.solve_system import solve_with_elimination_attempts  # noqa: E402
+
+
+def build_range_case():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+    g, vel_mag, vel_angle = sp.symbols("g vel_mag vel_angle")
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b0.pos.y, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+        b1.pos.y, 0,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+    eqs += eq_flat(
+        b0.vel.x, vel_mag * sp.cos(vel_angle),
+        b0.vel.y, vel_mag * sp.sin(vel_angle),
+    )
+    values = {g: 9.81, vel_mag: 37.0, vel_angle: math.radians(53.1)}
+    return eqs, values, b1
+
+
+class TestGroebner(unittest.TestCase):
+    def test_range_without_zero_time_root(self):
+        eqs, values, b1 = build_range_case()
+        solutions = solve_groebner(eqs, values, b1.pos.x)
+
+        # dt = 0 would give x = 0; saturation by the denominators drops it.
+        self.assertEqual(len(solutions), 1)
+        self.assertAlmostEqual(float(solutions[0].rhs.subs(values)), 134.010403230554, places=9)
+
+    def test_backend_selectable_with_fallback(self):
+        eqs, values, b1 = build_range_case()
+        solutions = solve_with_elimination_attempts(eqs, values, b1.t, backend="groebner")
+        self.assertEqual(len(solutions), 1)
+        flight_time = 2 * 37.0 * math.sin(math.radians(53.1)) / 9.81
+        self.assertAlmostEqual(float(solutions[0].rhs.subs(values)), flight_time, places=9)
+
+        x, y, r = sp.symbols("x y r")
+        eqs = [sp.Eq(r, sp.sqrt(x**2 + y**2)), sp.Eq(y, 2 * x)]
+        with self.assertRaises(NotPolynomialError):
+            solve_groebner(eqs, {x: 3}, r)
+        solutions = solve_with_elimination_attempts(eqs, {x: 3}, r, backend="groebner")
+        self.assertAlmostEqual(float(solutions[0].rhs.subs(x, 3)), math.sqrt(45), places=9)
+
+    def test_groebner_failure_falls_back_to_substitution(self):
+        eqs, values, b1 = build_range_case()
+        expected = solve_with_elimination_attempts(eqs, values, b1.t)
+        failure = ValueError("Inconsistent system.")
+        with mock.patch.object(groebner, "solve_groebner", side_effect=failure):
+            solutions = solve_with_elimination_attempts(eqs, values, b1.t, backend="groebner")
+        self.assertEqual(solutions, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.incidence import IncidenceMatrix  # noqa: E402
+from combine_equations.kinematics_states import kinematics_fundamental, make_states_model  # noqa: E402
+from combine_equations.solve_system import connected_unknowns  # noqa: E402
+
+
+x, y, z, u, w, a = sp.symbols("x y z u w a")
+EQUATIONS = [sp.Eq(y, x + a), sp.Eq(x, z * a), sp.Eq(u, w + a), sp.Eq(w, 2)]
+
+
+class TestIncidenceMatrix(unittest.TestCase):
+    def test_csr_layout(self):
+        matrix = IncidenceMatrix(EQUATIONS)
+        self.assertEqual(matrix.shape, (4, 6))
+        self.assertEqual(matrix.nnz, 10)
+        a_col = matrix.symbols.index(a)
+        self.assertEqual(list(matrix.equations_with(a_col)), [0, 1, 2])
+
+    def test_reachability_and_components(self):
+        matrix = IncidenceMatrix(EQUATIONS)
+        unknowns, rows = matrix.reachable(y, knowns=[a])
+        self.assertEqual(unknowns, {x, y, z})
+        self.assertEqual(rows, [0, 1])
+
+        parts = matrix.components(knowns=[a])
+        self.assertEqual(parts, [([0, 1], {x, y, z}), ([2, 3], {u, w})])
+
+        self.assertEqual(matrix.connected_unknowns(u, knowns=[a, w]), {u})
+
+    def test_values_are_substituted(self):
+        # z only enters through z*a; with a = 0 it isn't needed.
+        self.assertEqual(IncidenceMatrix(EQUATIONS).connected_unknowns(y, {a: 0}), {x, y, z})
+        self.assertEqual(IncidenceMatrix(EQUATIONS, {a: 0}).connected_unknowns(y, {a: 0}), {x, y})
+        self.assertEqual(connected_unknowns(EQUATIONS, {a: 0}, y), {x, y})
+
+    def test_matches_connected_unknowns_on_states_model(self):
+        b = make_states_model("b", 4)
+        eqs = kinematics_fundamental(b, axes=["x", "y"])
+        values = {b.states[0].pos.x: 0, b.states[0].t: 0}
+        want = b.states[3].pos.x
+
+        matrix = IncidenceMatrix(eqs, values)
+        self.assertEqual(
+            matrix.connected_unknowns(want, values), connected_unknowns(eqs, values, want),
+        )
+
+    def test_exports(self):
+        matrix = IncidenceMatrix(EQUATIONS)
+        dot = matrix.to_dot(knowns=[a], want=y)
+        self.assertTrue(dot.startswith("graph incidence {"))
+        self.assertEqual(dot.count(" -- "), matrix.nnz)
+
+        root = ET.fromstring(matrix.to_graphml(knowns=[a], want=y))
+        ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+        self.assertEqual(len(root.findall(".//g:edge", ns)), matrix.nnz)
+        self.assertEqual(len(root.findall(".//g:node", ns)), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
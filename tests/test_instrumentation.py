@@ -0,0 +1,77 @@
+import io
+import json
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.instrumentation import (  # noqa: E402
+    EventRecorder,
+    add_listener,
+    instrument,
+    print_events,
+    remove_listener,
+)
+from combine_equations.solve_system import (  # noqa: E402
+    solve_system_multiple_solutions,
+    solve_with_elimination_attempts,
+)
+
+
+x, y, a = sp.symbols("x y a")
+EQUATIONS = [sp.Eq(x + y, a), sp.Eq(x - y, 1)]
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_silent_by_default(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            solve_with_elimination_attempts(EQUATIONS, {a: 3}, x)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_recorder_sees_phases(self):
+        recorder = EventRecorder()
+        with instrument(recorder):
+            solve_system_multiple_solutions(EQUATIONS, {a: 3}, x)
+
+        phases = recorder.summary()["phases"]
+        for name in ("connected_unknowns", "clear_zero_denominators", "filter_equations", "solve"):
+            self.assertIn(name, phases)
+        solve = next(e for e in recorder.events if e.get("name") == "solve")
+        self.assertGreater(solve["ops"], 0)
+
+        # Scoped listeners go away with the block.
+        count = len(recorder.events)
+        solve_system_multiple_solutions(EQUATIONS, {a: 3}, x)
+        self.assertEqual(len(recorder.events), count)
+
+    def test_events_are_json_serializable(self):
+        z = sp.Symbol("z")
+        eqs = [sp.Eq(y, sp.Abs(x) + z), sp.Eq(x**2, a), sp.Eq(z, x * sp.Abs(x))]
+        recorder = EventRecorder()
+        with instrument(recorder):
+            with self.assertRaises(Exception):
+                solve_with_elimination_attempts(eqs, {a: 4}, y, max_ops=5)
+        self.assertIn("swell_aborts", recorder.summary()["counts"])
+        for event in recorder.events:
+            json.dumps(event)
+
+    def test_print_events_listener(self):
+        out = io.StringIO()
+        add_listener(print_events)
+        try:
+            with redirect_stdout(out):
+                solve_with_elimination_attempts(EQUATIONS, {a: 3}, x)
+        finally:
+            remove_listener(print_events)
+        self.assertIn("Solving for unknowns: [", out.getvalue())
+        self.assertIn("Elimination attempts elapsed:", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
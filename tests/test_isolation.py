@@ -0,0 +1,63 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.isolation import (  # noqa: E402
+    clear_isolation_cache,
+    isolate,
+    isolation_cache_info,
+)
+from combine_equations.misc import combine_equations_sp, isolate_variable  # noqa: E402
+from combine_equations.eliminate_variable_subst import eliminate_variable_subst  # noqa: E402
+
+
+x, y, z = sp.symbols("x y z")
+
+
+class TestIsolation(unittest.TestCase):
+    def setUp(self):
+        clear_isolation_cache()
+
+    def test_matches_sp_solve_and_counts_hits(self):
+        eq = sp.Eq(x**2, y)
+        self.assertEqual(isolate(eq, x), sp.solve(eq, x))
+        self.assertEqual(isolation_cache_info()["misses"], 1)
+
+        # Same relation written the other way round shares the entry.
+        isolate(sp.Eq(y, x**2), x)
+        isolate(x**2 - y, x)
+        info = isolation_cache_info()
+        self.assertEqual((info["hits"], info["misses"]), (2, 1))
+
+    def test_returned_list_is_a_copy(self):
+        sols = isolate(sp.Eq(x, y + 1), x)
+        sols.append(z)
+        self.assertEqual(isolate(sp.Eq(x, y + 1), x), [y + 1])
+
+    def test_failures_raise_fresh_exceptions(self):
+        eq = sp.Eq(x, sp.exp(x) + sp.cos(x))
+        raised = []
+        for _ in range(2):
+            with self.assertRaises(NotImplementedError) as ctx:
+                isolate(eq, x)
+            raised.append(ctx.exception)
+        self.assertEqual(isolation_cache_info()["hits"], 1)
+        self.assertIsNot(raised[0], raised[1])
+        self.assertEqual(str(raised[0]), str(raised[1]))
+
+    def test_shared_by_misc_and_eliminator(self):
+        eq1 = sp.Eq(z, x + y)
+        eq2 = sp.Eq(x, 2 * y)
+        self.assertEqual(isolate_variable(eq2, x), sp.Eq(x, 2 * y))
+        self.assertEqual(combine_equations_sp(eq1, eq2, x), sp.Eq(z, 3 * y))
+        eliminate_variable_subst([eq1, eq2], x)
+        self.assertGreaterEqual(isolation_cache_info()["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+import sympy.physics.units as u
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.numeric_eval import (  # noqa: E402
+    clear_compiled_cache,
+    compiled_cache_info,
+    evaluate,
+    evaluate_solution,
+)
+
+
+x, y, a, b = sp.symbols("x y a b")
+EXPR = sp.sqrt(a**2 + b) * sp.sin(a) + (a + b) ** 3 / (1 + sp.exp(a))
+VALUES = {a: sp.Rational(3, 2), b: 2}
+
+
+class TestNumericEval(unittest.TestCase):
+    def setUp(self):
+        clear_compiled_cache()
+
+    def test_matches_sp_n_and_compiles_once(self):
+        expected = sp.N(EXPR.subs(VALUES))
+        self.assertAlmostEqual(float(evaluate(EXPR, VALUES)), float(expected), places=12)
+        evaluate(EXPR, {a: 1, b: 5})
+        info = compiled_cache_info()
+        self.assertEqual((info["misses"], info["hits"]), (1, 1))
+
+    def test_precision(self):
+        value = evaluate(EXPR, VALUES, precision=40)
+        self.assertEqual(value, sp.N(EXPR.subs(VALUES), 40))
+
+    def test_fallbacks(self):
+        # Complex result, missing value, units.
+        self.assertEqual(evaluate(sp.sqrt(a - b), VALUES), sp.N(sp.sqrt(a - b).subs(VALUES)))
+        self.assertEqual(evaluate(x + a, VALUES), x + 1.5)
+        self.assertEqual(evaluate(a, {a: 3 * u.meter}), 3.0 * u.meter)
+
+    def test_evaluate_solution(self):
+        sol = sp.Eq(y, a * b)
+        self.assertEqual(evaluate_solution(sol, VALUES), sp.Eq(y, 3.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.misc import eq_flat
+from combine_equations.numeric_solve import solve_numeric_multistart
+from combine_equations.solve_system import solve_with_elimination_attempts
+
+
+class TestNumericSolve(unittest.TestCase):
+    def test_every_distinct_root(self):
+        x, y, r = sp.symbols("x y r")
+        eqs = eq_flat(
+            x ** 2 + y ** 2, r ** 2,
+            y, x,
+        )
+
+        solutions = solve_numeric_multistart(eqs, {r: 2.0}, x)
+
+        self.assertEqual(len(solutions), 2)
+        self.assertAlmostEqual(float(solutions[0].rhs), -2 ** 0.5, places=12)
+        self.assertAlmostEqual(float(solutions[1].rhs), 2 ** 0.5, places=12)
+
+    def test_symbolic_values_rejected(self):
+        x, r = sp.symbols("x r")
+        with self.assertRaises(ValueError):
+            solve_numeric_multistart(eq_flat(x ** 2, r), {r: sp.Symbol("s")}, x)
+
+    def test_fallback_after_elimination_attempts(self):
+        # x = c*cos(x) has no closed form; sp.solve raises.
+        x, y, c = sp.symbols("x y c")
+        eqs = eq_flat(
+            x, c * sp.cos(x),
+            y, 2 * x,
+        )
+        values = {c: 1.0}
+
+        solutions = solve_with_elimination_attempts(eqs, values, y, numeric_fallback=True)
+        self.assertEqual(len(solutions), 1)
+        self.assertAlmostEqual(float(solutions[0].rhs), 1.47817026643032, places=12)
+
+        # workers reaches the fallback's process pool.
+        parallel = solve_with_elimination_attempts(eqs, values, y, numeric_fallback=True, workers=2)
+        self.assertEqual(parallel, solutions)
+
+
+if __name__ == "__main__":
+    unittest.main()
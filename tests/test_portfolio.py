@@ -0,0 +1,88 @@
+import subprocess
+import sys
+import textwrap
+import time
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.misc import eq_flat
+from combine_equations.portfolio import STRATEGIES, _is_valid, solve_portfolio
+
+
+def hang(equations, values, want):
+    time.sleep(600)
+
+
+def fail(equations, values, want):
+    raise RuntimeError("strategy failed")
+
+
+def build_case():
+    w, m, g, F_x, a_x = sp.symbols("w m g F_x a_x")
+    eqs = eq_flat(
+        w,   m * g,
+        F_x, m * a_x,
+    )
+    values = {w: 2.45e4, F_x: -1.83e4, g: 9.81}
+    return eqs, values, a_x
+
+
+class TestPortfolio(unittest.TestCase):
+    def test_first_valid_result_wins(self):
+        eqs, values, a_x = build_case()
+
+        start = time.monotonic()
+        solutions, name = solve_portfolio(
+            eqs, values, a_x,
+            timeout=30.0,
+            strategies={"hang": hang, "fail": fail, "direct": STRATEGIES["direct"]},
+            return_strategy=True,
+        )
+
+        self.assertEqual(name, "direct")
+        self.assertLess(time.monotonic() - start, 30.0)
+        self.assertAlmostEqual(float(solutions[0].rhs.subs(values)), -7.3274693877551, places=9)
+
+    def test_timeout(self):
+        eqs, values, a_x = build_case()
+        with self.assertRaises(TimeoutError):
+            solve_portfolio(eqs, values, a_x, timeout=0.5, strategies={"hang": hang})
+
+    def test_all_strategies_fail(self):
+        eqs, values, a_x = build_case()
+        with self.assertRaises(ValueError):
+            solve_portfolio(eqs, values, a_x, strategies={"fail": fail})
+
+    def test_results_must_use_only_knowns(self):
+        x, y, a = sp.symbols("x y a")
+        self.assertTrue(_is_valid([sp.Eq(x, 2 * a)], {a: 1}, x))
+        self.assertFalse(_is_valid([sp.Eq(x, y * a)], {a: 1}, x))
+
+    def test_target_strategy_keeps_every_branch(self):
+        x, a = sp.symbols("x a")
+        solutions = STRATEGIES["solve_for_target"]([sp.Eq(x**2, a)], {a: 4}, x)
+        self.assertEqual({sol.rhs for sol in solutions}, {sp.sqrt(a), -sp.sqrt(a)})
+
+    def test_clean_exit_with_spawn(self):
+        script = textwrap.dedent(f"""
+            import multiprocessing, sys
+            sys.path[:0] = [{str(ROOT / "src")!r}, {str(ROOT / "tests")!r}]
+            if __name__ == "__main__":
+                multiprocessing.set_start_method("spawn")
+                from test_portfolio import build_case, hang
+                from combine_equations.portfolio import STRATEGIES, solve_portfolio
+                eqs, values, want = build_case()
+                solve_portfolio(eqs, values, want, strategies={{"direct": STRATEGIES["direct"], "hang": hang}})
+        """)
+        done = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=120)
+        self.assertEqual(done.returncode, 0, done.stderr)
+        self.assertNotIn("leaked", done.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
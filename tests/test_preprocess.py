@@ -0,0 +1,78 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.instrumentation import EventRecorder, instrument  # noqa: E402
+from combine_equations.preprocess import preprocess_equations  # noqa: E402
+from combine_equations.solve_system import (  # noqa: E402
+    connected_unknowns,
+    eliminate_singleton_equations,
+    solve_with_elimination_attempts,
+)
+
+
+x, y, z, u, w, a, b = sp.symbols("x y z u w a b")
+
+
+class TestPreprocess(unittest.TestCase):
+    def test_removals_are_reported(self):
+        eqs = [
+            sp.Eq(y, x + u),
+            sp.Eq(u, 0),
+            sp.Eq(x, a),
+            sp.Eq(a, x),
+            sp.Eq(x - a, 0),
+            sp.Eq(w, z**2 + b),
+            sp.Eq(z, b),
+        ]
+        result = preprocess_equations(eqs, {a: 1}, y)
+
+        self.assertEqual(result.equations, [sp.Eq(y, x), sp.Eq(x, a)])
+        self.assertEqual(result.unknowns, {x, y})
+        self.assertEqual(result.zeros, [u])
+        reasons = [(r.reason, r.symbol) for r in result.removed]
+        self.assertEqual(reasons.count(("duplicate", None)), 2)
+        self.assertIn(("zero", u), reasons)
+        self.assertIn(("singleton", w), reasons)
+
+    def test_disconnected_equations_are_pruned(self):
+        eqs = [sp.Eq(y, x + a), sp.Eq(x, 2 * a), sp.Eq(z * w, 1), sp.Eq(z + w, 3)]
+        result = preprocess_equations(eqs, {a: 1}, y)
+        self.assertEqual(result.equations, eqs[:2])
+        self.assertEqual(
+            {r.equation for r in result.removed if r.reason == "disconnected"}, set(eqs[2:]),
+        )
+
+    def test_false_is_inconsistent(self):
+        with self.assertRaises(ValueError):
+            preprocess_equations([sp.Eq(y, x), sp.S.false], {}, y)
+
+    def test_singletons_and_connectivity_unchanged(self):
+        eqs, removed = eliminate_singleton_equations(
+            [sp.Eq(y, x), sp.Eq(x, z + w), sp.Eq(w, a)], want=y,
+        )
+        self.assertEqual(eqs, [sp.Eq(y, x)])
+        self.assertEqual(set(removed), {sp.Eq(x, z + w), sp.Eq(w, a)})
+
+        self.assertEqual(
+            connected_unknowns([sp.Eq(y, x + u), sp.Eq(x, a), sp.Eq(z, b)], {a: 1}, y),
+            {x, y, u},
+        )
+
+    def test_solver_option(self):
+        eqs = [sp.Eq(y, x + u), sp.Eq(u, 0), sp.Eq(x, a), sp.Eq(w, z + b)]
+        recorder = EventRecorder()
+        with instrument(recorder):
+            solutions = solve_with_elimination_attempts(eqs, {a: 1}, y, preprocess=True)
+        self.assertEqual(solutions, [sp.Eq(y, a)])
+        event = next(e for e in recorder.events if e["event"] == "preprocess")
+        self.assertEqual(event["kept"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.kinematics_states import make_states_model, kinematics_fundamental
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs
+from combine_equations.misc import eq_flat
+from combine_equations.propagation import propagate_knowns
+from combine_equations.solve_system import solve_system_multiple_solutions
+
+
+def build_projectile_case():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+
+    g = sp.symbols("g")
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b0.pos.y, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+
+    b0_vel_mag, b0_vel_angle = sp.symbols("b0_vel_mag b0_vel_angle")
+    eqs += eq_flat(
+        b0.vel.x, b0_vel_mag * sp.cos(b0_vel_angle),
+        b0.vel.y, b0_vel_mag * sp.sin(b0_vel_angle),
+    )
+
+    values = {
+        g: 9.81,
+        b0_vel_mag: 37.0,
+        b0_vel_angle: math.radians(53.1),
+    }
+    return eqs, values, b1
+
+
+class TestPropagation(unittest.TestCase):
+    def test_fully_propagated(self):
+        eqs, values, b1 = build_projectile_case()
+        values[b1.t] = 2.0
+
+        solutions, trace = solve_system_multiple_solutions(
+            eqs, values, b1.pos.y, propagate=True, return_trace=True,
+        )
+
+        self.assertEqual(len(solutions), 1)
+        self.assertAlmostEqual(float(sp.N(solutions[0].rhs.subs(values))), 39.5566647280447, places=9)
+        self.assertIn(b1.pos.y, [step.lhs for _, step in trace])
+        for _, step in trace:
+            self.assertTrue(step.rhs.free_symbols <= set(values))
+
+    def test_quadratic_left_in_core(self):
+        eqs, values, b1 = build_projectile_case()
+        eqs = eqs + eq_flat(b1.pos.y, 0)
+
+        residual, solved, trace = propagate_knowns(eqs, values)
+
+        # The time of flight is a quadratic; it must not be propagated.
+        self.assertNotIn(b1.t, solved)
+        self.assertTrue(any(b1.t in eq.free_symbols for eq in residual))
+        self.assertEqual(len(trace), len(solved))
+
+        solutions = solve_system_multiple_solutions(eqs, values, b1.pos.x, propagate=True)
+        numeric = [float(sp.N(s.rhs.subs(values))) for s in solutions]
+        self.assertEqual(len(numeric), 1)
+        self.assertAlmostEqual(numeric[0], 134.010403230554, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.rationalize import rationalize_system  # noqa: E402
+from combine_equations.solve_system import (  # noqa: E402
+    solve_system_blocks,
+    solve_system_multiple_solutions,
+    solve_with_elimination_attempts,
+)
+
+
+x, y, g = sp.symbols("x y g")
+EQUATIONS = [sp.Eq(y, g * x**2 / 2), sp.Eq(x, 0.1 * y)]
+
+
+class TestRationalize(unittest.TestCase):
+    def test_modes(self):
+        eqs, values, restore = rationalize_system(EQUATIONS, {g: 9.81}, True)
+        self.assertEqual(eqs[1], sp.Eq(x, y / 10))
+        self.assertEqual(values, {g: sp.Rational(981, 100)})
+
+        eqs, values, restore = rationalize_system(EQUATIONS, {g: 9.81}, "symbolic")
+        self.assertFalse(eqs[1].atoms(sp.Float))
+        self.assertEqual(len(values), 2)
+        [placeholder] = set(values) - {g}
+        self.assertEqual(restore([sp.Eq(x, 2 * placeholder)]), [sp.Eq(x, 0.2)])
+
+        with self.assertRaises(ValueError):
+            rationalize_system(EQUATIONS, {}, "exact")
+
+    def test_entry_points(self):
+        values = {g: 9.81}
+        for solve in (solve_system_multiple_solutions, solve_system_blocks, solve_with_elimination_attempts):
+            plain = sorted(float(s.rhs.subs(values)) for s in solve(EQUATIONS, values, x))
+            for mode in (True, "symbolic"):
+                solutions = solve(EQUATIONS, values, x, rationalize=mode)
+                self.assertFalse(any(s.rhs.atoms(sp.Dummy) for s in solutions))
+                numeric = sorted(float(s.rhs.subs(values)) for s in solutions)
+                self.assertEqual(len(numeric), len(plain))
+                for a, b in zip(numeric, plain):
+                    self.assertAlmostEqual(a, b, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
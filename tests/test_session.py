@@ -0,0 +1,88 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.kinematics_states import make_states_model, kinematics_fundamental
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs
+from combine_equations.misc import eq_flat
+from combine_equations.session import SolverSession
+
+
+def build_projectile_session():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+
+    g = sp.symbols("g")
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b0.pos.y, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+
+    b0_vel_mag, b0_vel_angle = sp.symbols("b0_vel_mag b0_vel_angle")
+    eqs += eq_flat(
+        b0.vel.x, b0_vel_mag * sp.cos(b0_vel_angle),
+        b0.vel.y, b0_vel_mag * sp.sin(b0_vel_angle),
+    )
+
+    values = {
+        g: 9.81,
+        b0_vel_mag: 37.0,
+        b0_vel_angle: math.radians(53.1),
+    }
+    return SolverSession(eqs, values), b1
+
+
+class TestSolverSession(unittest.TestCase):
+    def test_value_change_reuses_blocks(self):
+        session, b1 = build_projectile_session()
+        session.set_value(b1.t, 2.0)
+
+        [y] = session.evaluate(b1.pos.y)
+        self.assertAlmostEqual(float(y), 39.5566647280447, places=9)
+        solves = session.stats["block_solves"]
+
+        session.set_value(b1.t, 3.0)
+        [y] = session.evaluate(b1.pos.y)
+        self.assertAlmostEqual(float(y), 37.0 * 3.0 * math.sin(math.radians(53.1)) - 9.81 * 9.0 / 2, places=9)
+        self.assertEqual(session.stats["block_solves"], solves)
+
+    def test_structural_change_resolves_affected_blocks(self):
+        session, b1 = build_projectile_session()
+        session.set_value(b1.t, 2.0)
+        [vx] = session.evaluate(b1.vel.x)
+        self.assertAlmostEqual(float(vx), 22.2155483370577, places=9)
+
+        # Landing point instead of a fixed time: t becomes unknown.
+        session.remove_value(b1.t)
+        landing = session.add_equation(sp.Eq(b1.pos.y, 0))
+        solves = session.stats["block_solves"]
+
+        [x] = [v for v in session.evaluate(b1.pos.x) if abs(v) > 1e-9]
+        self.assertAlmostEqual(float(x), 134.010403230554, places=9)
+
+        # x-velocity blocks don't involve t and were reused.
+        self.assertGreater(session.stats["block_reuses"], 0)
+        self.assertGreater(session.stats["block_solves"], solves)
+
+        session.remove_equation(landing)
+        session.set_value(b1.t, 2.0)
+        [y] = session.evaluate(b1.pos.y)
+        self.assertAlmostEqual(float(y), 39.5566647280447, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.kinematics_states import make_states_model, kinematics_fundamental
+from combine_equations.eliminate_variable_subst import eliminate_zero_eqs
+from combine_equations.misc import eq_flat
+from combine_equations.solve_and_display import solve_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def build_window_throw_case():
+    b = make_states_model("b", 2)
+    b0, b1 = b.states
+    b01 = b.edges[0]
+
+    g = sp.symbols("g")
+
+    eqs = kinematics_fundamental(b, axes=["x", "y"])
+    eqs += eq_flat(
+        b0.pos.x, 0,
+        b01.a.x, 0,
+        b01.a.y, -g,
+        b0.t, 0,
+        b0.vel.x, b1.vel.x,
+        b1.pos.y, 0,
+    )
+    eqs = eliminate_zero_eqs(eqs)
+    eqs += eq_flat(
+        b0.vel.x, b0.vel.mag * sp.cos(b0.vel.angle),
+        b0.vel.y, b0.vel.mag * sp.sin(b0.vel.angle),
+    )
+    return eqs, g, b0, b1
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSolveMany(unittest.TestCase):
+    def test_sweep_over_heights(self):
+        eqs, g, b0, b1 = build_window_throw_case()
+
+        values_batch = {
+            g: [9.81, 9.81, 9.81],
+            b0.pos.y: [8.0, 0.0, -100.0],
+            b0.vel.mag: [10.0, 10.0, 10.0],
+            b0.vel.angle: [math.radians(-20.0)] * 3,
+        }
+
+        solutions, arrays = solve_many(eqs, values_batch, b1.pos.x, version=3)
+
+        self.assertEqual(len(solutions), 2)
+        self.assertEqual([a.shape for a in arrays], [(3,), (3,)])
+
+        first_row = sorted(a[0] for a in arrays)
+        self.assertAlmostEqual(first_row[0], -15.7161745661753, places=9)
+        self.assertAlmostEqual(first_row[1], 9.16380341748480, places=9)
+
+        # Starting 100 m below the landing height: no real trajectory.
+        self.assertTrue(all(np.isnan(a[2]) for a in arrays))
+
+    def test_list_of_rows(self):
+        x, y, z = sp.symbols("x y z")
+        eqs = eq_flat(z, x * y)
+
+        solutions, arrays = solve_many(eqs, [{x: 2.0, y: 3.0}, {x: 4.0, y: 0.5}], z)
+
+        self.assertEqual(solutions, [sp.Eq(z, x * y)])
+        self.assertEqual(list(arrays[0]), [6.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
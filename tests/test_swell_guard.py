@@ -0,0 +1,61 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.eliminate_variable_subst import eliminate_variable_subst  # noqa: E402
+from combine_equations.instrumentation import EventRecorder, instrument  # noqa: E402
+from combine_equations.solve_system import solve_with_elimination_attempts  # noqa: E402
+
+
+x, y, z, a = sp.symbols("x y z a")
+BIG = sum(k * a * z**k for k in range(1, 6))
+
+
+class TestSwellGuard(unittest.TestCase):
+    def test_swollen_substitution_is_abandoned(self):
+        eqs = [sp.Eq(x, BIG), sp.Eq(y, x**2 + x)]
+
+        new_eqs, replacement = eliminate_variable_subst(eqs, x)
+        self.assertIsNotNone(replacement)
+
+        recorder = EventRecorder()
+        with instrument(recorder):
+            new_eqs, replacement = eliminate_variable_subst(eqs, x, max_growth=1.5)
+        self.assertIsNone(replacement)
+        self.assertEqual(new_eqs, eqs)
+        self.assertGreaterEqual(recorder.summary()["counts"]["swell_aborts"], 1)
+        abort = next(e for e in recorder.events if e.get("name") == "swell_aborts")
+        self.assertEqual(abort["max_growth"], 1.5)
+
+    def test_attempt_loop_reports_aborts(self):
+        # sp.solve can't take Abs(x) directly, so the loop has to eliminate.
+        eqs = [sp.Eq(y, sp.Abs(x) + z), sp.Eq(x**2, a), sp.Eq(z, x * sp.Abs(x))]
+        self.assertTrue(solve_with_elimination_attempts(eqs, {a: 4}, y))
+
+        recorder = EventRecorder()
+        with instrument(recorder):
+            with self.assertRaises(Exception):
+                solve_with_elimination_attempts(eqs, {a: 4}, y, max_ops=5)
+        attempts = next(e for e in recorder.events if e.get("name") == "elimination_attempts")
+        self.assertEqual(attempts["max_ops"], 5)
+        self.assertGreater(attempts["swell_aborts"], 0)
+
+    def test_guard_applies_to_every_search(self):
+        eqs = [sp.Eq(y, sp.Abs(x) + z), sp.Eq(x**2, a), sp.Eq(z, x * sp.Abs(x))]
+        for search in ("beam", "branches"):
+            self.assertTrue(solve_with_elimination_attempts(eqs, {a: 4}, y, search=search))
+
+            recorder = EventRecorder()
+            with instrument(recorder):
+                with self.assertRaises(Exception):
+                    solve_with_elimination_attempts(eqs, {a: 4}, y, search=search, max_ops=5)
+            self.assertGreater(recorder.summary()["counts"]["swell_aborts"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
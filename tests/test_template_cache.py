@@ -0,0 +1,88 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.kinematics_states import make_states_model, kinematics_fundamental
+from combine_equations.solve_system import (
+    solve_system_multiple_solutions,
+    solve_with_elimination_attempts,
+)
+from combine_equations.template_cache import TemplateCache
+
+
+def build_case():
+    m = make_states_model("m", 2)
+    m0, m1 = m.states
+    eqs = kinematics_fundamental(m, axes=["x"])
+    return eqs, m0, m1
+
+
+def evaluate(solutions, values):
+    return [float(sp.N(sol.rhs.subs(values))) for sol in solutions]
+
+
+class TestTemplateCache(unittest.TestCase):
+    def test_reuse_for_new_values(self):
+        eqs, m0, m1 = build_case()
+        cache = TemplateCache()
+
+        values = {m0.pos.x: 0.0, m0.vel.x: 2.0, m1.vel.x: 4.0, m0.t: 0.0, m1.t: 2.0}
+        first = solve_system_multiple_solutions(eqs, values, m1.pos.x, cache=cache)
+        self.assertEqual(evaluate(first, values), [6.0])
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        values = {m0.pos.x: 0.0, m0.vel.x: 1.0, m1.vel.x: 11.0, m0.t: 0.0, m1.t: 1.0}
+        second = solve_system_multiple_solutions(eqs, values, m1.pos.x, cache=cache)
+        self.assertEqual(evaluate(second, values), [6.0])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # A different known set is a different template.
+        values = {m0.pos.x: 0.0, m1.pos.x: 6.0, m0.vel.x: 2.0, m0.t: 0.0, m1.t: 2.0}
+        third = solve_system_multiple_solutions(eqs, values, m1.vel.x, cache=cache)
+        self.assertEqual(evaluate(third, values), [4.0])
+        self.assertEqual(cache.misses, 2)
+
+    def test_disk_backing(self):
+        eqs, m0, m1 = build_case()
+        values = {m0.pos.x: 0.0, m0.vel.x: 2.0, m1.vel.x: 4.0, m0.t: 0.0, m1.t: 2.0}
+
+        with tempfile.TemporaryDirectory() as directory:
+            cold = TemplateCache(directory=directory)
+            solve_with_elimination_attempts(eqs, values, m1.pos.x, cache=cold)
+
+            warm = TemplateCache(directory=directory)
+            solutions, eliminations = solve_with_elimination_attempts(
+                eqs, values, m1.pos.x, cache=warm, return_eliminations=True,
+            )
+            self.assertEqual((warm.hits, warm.misses), (1, 0))
+            self.assertEqual(evaluate(solutions, values), [6.0])
+            self.assertEqual(eliminations, [])
+
+    def test_zero_knowns_match_uncached(self):
+        x, v, t, w = sp.symbols("x v t w")
+        for second in (sp.Eq(w, t + sp.cos(t)), sp.Eq(w, t**2 + t)):
+            eqs = [sp.Eq(x, v * t), second]
+            for solve in (solve_system_multiple_solutions, solve_with_elimination_attempts):
+                cache = TemplateCache()
+                # v = 0 leaves x = t*v without solving for t.
+                for values in ({v: 0, w: 5}, {v: 0, w: 7}):
+                    self.assertEqual(solve(eqs, values, x, cache=cache), [sp.Eq(x, t * v)])
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_bound(self):
+        cache = TemplateCache(maxsize=2)
+        for key in "abc":
+            cache.put(key, [key])
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), ["c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+from sympy.physics.units import degree, h, km, m, s
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.dimensions import (  # noqa: E402
+    ACCELERATION,
+    LENGTH,
+    TIME,
+    VELOCITY,
+    DimensionError,
+    check_equation,
+    infer,
+)
+from combine_equations.kinematics_states import kinematics_fundamental, make_states_model  # noqa: E402
+from combine_equations.units import solve_with_units, strip_units  # noqa: E402
+
+
+x, v, t, a, theta = sp.symbols("x v t a theta")
+DIMS = {x: LENGTH, v: VELOCITY, t: TIME, a: ACCELERATION}
+
+
+class TestDimensions(unittest.TestCase):
+    def test_infer(self):
+        self.assertEqual(infer(v * t + a * t**2 / 2, DIMS), LENGTH)
+        self.assertEqual(infer(sp.sqrt(2 * a * x), DIMS), VELOCITY)
+        self.assertEqual(infer(v * sp.cos(theta), DIMS), VELOCITY)
+        self.assertIsNone(infer(theta * x, DIMS))
+
+    def test_inconsistent(self):
+        with self.assertRaises(DimensionError):
+            infer(x + v, DIMS)
+        with self.assertRaises(DimensionError):
+            infer(sp.sin(t), DIMS)
+        with self.assertRaises(DimensionError):
+            check_equation(sp.Eq(x, v), DIMS)
+        self.assertEqual(check_equation(sp.Eq(x, 0), DIMS), LENGTH)
+
+
+class TestUnits(unittest.TestCase):
+    def test_strip_units(self):
+        magnitudes, dims = strip_units({v: 88 * km / h, theta: 30 * degree, t: 2})
+        self.assertEqual(magnitudes, {v: sp.Rational(220, 9), theta: sp.pi / 6, t: 2})
+        self.assertEqual(dims, {v: VELOCITY, theta: (0,) * 7})
+
+    def test_solve_with_units(self):
+        b = make_states_model("b", 2)
+        b0, b1 = b.states
+        eqs = kinematics_fundamental(b, axes=["x"])
+        values = {
+            b0.pos.x: 0 * m,
+            b1.pos.x: 1.50 * m,
+            b0.vel.x: 0 * m / s,
+            b1.vel.x: 45.0 * m / s,
+            b0.t: 0 * s,
+        }
+        [solution] = solve_with_units(eqs, values, b.edges[0].a.x)
+        magnitude, unit = solution.rhs.as_coeff_Mul()
+        self.assertEqual(unit, m / s**2)
+        self.assertAlmostEqual(float(magnitude), 675.0)
+
+    def test_rejected_before_solving(self):
+        def solver(*args, **kwargs):
+            raise AssertionError("solver called")
+
+        with self.assertRaises(DimensionError):
+            solve_with_units([sp.Eq(x, v * t + t)], {v: 2 * m / s, t: 3 * s}, x, solver=solver)
+
+
+if __name__ == "__main__":
+    unittest.main()
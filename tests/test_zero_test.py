@@ -0,0 +1,62 @@
+import sys
+import unittest
+from pathlib import Path
+
+import sympy as sp
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from combine_equations.zero_test import is_zero
+from combine_equations.eliminate_variable_subst import _is_tautology, cleanup_equations
+from combine_equations.solve_system import solve_system_multiple_solutions
+
+
+class TestIsZero(unittest.TestCase):
+    def test_identities(self):
+        x, y = sp.symbols("x y")
+        self.assertTrue(is_zero(sp.sin(x) ** 2 + sp.cos(x) ** 2 - 1))
+        self.assertTrue(is_zero((x + y) ** 2 - x ** 2 - 2 * x * y - y ** 2))
+        self.assertTrue(is_zero(sp.exp(x) * sp.exp(-x) - 1))
+
+    def test_nonzero(self):
+        x = sp.symbols("x")
+        self.assertFalse(is_zero(x - sp.Rational(1, 10 ** 30)))
+        self.assertFalse(is_zero(sp.atan2(sp.sin(x), sp.cos(x)) - x))
+        self.assertFalse(is_zero(sp.sqrt(x ** 2) - x))
+
+    def test_assumptions_respected(self):
+        p = sp.Symbol("p", positive=True)
+        self.assertTrue(is_zero(sp.sqrt(p ** 2) - p))
+
+    def test_float_rounding(self):
+        # Cancelling terms leave a residue at the size of float rounding.
+        x = sp.symbols("x")
+        third = sp.Float(0.1) + sp.Float(0.2)
+        self.assertTrue(is_zero(third * sp.sin(x) ** 2 + third * sp.cos(x) ** 2 - sp.Float(0.3)))
+
+    def test_tiny_coefficients(self):
+        x, y, f = sp.symbols("x y f")
+        self.assertFalse(is_zero(sp.Float(6.626e-34) * f))
+        self.assertFalse(is_zero(y - (y + sp.Float(1e-13) * x)))
+        self.assertFalse(is_zero(sp.Float(1.380649e-23) * x - sp.Float(1.380649e-23) * x ** 2))
+        self.assertFalse(_is_tautology(sp.Eq(y, y + sp.Float(1e-13) * x)))
+
+        E = sp.Symbol("E")
+        [solution] = solve_system_multiple_solutions([sp.Eq(E, 6.626e-34 * f)], {f: 5e14}, E)
+        self.assertEqual(solution, sp.Eq(E, 6.626e-34 * f))
+
+    def test_unevaluable_falls_back(self):
+        x = sp.symbols("x")
+        f = sp.Function("f")
+        self.assertTrue(is_zero(f(x) * (x + 1) - f(x) * x - f(x)))
+        self.assertFalse(is_zero(f(x) - x))
+
+    def test_cleanup_equations(self):
+        x, y = sp.symbols("x y")
+        eqs = [sp.Eq(sp.sin(x) ** 2, 1 - sp.cos(x) ** 2), sp.Eq(y, x)]
+        self.assertEqual(cleanup_equations(eqs), [sp.Eq(y, x)])
+
+
+if __name__ == "__main__":
+    unittest.main()